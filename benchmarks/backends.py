@@ -0,0 +1,33 @@
+"""Compare the json backends of ``DataClassMapper`` on the same payloads.
+
+Run with ``python -m benchmarks.backends``.
+"""
+from benchmarks.compiled import Record, bench, make_records
+from jsondataclass import DataClassMapper
+from jsondataclass.backends import BACKENDS
+
+
+def main(count: int = 10000):
+    records = make_records(count)
+    payloads = DataClassMapper().to_json_many(records)
+    payloads_bytes = [payload.encode("utf-8") for payload in payloads]
+    size = sum(len(payload) for payload in payloads_bytes)
+    for name, backend_class in BACKENDS.items():
+        try:
+            backend_class()
+        except ImportError:
+            print(f"{name}: not installed\n")
+            continue
+        mapper = DataClassMapper(backend=name)
+        mapper.compiled = True
+        print(f"{name}, {count} records, {size / 1024:.0f} KiB")
+        bench("from_json str", lambda: [mapper.from_json(p, Record) for p in payloads])
+        seconds = bench("from_json bytes", lambda: [mapper.from_json(p, Record) for p in payloads_bytes])
+        print(f"{'':<32} {size / seconds / 2 ** 20:10.2f} MiB/s")
+        bench("to_json", lambda: [mapper.to_json(r) for r in records])
+        seconds = bench("to_json_bytes", lambda: [mapper.to_json_bytes(r) for r in records])
+        print(f"{'':<32} {size / seconds / 2 ** 20:10.2f} MiB/s\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""Compare the batch methods of ``DataClassMapper`` with a per-item loop.
+
+Run with ``python -m benchmarks.batch``.
+"""
+from benchmarks.compiled import Record, bench, hand_written_to_dict, make_records
+from jsondataclass import DataClassMapper
+
+
+def main(count: int = 10000):
+    records = make_records(count)
+    payloads = [hand_written_to_dict(record) for record in records]
+    for compiled in (False, True):
+        mapper = DataClassMapper()
+        mapper.compiled = compiled
+        mode = "compiled" if compiled else "generic"
+
+        print(f"from_dict, {count} records, {mode}")
+        loop = bench("loop", lambda: [mapper.from_dict(d, Record) for d in payloads])
+        batch = bench("from_dict_many", lambda: mapper.from_dict_many(payloads, Record))
+        print(f"speedup: {loop / batch:.2f}x\n")
+
+        print(f"to_dict, {count} records, {mode}")
+        loop = bench("loop", lambda: [mapper.to_dict(r) for r in records])
+        batch = bench("to_dict_many", lambda: mapper.to_dict_many(records))
+        print(f"speedup: {loop / batch:.2f}x\n")
+
+
+if __name__ == "__main__":
+    main()
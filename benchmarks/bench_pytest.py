@@ -0,0 +1,22 @@
+"""The benchmark suite for pytest-benchmark.
+
+Run with ``pytest benchmarks/bench_pytest.py``, pass ``--benchmark-json`` and ``--benchmark-compare`` to save and
+compare results.
+"""
+import pytest
+
+from benchmarks.payloads import SHAPES
+from benchmarks.suite import OPERATIONS, operations
+from jsondataclass import DataClassMapper
+from jsondataclass.config import Config
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("compiled", [False, True], ids=["generic", "compiled"])
+@pytest.mark.parametrize("operation", OPERATIONS)
+@pytest.mark.parametrize("shape", list(SHAPES))
+def test_throughput(benchmark, shape, operation, compiled):
+    type_, instances = SHAPES[shape](100, 3)
+    mapper = DataClassMapper(config=Config(compiled=compiled))
+    benchmark(operations(mapper, type_, instances)[operation])
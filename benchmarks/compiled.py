@@ -0,0 +1,103 @@
+"""Compare the compiled mode of ``DataClassMapper`` with the generic serializers and hand-written code.
+
+Run with ``python -m benchmarks.compiled``.
+"""
+import timeit
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+
+from jsondataclass import DataClassMapper
+
+
+class Status(Enum):
+    NEW = "new"
+    DONE = "done"
+
+
+@dataclass
+class Tag:
+    name: str
+    weight: float
+
+
+@dataclass
+class Record:
+    id: int
+    name: str
+    score: float
+    active: bool
+    status: Status
+    created: datetime
+    parent: Optional[int]
+    labels: List[str]
+    tag: Tag
+
+
+def make_records(count: int) -> List[Record]:
+    return [
+        Record(
+            i, f"record-{i}", i / 3, i % 2 == 0, Status.NEW, datetime(2020, 1, 1, i % 24), None, ["a"], Tag("t", 1.5)
+        )
+        for i in range(count)
+    ]
+
+
+def hand_written_to_dict(record: Record) -> dict:
+    return {
+        "id": record.id,
+        "name": record.name,
+        "score": record.score,
+        "active": record.active,
+        "status": record.status.value,
+        "created": record.created.isoformat(),
+        "parent": record.parent,
+        "labels": list(record.labels),
+        "tag": {"name": record.tag.name, "weight": record.tag.weight},
+    }
+
+
+def hand_written_from_dict(data: dict) -> Record:
+    tag = data["tag"]
+    return Record(
+        data["id"],
+        data["name"],
+        data["score"],
+        data["active"],
+        Status(data["status"]),
+        datetime.fromisoformat(data["created"]),
+        data.get("parent"),
+        list(data["labels"]),
+        Tag(tag["name"], tag["weight"]),
+    )
+
+
+def bench(name: str, func, number: int = 5):
+    seconds = min(timeit.repeat(func, number=1, repeat=number))
+    print(f"{name:<32} {seconds * 1000:10.2f} ms")
+    return seconds
+
+
+def main(count: int = 10000):
+    records = make_records(count)
+    payloads = [hand_written_to_dict(record) for record in records]
+    generic = DataClassMapper()
+    compiled = DataClassMapper()
+    compiled.compiled = True
+
+    print(f"to_dict, {count} records")
+    baseline = bench("hand-written", lambda: [hand_written_to_dict(r) for r in records])
+    bench("generic", lambda: [generic.to_dict(r) for r in records])
+    result = bench("compiled", lambda: [compiled.to_dict(r) for r in records])
+    print(f"compiled / hand-written: {result / baseline:.2f}x\n")
+
+    print(f"from_dict, {count} records")
+    baseline = bench("hand-written", lambda: [hand_written_from_dict(d) for d in payloads])
+    bench("generic", lambda: [generic.from_dict(d, Record) for d in payloads])
+    result = bench("compiled", lambda: [compiled.from_dict(d, Record) for d in payloads])
+    print(f"compiled / hand-written: {result / baseline:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
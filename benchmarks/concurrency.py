@@ -0,0 +1,125 @@
+"""Throughput of one mapper shared by several threads, and a stress test of concurrent cache population.
+
+Run with ``python -m benchmarks.concurrency``. Every thread decodes and encodes the same payloads with the shared
+mapper. With the GIL the throughput stays flat as threads are added, on free-threaded builds (``python3.13t`` and
+later, ``sys._is_gil_enabled()`` is false) it scales with the number of cores since cache lookups take no lock.
+
+The stress test starts all threads at once on a fresh mapper, so they race to resolve serializers, build plans and
+compile code, while another thread keeps invalidating the caches by changing the config and the registry. Every
+result is compared with the expected one.
+"""
+import argparse
+import sys
+import threading
+import time
+from typing import Any, Callable, List, Optional, Sequence
+
+from benchmarks.payloads import SHAPES
+from jsondataclass import DataClassMapper
+from jsondataclass.config import Config
+from jsondataclass.serializers import StringSerializer
+
+
+def gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def run_threads(threads: int, target: Callable[[int], Any]) -> float:
+    """Seconds between the simultaneous start of ``target(index)`` in ``threads`` threads and the end of the last."""
+    barrier = threading.Barrier(threads + 1)
+    errors: List[BaseException] = []
+
+    def run(index: int):
+        barrier.wait()
+        try:
+            target(index)
+        except BaseException as e:  # pragma: no cover
+            errors.append(e)
+
+    workers = [threading.Thread(target=run, args=(i,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    if errors:
+        raise errors[0]
+    return elapsed
+
+
+def throughput(shape: str, threads: int, count: int, loops: int, compiled: bool) -> float:
+    """Instances decoded and encoded per second by all threads together."""
+    mapper = DataClassMapper(config=Config(compiled=compiled))
+    type_, instances = SHAPES[shape](count, 3)
+    dicts = [mapper.to_dict(instance) for instance in instances]
+    mapper.prepare(type_, freeze=True)
+
+    def work(index: int):
+        for _ in range(loops):
+            for data in dicts:
+                mapper.to_dict(mapper.from_dict(data, type_))
+
+    return threads * loops * count / run_threads(threads, work)
+
+
+def stress(shapes: Sequence[str], threads: int, count: int, rounds: int, compiled: bool) -> int:
+    """Number of wrong results of threads racing on fresh mappers while the caches are invalidated."""
+    payloads = []
+    for shape in shapes:
+        type_, instances = SHAPES[shape](count, 2)
+        payloads.append((type_, instances, [DataClassMapper().to_dict(instance) for instance in instances]))
+    wrong = 0
+    for _ in range(rounds):
+        mapper = DataClassMapper(config=Config(compiled=compiled))
+        done = threading.Event()
+
+        def invalidate():
+            while not done.is_set():
+                mapper.datetime_format = None
+                mapper.register_serializer(bytes, StringSerializer)
+                mapper.unregister_serializer(bytes)
+                time.sleep(0)
+
+        def work(index: int):
+            nonlocal wrong
+            for type_, instances, dicts in payloads[index % len(payloads):] + payloads[: index % len(payloads)]:
+                for instance, data in zip(instances, dicts):
+                    if mapper.from_dict(data, type_) != instance or mapper.to_dict(instance) != data:
+                        wrong += 1
+
+        invalidator = threading.Thread(target=invalidate)
+        invalidator.start()
+        try:
+            run_threads(threads, work)
+        finally:
+            done.set()
+            invalidator.join()
+    return wrong
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--shape", choices=list(SHAPES), default="nested")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--count", type=int, default=200, help="instances per thread and loop")
+    parser.add_argument("--loops", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=20, help="fresh mappers in the stress test")
+    parser.add_argument("--compiled", action="store_true", help="use the compiled mode")
+    args = parser.parse_args(argv)
+
+    print(f"python={sys.version.split()[0]} gil={'enabled' if gil_enabled() else 'disabled'} compiled={args.compiled}")
+    base = None
+    for threads in args.threads:
+        ops = throughput(args.shape, threads, args.count, args.loops, args.compiled)
+        base = base or ops
+        print(f"{args.shape} threads={threads:<3} {ops:12.0f} ops/s  x{ops / base:.2f}")
+    wrong = stress(list(SHAPES), max(args.threads), 20, args.rounds, args.compiled)
+    print(f"stress: {args.rounds} rounds, {max(args.threads)} threads, {wrong} wrong results")
+    return 1 if wrong else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+"""Compare ``strptime``/``strftime`` with the compiled format engine on the formats of ``examples/datetimes.py``.
+
+Run with ``python -m benchmarks.datetimes``.
+"""
+from datetime import date, datetime, time, timedelta, timezone
+
+from benchmarks.compiled import bench
+from jsondataclass.dateformat import get_formatter, get_parser
+
+FORMATS = [
+    (datetime, "%Y-%m-%dT%H:%M:%S.%f%z"),
+    (datetime, "%m/%d/%y %H:%M:%S"),
+    (date, "%m/%d/%y"),
+    (time, "%H:%M"),
+    (datetime, "%y/%m/%d %H:%M:%S"),
+    (date, "%y/%m/%d"),
+    (time, "%I:%M %p"),
+]
+
+
+def main(count: int = 20000):
+    tz = timezone(timedelta(hours=2))
+    values = [datetime(2020, 1, 1, tzinfo=tz) + timedelta(minutes=7 * i, microseconds=i) for i in range(count)]
+    for type_, format in FORMATS:
+        typed_values = [value if type_ is datetime else getattr(value, type_.__name__)() for value in values]
+        strings = [value.strftime(format) for value in typed_values]
+        parse, format_value = get_parser(format), get_formatter(format, type_)
+        print(f"{count} x {type_.__name__} {format!r}")
+        bench("  strptime", lambda: [datetime.strptime(string, format) for string in strings])
+        bench("  parser", lambda: [parse(string) for string in strings])
+        bench("  strftime", lambda: [value.strftime(format) for value in typed_values])
+        bench("  formatter", lambda: [format_value(value) for value in typed_values])
+
+
+if __name__ == "__main__":
+    main()
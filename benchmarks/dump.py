@@ -0,0 +1,45 @@
+"""Compare ``DataClassMapper.dump`` with ``to_json`` on a large document, including peak memory.
+
+Run with ``python -m benchmarks.dump``.
+"""
+import io
+import tracemalloc
+from dataclasses import dataclass
+from typing import List
+
+from benchmarks.compiled import Record, bench, make_records
+from jsondataclass import DataClassMapper
+
+
+@dataclass
+class Document:
+    records: List[Record]
+
+
+def peak_memory(func) -> int:
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main(count: int = 50000):
+    document = Document(make_records(count))
+    mapper = DataClassMapper()
+
+    def to_json():
+        io.StringIO().write(mapper.to_json(document))
+
+    def dump():
+        mapper.dump(document, io.StringIO())
+
+    print(f"document with {count} records")
+    bench("to_json + write", to_json, number=3)
+    bench("dump", dump, number=3)
+    print(f"{'to_json + write peak memory':<32} {peak_memory(to_json) / 2 ** 20:10.2f} MiB")
+    print(f"{'dump peak memory':<32} {peak_memory(dump) / 2 ** 20:10.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
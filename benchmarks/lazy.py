@@ -0,0 +1,38 @@
+"""Compare eager and lazy decoding of a large document when only a couple of fields are read.
+
+Run with ``python -m benchmarks.lazy``.
+"""
+from dataclasses import dataclass
+from typing import List
+
+from benchmarks.compiled import Record, bench, make_records
+from jsondataclass import DataClassMapper
+
+
+@dataclass
+class Document:
+    id: int
+    title: str
+    records: List[Record]
+    archived: List[Record]
+
+
+def main(count: int = 20000):
+    mapper = DataClassMapper()
+    data = mapper.to_dict(Document(1, "document", make_records(count), make_records(count)))
+
+    def eager():
+        document = mapper.from_dict(data, Document)
+        return document.title, document.records[0].name
+
+    def lazy():
+        document = mapper.from_dict_lazy(data, Document)
+        return document.title, document.records[0].name
+
+    print(f"document with {2 * count} records, two fields accessed")
+    bench("from_dict", eager)
+    bench("from_dict_lazy", lazy)
+
+
+if __name__ == "__main__":
+    main()
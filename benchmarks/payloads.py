@@ -0,0 +1,189 @@
+"""Synthetic payloads of different shapes for the benchmark suite.
+
+Every shape is a function ``(count, size) -> (type, instances)``: ``count`` is the number of instances and ``size``
+scales the shape (nesting depth, number of fields or collection length).
+"""
+from dataclasses import dataclass, field, make_dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+
+from benchmarks.compiled import Record, make_records
+from jsondataclass.utils import set_forward_refs
+
+try:
+    from typing import Literal
+except ImportError:  # pragma: no cover
+    Literal = None
+
+Shape = Callable[[int, int], Tuple[Type, List[Any]]]
+
+
+def flat(count: int, size: int) -> Tuple[Type, List[Any]]:
+    return Record, make_records(count)
+
+
+@lru_cache(maxsize=None)
+def _nested_type(depth: int) -> Type:
+    if depth == 0:
+        return make_dataclass("Leaf", [("id", int), ("name", str)])
+    return make_dataclass(f"Level{depth}", [("id", int), ("child", _nested_type(depth - 1))])
+
+
+def _nested_instance(type_: Type, depth: int, i: int) -> Any:
+    if depth == 0:
+        return type_(i, f"leaf-{i}")
+    return type_(i, _nested_instance(type_.__dataclass_fields__["child"].type, depth - 1, i))
+
+
+def nested(count: int, size: int) -> Tuple[Type, List[Any]]:
+    type_ = _nested_type(size)
+    return type_, [_nested_instance(type_, size, i) for i in range(count)]
+
+
+@lru_cache(maxsize=None)
+def _wide_type(width: int) -> Type:
+    types = (int, str, float, bool)
+    return make_dataclass(f"Wide{width}", [(f"field_{i}", types[i % len(types)]) for i in range(width)])
+
+
+def wide(count: int, size: int) -> Tuple[Type, List[Any]]:
+    width = size * 10
+    type_ = _wide_type(width)
+    values = [(i, f"value-{i}", i / 3, i % 2 == 0)[i % 4] for i in range(width)]
+    return type_, [type_(*values) for _ in range(count)]
+
+
+@dataclass
+class Point:
+    x: float
+    y: float
+
+
+@dataclass
+class Collections:
+    ids: List[int]
+    names: Dict[str, str]
+    points: List[Point]
+    pairs: List[Tuple[int, str]]
+    matrix: List[List[float]]
+    index: Dict[int, Point]
+
+
+def collections(count: int, size: int) -> Tuple[Type, List[Any]]:
+    length = size * 5
+    instances = [
+        Collections(
+            list(range(length)),
+            {f"key-{j}": f"value-{j}" for j in range(length)},
+            [Point(j, j / 2) for j in range(length)],
+            [(j, str(j)) for j in range(length)],
+            [[float(j)] * 4 for j in range(length)],
+            {j: Point(j, i) for j in range(length)},
+        )
+        for i in range(count)
+    ]
+    return Collections, instances
+
+
+class Color(Enum):
+    RED = "red"
+    GREEN = "green"
+    BLUE = "blue"
+
+
+@dataclass
+class Circle:
+    radius: float
+    color: Color
+
+
+@dataclass
+class Square:
+    side: float
+    color: Color
+
+
+if Literal is not None:
+
+    @dataclass
+    class Choices:
+        shape: Union[Circle, Square]
+        shapes: List[Union[Circle, Square, int]]
+        mode: Literal["fast", "slow"]
+        colors: List[Color]
+        value: Union[int, str, None] = None
+
+
+def unions(count: int, size: int) -> Tuple[Type, List[Any]]:
+    colors = list(Color)
+    shapes = [Square(1.0, Color.RED), Circle(2.0, Color.BLUE), 3] * size
+    instances = [
+        Choices(Circle(i, colors[i % 3]), shapes, "fast" if i % 2 else "slow", colors * size, i if i % 2 else str(i))
+        for i in range(count)
+    ]
+    return Choices, instances
+
+
+@dataclass
+class Event:
+    created: datetime
+    updated: datetime
+    day: date
+    at: time
+    zoned: datetime
+    duration: Decimal
+    history: List[datetime]
+
+
+def datetimes(count: int, size: int) -> Tuple[Type, List[Any]]:
+    start = datetime(2020, 1, 1, 12, 30, 15, 123456)
+    zone = timezone(timedelta(hours=2))
+    instances = [
+        Event(
+            start + timedelta(minutes=i),
+            start + timedelta(hours=i),
+            (start + timedelta(days=i)).date(),
+            (start + timedelta(seconds=i)).time(),
+            (start + timedelta(minutes=i)).replace(tzinfo=zone),
+            Decimal(i) / 7,
+            [start + timedelta(days=j) for j in range(size)],
+        )
+        for i in range(count)
+    ]
+    return Event, instances
+
+
+@dataclass
+class TreeNode:
+    id: int
+    children: List["TreeNode"] = field(default_factory=list)
+    parent_id: Optional[int] = None
+
+
+set_forward_refs(TreeNode, {"TreeNode": TreeNode})
+
+
+def _tree(i: int, depth: int, width: int) -> TreeNode:
+    if depth == 0:
+        return TreeNode(i)
+    return TreeNode(i, [_tree(i * width + j, depth - 1, width) for j in range(width)], i)
+
+
+def forward_refs(count: int, size: int) -> Tuple[Type, List[Any]]:
+    return TreeNode, [_tree(i, size, 2) for i in range(count)]
+
+
+SHAPES: Dict[str, Shape] = {
+    "flat": flat,
+    "nested": nested,
+    "wide": wide,
+    "collections": collections,
+    "unions": unions,
+    "datetimes": datetimes,
+    "forward_refs": forward_refs,
+}
+if Literal is None:  # pragma: no cover
+    del SHAPES["unions"]
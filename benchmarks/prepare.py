@@ -0,0 +1,35 @@
+"""Measure the latency of the first from_dict call of a fresh mapper with and without ``prepare``.
+
+Run with ``python -m benchmarks.prepare``.
+"""
+import timeit
+
+from benchmarks.compiled import Record, hand_written_to_dict, make_records
+from jsondataclass import DataClassMapper
+from jsondataclass.config import Config
+
+
+def first_call(compiled: bool, prepare: bool, number: int = 20) -> float:
+    data = hand_written_to_dict(make_records(1)[0])
+    timer = timeit.default_timer
+    results = []
+    for _ in range(number):
+        mapper = DataClassMapper(config=Config(compiled=compiled))
+        if prepare:
+            mapper.prepare(Record, freeze=True)
+        start = timer()
+        mapper.from_dict(data, Record)
+        results.append(timer() - start)
+    return min(results)
+
+
+def main():
+    for compiled in (False, True):
+        for prepare in (False, True):
+            seconds = first_call(compiled, prepare)
+            name = f"{'compiled' if compiled else 'generic'}{', prepared' if prepare else ''}"
+            print(f"first from_dict, {name:<22} {seconds * 1e6:10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+"""Compare full decoding of a large document with decoding a projection of a few field paths.
+
+Run with ``python -m benchmarks.projection``.
+"""
+from benchmarks.compiled import bench, make_records
+from benchmarks.lazy import Document
+from jsondataclass import DataClassMapper
+
+
+def main(count: int = 20000):
+    mapper = DataClassMapper()
+    data = mapper.to_dict(Document(1, "document", make_records(count), make_records(count)))
+    projection = frozenset(["id", "records[*].id", "records[*].tag.name"])
+
+    print(f"document with {2 * count} records, projection {sorted(projection)}")
+    bench("from_dict", lambda: mapper.from_dict(data, Document))
+    bench("from_dict projection", lambda: mapper.from_dict(data, Document, projection=projection))
+    bench("from_dict projection set", lambda: mapper.from_dict(data, Document, projection=set(projection)))
+
+
+if __name__ == "__main__":
+    main()
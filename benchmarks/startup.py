@@ -0,0 +1,87 @@
+"""Measure import and first decode of many dataclasses in a fresh process with and without the code cache.
+
+Every dataclass has its own field names, so no two of them share generated code.
+
+Run with ``python -m benchmarks.startup``.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Tuple
+
+import jsondataclass
+
+MODEL = '''
+@dataclass
+class Model{i}:
+    id_{i}: int = 0
+    name_{i}: str = ""
+    created_{i}: Optional[datetime] = None
+    status_{i}: Status = Status.NEW
+    score_{i}: Optional[float] = None
+    tags_{i}: List[str] = field(default_factory=list)
+    parent_{i}: Optional[Model{parent}] = None
+    children_{i}: List[Model{parent}] = field(default_factory=list)
+'''
+
+CHILD = """
+import sys, time
+start = time.perf_counter()
+from jsondataclass import DataClassMapper
+from jsondataclass.config import Config
+import models
+imported = time.perf_counter()
+mapper = DataClassMapper(config=Config(compiled=True, code_cache_dir=sys.argv[1] or None))
+for model in models.MODELS:
+    mapper.from_dict({}, model)
+print(imported - start, time.perf_counter() - imported)
+"""
+
+
+def write_models(directory: str, count: int):
+    lines = [
+        "from dataclasses import dataclass, field",
+        "from datetime import datetime",
+        "from enum import Enum",
+        "from typing import List, Optional",
+        "",
+        "class Status(Enum):",
+        "    NEW = 'new'",
+        "",
+        "@dataclass",
+        "class Model0:",
+        "    id: int = 0",
+    ]
+    lines.extend(MODEL.format(i=i, parent=i - 1) for i in range(1, count))
+    lines.append(f"MODELS = [{', '.join(f'Model{i}' for i in range(count))}]")
+    with open(os.path.join(directory, "models.py"), "w") as fp:
+        fp.write("\n".join(lines))
+
+
+def run(directory: str, cache_dir: str) -> Tuple[float, float]:
+    env = dict(os.environ)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(jsondataclass.__file__)))
+    env["PYTHONPATH"] = os.pathsep.join([directory, root])
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    output = subprocess.check_output([sys.executable, "-c", CHILD, cache_dir], env=env)
+    import_seconds, decode_seconds = map(float, output.split())
+    return import_seconds, decode_seconds
+
+
+def main(count: int = 300, repeat: int = 5):
+    with tempfile.TemporaryDirectory() as directory:
+        write_models(directory, count)
+        cache_dir = os.path.join(directory, "cache")
+        results = [
+            ("no cache", min(run(directory, "") for _ in range(repeat))),
+            ("cold cache", run(directory, cache_dir)),
+            ("warm cache", min(run(directory, cache_dir) for _ in range(repeat))),
+        ]
+    print(f"import and first from_dict of {count} dataclasses, compiled mode")
+    for name, (import_seconds, decode_seconds) in results:
+        print(f"{name:<16} import {import_seconds * 1000:8.2f} ms, first from_dict {decode_seconds * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
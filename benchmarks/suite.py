@@ -0,0 +1,149 @@
+"""Throughput of ``from_json``, ``to_json``, ``from_dict`` and ``to_dict`` on synthetic payloads of every shape.
+
+Run with ``python -m benchmarks.suite``. Results are printed as ops/s (instances per second) and bytes/s (of the
+JSON text), ``--output`` saves them as JSON and ``--baseline`` compares the run against a saved one and exits with
+status 1 when an operation got slower than ``--threshold``.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from benchmarks.payloads import SHAPES
+from jsondataclass import DataClassMapper, __version__
+from jsondataclass.config import Config
+
+OPERATIONS = ("from_json", "to_json", "from_dict", "to_dict")
+
+
+def measure(func: Callable[[], Any], repeat: int, min_time: float) -> float:
+    """Best time of ``func`` out of ``repeat`` runs, each run repeats it until it takes at least ``min_time``."""
+    timer = time.perf_counter
+    best = float("inf")
+    func()  # Warm up caches and compiled code.
+    for _ in range(repeat):
+        loops = 0
+        start = timer()
+        while True:
+            func()
+            loops += 1
+            elapsed = timer() - start
+            if elapsed >= min_time:
+                break
+        best = min(best, elapsed / loops)
+    return best
+
+
+def operations(mapper: DataClassMapper, type_: Any, instances: List[Any]) -> Dict[str, Callable[[], Any]]:
+    dicts = [mapper.to_dict(instance) for instance in instances]
+    jsons = [mapper.to_json(instance) for instance in instances]
+    return {
+        "from_json": lambda: [mapper.from_json(json_, type_) for json_ in jsons],
+        "to_json": lambda: [mapper.to_json(instance) for instance in instances],
+        "from_dict": lambda: [mapper.from_dict(data, type_) for data in dicts],
+        "to_dict": lambda: [mapper.to_dict(instance) for instance in instances],
+    }
+
+
+def run(
+    shapes: Sequence[str] = tuple(SHAPES),
+    count: int = 1000,
+    size: int = 3,
+    compiled: bool = False,
+    repeat: int = 5,
+    min_time: float = 0.1,
+) -> Dict[str, Any]:
+    mapper = DataClassMapper(config=Config(compiled=compiled))
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for shape in shapes:
+        type_, instances = SHAPES[shape](count, size)
+        size_bytes = sum(len(json_.encode("utf-8")) for json_ in map(mapper.to_json, instances))
+        results[shape] = {}
+        for operation, func in operations(mapper, type_, instances).items():
+            seconds = measure(func, repeat, min_time)
+            results[shape][operation] = {
+                "seconds": seconds,
+                "ops_per_second": count / seconds,
+                "bytes_per_second": size_bytes / seconds,
+            }
+    return {
+        "meta": {
+            "jsondataclass": __version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "count": count,
+            "size": size,
+            "compiled": compiled,
+        },
+        "results": results,
+    }
+
+
+def report(run_result: Dict[str, Any]):
+    meta = run_result["meta"]
+    print(f"count={meta['count']} size={meta['size']} compiled={meta['compiled']} python={meta['python']}")
+    print(f"{'shape':<14} {'operation':<10} {'ops/s':>12} {'MB/s':>10}")
+    for shape, operations_ in run_result["results"].items():
+        for operation, result in operations_.items():
+            mb_per_second = result["bytes_per_second"] / 1e6
+            print(f"{shape:<14} {operation:<10} {result['ops_per_second']:12.0f} {mb_per_second:10.2f}")
+
+
+def compare(run_result: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Print the change of ops/s of every operation against ``baseline`` and return the regressed ones."""
+    regressions = []
+    for key in ("count", "size", "compiled"):
+        if run_result["meta"][key] != baseline["meta"].get(key):
+            print(f"warning: {key} differs from the baseline ({baseline['meta'].get(key)})")
+    print(f"{'shape':<14} {'operation':<10} {'baseline':>12} {'current':>12} {'change':>8}")
+    for shape, operations_ in run_result["results"].items():
+        for operation, result in operations_.items():
+            base = baseline["results"].get(shape, {}).get(operation)
+            if base is None:
+                continue
+            change = result["ops_per_second"] / base["ops_per_second"] - 1
+            flag = ""
+            if change < -threshold:
+                flag = " REGRESSION"
+                regressions.append(f"{shape}.{operation}")
+            print(
+                f"{shape:<14} {operation:<10} {base['ops_per_second']:12.0f} {result['ops_per_second']:12.0f}"
+                f" {change:+8.1%}{flag}"
+            )
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--shapes", nargs="+", choices=list(SHAPES), default=list(SHAPES))
+    parser.add_argument("--count", type=int, default=1000, help="instances per payload")
+    parser.add_argument("--size", type=int, default=3, help="depth, width or collection length factor")
+    parser.add_argument("--compiled", action="store_true", help="use the compiled mode")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.1, help="minimal seconds per measurement")
+    parser.add_argument("--output", help="save results to this JSON file")
+    parser.add_argument("--baseline", help="compare against results saved with --output")
+    parser.add_argument("--threshold", type=float, default=0.1, help="slowdown flagged as a regression")
+    args = parser.parse_args(argv)
+
+    result = run(args.shapes, args.count, args.size, args.compiled, args.repeat, args.min_time)
+    report(result)
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(result, fp, indent=2)
+    if args.baseline:
+        with open(args.baseline) as fp:
+            baseline = json.load(fp)
+        print()
+        regressions = compare(result, baseline, args.threshold)
+        if regressions:
+            print(f"regressions: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
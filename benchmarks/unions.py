@@ -0,0 +1,69 @@
+"""Compare tagged and untagged union decoding.
+
+Run with ``python -m benchmarks.unions``.
+"""
+from dataclasses import dataclass
+from typing import List, Union
+
+from benchmarks.compiled import bench
+from jsondataclass import DataClassMapper, Discriminator
+from jsondataclass.config import Config
+
+
+@dataclass
+class Created:
+    id: int
+    name: str
+    kind: str = "created"
+
+
+@dataclass
+class Renamed:
+    id: int
+    old_name: str
+    new_name: str
+    kind: str = "renamed"
+
+
+@dataclass
+class Moved:
+    id: int
+    source: str
+    target: str
+    kind: str = "moved"
+
+
+@dataclass
+class Deleted:
+    id: int
+    reason: str
+    permanent: bool
+    kind: str = "deleted"
+
+
+Event = Union[Created, Renamed, Moved, Deleted]
+
+
+@dataclass
+class Log:
+    events: List[Event]
+
+
+def make_events(count: int) -> List[Event]:
+    events = [Created(0, "a"), Renamed(1, "a", "b"), Moved(2, "x", "y"), Deleted(3, "gone", True)]
+    return [events[i % len(events)] for i in range(count)]
+
+
+def main(count: int = 20000):
+    data = DataClassMapper().to_dict(Log(make_events(count)))
+    untagged = DataClassMapper()
+    tagged = DataClassMapper(config=Config(discriminators={Event: Discriminator("kind")}))
+    assert untagged.from_dict(data, Log) == tagged.from_dict(data, Log)
+
+    print(f"{count} events of a 4 member union")
+    bench("untagged", lambda: untagged.from_dict(data, Log))
+    bench("discriminator", lambda: tagged.from_dict(data, Log))
+
+
+if __name__ == "__main__":
+    main()
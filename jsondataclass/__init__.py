@@ -1,9 +1,43 @@
 # -*- coding: utf-8 -*-
 
-from .field import jsonfield
-from .mapper import DataClassMapper, from_dict, from_json, to_dict, to_json
+from .field import Discriminator, jsonfield
+from .lazy import materialize
+from .mapper import (
+    DataClassMapper,
+    dump,
+    from_dict,
+    from_json,
+    get_default_mapper,
+    iter_json_array,
+    iter_jsonl,
+    jsondataclass,
+    set_default_mapper,
+    to_dict,
+    to_json,
+    to_json_bytes,
+    write_jsonl,
+)
+from .projection import NOT_LOADED
 
-__all__ = ["DataClassMapper", "from_json", "from_dict", "to_json", "to_dict", "jsonfield"]
+__all__ = [
+    "DataClassMapper",
+    "from_json",
+    "from_dict",
+    "to_json",
+    "to_json_bytes",
+    "dump",
+    "materialize",
+    "to_dict",
+    "jsonfield",
+    "jsondataclass",
+    "Discriminator",
+    "NOT_LOADED",
+    "get_default_mapper",
+    "set_default_mapper",
+    "iter_jsonl",
+    "iter_json_array",
+    "write_jsonl",
+]
 
 __author__ = """Aleksey Shulga"""
 __email__ = "oleksii.shulga@gmail.com"
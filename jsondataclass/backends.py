@@ -0,0 +1,93 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Type, Union
+
+__all__ = ["JsonBackend", "StdlibBackend", "OrjsonBackend", "UjsonBackend", "BACKENDS", "get_backend"]
+
+JsonInput = Union[str, bytes, bytearray, memoryview]
+
+
+class JsonBackend(ABC):
+    name = ""
+
+    @abstractmethod
+    def loads(self, data: JsonInput, **kwargs: Any) -> Any:
+        ...
+
+    @abstractmethod
+    def dumps(self, data: Any, **kwargs: Any) -> str:
+        ...
+
+    def dumps_bytes(self, data: Any, **kwargs: Any) -> bytes:
+        return self.dumps(data, **kwargs).encode("utf-8")
+
+
+class StdlibBackend(JsonBackend):
+    name = "json"
+
+    def loads(self, data: JsonInput, **kwargs: Any) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data, **kwargs)
+
+    def dumps(self, data: Any, **kwargs: Any) -> str:
+        return json.dumps(data, **kwargs)
+
+
+class OrjsonBackend(JsonBackend):
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: JsonInput, **kwargs: Any) -> Any:
+        return self._orjson.loads(data, **kwargs)
+
+    def dumps(self, data: Any, **kwargs: Any) -> str:
+        return self._orjson.dumps(data, **kwargs).decode("utf-8")
+
+    def dumps_bytes(self, data: Any, **kwargs: Any) -> bytes:
+        return self._orjson.dumps(data, **kwargs)
+
+
+class UjsonBackend(JsonBackend):
+    name = "ujson"
+
+    def __init__(self):
+        import ujson
+
+        self._ujson = ujson
+
+    def loads(self, data: JsonInput, **kwargs: Any) -> Any:
+        if isinstance(data, (bytearray, memoryview)):
+            data = bytes(data)
+        return self._ujson.loads(data, **kwargs)
+
+    def dumps(self, data: Any, **kwargs: Any) -> str:
+        return self._ujson.dumps(data, **kwargs)
+
+
+BACKENDS: Dict[str, Type[JsonBackend]] = {
+    OrjsonBackend.name: OrjsonBackend,
+    UjsonBackend.name: UjsonBackend,
+    StdlibBackend.name: StdlibBackend,
+}
+
+
+def get_backend(name: Optional[str] = None) -> JsonBackend:
+    """Return the backend with the given name, ``"auto"`` picks the fastest importable one."""
+    if name is None:
+        return StdlibBackend()
+    if name == "auto":
+        for backend_class in BACKENDS.values():
+            try:
+                return backend_class()
+            except ImportError:
+                pass
+    try:
+        backend_class = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown json backend: {name!r}, available: {', '.join(BACKENDS)}")
+    return backend_class()
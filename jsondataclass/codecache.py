@@ -0,0 +1,89 @@
+import hashlib
+import marshal
+import os
+import tempfile
+from importlib.util import MAGIC_NUMBER
+from types import CodeType
+from typing import Dict
+
+__all__ = ["CodeCache", "get_code_cache"]
+
+
+class CodeCache:
+    """Code objects of generated source stored as marshal files in ``directory``.
+
+    Entries are keyed by a hash of the generated source, the library version and the bytecode version. The source
+    is derived from the dataclass fields, their serializers and the config, so a change of any of them makes the
+    compiler look up another entry instead of reusing a stale one.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._codes: Dict[str, CodeType] = {}
+
+    def _key(self, source: str, filename: str) -> str:
+        from . import __version__
+
+        digest = hashlib.sha256(MAGIC_NUMBER)
+        digest.update(f"{__version__}\0{filename}\0{source}".encode())
+        return digest.hexdigest()
+
+    def compile(self, source: str, filename: str) -> CodeType:
+        """Return the code object of ``compile(source, filename, "exec")`` from the cache or compile and store it."""
+        key = self._key(source, filename)
+        cached = self._codes.get(key)
+        if cached is not None:
+            return cached
+        path = os.path.join(self.directory, f"{key}.marshal")
+        try:
+            with open(path, "rb") as fp:
+                loaded = marshal.loads(fp.read())
+        except (OSError, ValueError, EOFError, TypeError):
+            loaded = None
+        if isinstance(loaded, CodeType):
+            code = loaded
+        else:
+            code = compile(source, filename, "exec")
+            self._write(path, marshal.dumps(code))
+        self._codes[key] = code
+        return code
+
+    def _write(self, path: str, data: bytes):
+        # Written to a temporary file first so that concurrent processes never read a partial entry.
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as fp:
+                    fp.write(data)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError:
+            pass
+
+    def clear(self):
+        self._codes.clear()
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            if name.endswith(".marshal"):
+                try:
+                    os.unlink(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+
+_caches: Dict[str, CodeCache] = {}
+
+
+def get_code_cache(directory: str) -> CodeCache:
+    """Return the cache of ``directory``, shared by all mappers of the process."""
+    directory = os.path.abspath(directory)
+    cache = _caches.get(directory)
+    if cache is None:
+        cache = _caches[directory] = CodeCache(directory)
+    return cache
@@ -0,0 +1,129 @@
+from array import array
+from datetime import date, datetime, timedelta
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type, TypeVar, cast
+
+from .plan import FieldPlan
+from .serializers import DateSerializer, DateTimeSerializer, DefaultSerializer, SerializerFactory
+from .typing import DataClass
+
+try:
+    import numpy  # type: ignore[import]
+except ImportError:  # pragma: no cover
+    numpy = None
+
+__all__ = ["to_columns", "from_columns"]
+
+T = TypeVar("T")
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_MICROSECOND = timedelta(microseconds=1)
+
+_NUMPY_DTYPES = {int: "int64", float: "float64", bool: "bool", datetime: "datetime64[us]", date: "datetime64[D]"}
+_ARRAY_TYPECODES = {int: "q", float: "d", datetime: "q", date: "q"}
+
+
+def _get_column_type(field: FieldPlan) -> Optional[type]:
+    # The value type of fields stored as typed arrays, None for fields stored as lists of serialized values.
+    serializer_class = type(field.serializer)
+    if serializer_class is DefaultSerializer and field.type in (int, float, bool):
+        return field.type
+    if serializer_class is DateTimeSerializer and field.type is datetime:
+        return datetime
+    if serializer_class is DateSerializer and field.type is date:
+        return date
+    return None
+
+
+def _to_array(values: List[Any], column_type: type, use_numpy: bool) -> Optional[Any]:
+    if any(type(value) is not column_type for value in values):
+        return None
+    if column_type is datetime and any(value.tzinfo is not None for value in values):
+        return None
+    try:
+        if use_numpy:
+            return numpy.array(values, dtype=_NUMPY_DTYPES[column_type])
+        if column_type is bool:
+            return None
+        if column_type is datetime:
+            values = [(value - _EPOCH) // _MICROSECOND for value in values]
+        elif column_type is date:
+            values = [value.toordinal() - _EPOCH_ORDINAL for value in values]
+        return array(_ARRAY_TYPECODES[column_type], values)
+    except OverflowError:
+        return None
+
+
+def _from_array(column: Any, column_type: Optional[type]) -> List[Any]:
+    if isinstance(column, array):
+        values = column.tolist()
+        if column_type is datetime:
+            return [_EPOCH + timedelta(microseconds=value) for value in values]
+        if column_type is date:
+            return [date.fromordinal(value + _EPOCH_ORDINAL) for value in values]
+        return values
+    if numpy is not None and isinstance(column, numpy.ndarray):
+        if column_type is datetime:
+            column = column.astype("datetime64[us]")
+        elif column_type is date:
+            column = column.astype("datetime64[D]")
+        return column.tolist()
+    return list(column)
+
+
+def to_columns(
+    serializer_factory: SerializerFactory, instances: Iterable[Any], type_: Type[T], use_numpy: Optional[bool] = None
+) -> Dict[str, Any]:
+    """Convert dataclass instances to a dict of serialized field name -> column.
+
+    Numbers, bools, naive datetimes and dates become NumPy arrays (``use_numpy``, by default when NumPy is
+    installed) or ``array.array`` of numbers and epoch microseconds/days, other fields lists of serialized values.
+    """
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    elif use_numpy and numpy is None:
+        raise ImportError("numpy is not installed")
+    instances = list(instances)
+    columns = {}
+    for field in serializer_factory.get_dataclass_plan(cast(Type[DataClass], type_)).fields:
+        values = list(map(attrgetter(field.name), instances))
+        if not field.optional and any(value is None for value in values):
+            values = [field.default_value if value is None else value for value in values]
+        column_type = _get_column_type(field)
+        column = _to_array(values, column_type, use_numpy) if column_type is not None else None
+        if column is None:
+            column = field.serializer.serialize_many(values)
+        columns[field.serialized_name] = column
+    return columns
+
+
+def from_columns(serializer_factory: SerializerFactory, columns: Dict[str, Any], type_: Type[T]) -> List[T]:
+    """Build dataclass instances from columns in the format of ``to_columns``."""
+    lengths = {len(column) for column in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+    length = lengths.pop() if lengths else 0
+    names = []
+    values_list = []
+    for field in serializer_factory.get_dataclass_plan(cast(Type[DataClass], type_)).fields:
+        column = columns.get(field.serialized_name)
+        column_type = _get_column_type(field)
+        if column is None:
+            values = [None] * length
+        elif column_type is not None and not isinstance(column, list):
+            values = _from_array(column, column_type)
+            if all(type(value) is column_type for value in values):
+                names.append(field.name)
+                values_list.append(values)
+                continue
+        else:
+            values = _from_array(column, None)
+        if not field.optional and any(value is None for value in values):
+            values = [field.default_value if value is None else value for value in values]
+        names.append(field.name)
+        values_list.append(field.serializer.deserialize_many(values, field.type))
+    create: Callable[..., T] = type_
+    if not values_list:
+        return [create() for _ in range(length)]
+    return [create(**dict(zip(names, row))) for row in zip(*values_list)]
@@ -0,0 +1,189 @@
+from datetime import date, datetime, time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Type, TypeVar
+
+from .exceptions import WrongTypeError
+from .serializers import (
+    DataClassSerializer,
+    DateSerializer,
+    DateTimeSerializer,
+    DefaultSerializer,
+    EnumSerializer,
+    ListSerializer,
+    OptionalSerializer,
+    Serializer,
+    StringSerializer,
+    TimeSerializer,
+)
+from .typing import DataClass
+from .utils import extract_generic_args, extract_optional_type, is_generic
+
+if TYPE_CHECKING:
+    from .serializers import SerializerFactory  # noqa: F401
+
+__all__ = ["compile_encoder", "compile_decoder"]
+
+
+_FROMISOFORMAT: Dict[type, Callable[[str], Any]] = {
+    DateTimeSerializer: datetime.fromisoformat,
+    DateSerializer: date.fromisoformat,
+    TimeSerializer: time.fromisoformat,
+}
+
+
+def _raise_wrong_type(type_: Type, value: Any):
+    raise WrongTypeError(type_, value)
+
+
+def _is_dynamic(type_: Any) -> bool:
+    # Items of these types are serialized by their runtime type, so their serializer cannot be inlined.
+    return type_ is Any or type_ is object or isinstance(type_, TypeVar)  # type: ignore
+
+
+class _CodeBuilder:
+    def __init__(self, serializer_factory: "SerializerFactory"):
+        self._serializer_factory = serializer_factory
+        self.namespace: Dict[str, Any] = {"_raise_wrong_type": _raise_wrong_type}
+        self._counter = 0
+
+    def bind(self, value: Any, prefix: str = "_v") -> str:
+        name = f"{prefix}{self._counter}"
+        self._counter += 1
+        self.namespace[name] = value
+        return name
+
+    def variable(self) -> str:
+        name = f"_x{self._counter}"
+        self._counter += 1
+        return name
+
+    def compile(self, source: str, name: str) -> Callable:
+        filename = f"<jsondataclass {name}>"
+        code_cache = self._serializer_factory.get_code_cache()
+        code = code_cache.compile(source, filename) if code_cache is not None else compile(source, filename, "exec")
+        exec(code, self.namespace)
+        return self.namespace[name]
+
+
+class _EncoderBuilder(_CodeBuilder):
+    def expression(self, type_: Type, serializer: Serializer, var: str) -> str:
+        if self._serializer_factory.profiler is not None:
+            # Profiled serializers are always called, so that every field is recorded.
+            return f"{self.bind(serializer, '_serializer')}.serialize({var})"
+        serializer_class = type(serializer)
+        if serializer_class is DefaultSerializer:
+            return var
+        if serializer_class is StringSerializer:
+            return f"str({var})"
+        if serializer_class is EnumSerializer:
+            return f"{var}.value"
+        if serializer_class in (DateTimeSerializer, DateSerializer, TimeSerializer):
+            if serializer._format is None:  # type: ignore
+                return f"{var}.isoformat()"
+            return f"{self.bind(serializer._format_value, '_format')}({var})"  # type: ignore
+        if serializer_class is DataClassSerializer:
+            encoder = self.bind(self._serializer_factory.get_dataclass_encoder(type_), "_encoder")
+            type_name = self.bind(type_, "_type")
+            serializer_name = self.bind(serializer, "_serializer")
+            return f"({encoder}({var}) if {var}.__class__ is {type_name} else {serializer_name}.serialize({var}))"
+        if serializer_class is OptionalSerializer and not _is_dynamic(extract_optional_type(type_)):
+            optional_type = extract_optional_type(type_)
+            inner = self.expression(optional_type, self._serializer_factory.get_serializer(optional_type), var)
+            if inner == var:
+                return var
+            return f"(None if {var} is None else {inner})"
+        if (
+            serializer_class is ListSerializer
+            and is_generic(type_)
+            and extract_generic_args(type_)
+            and not _is_dynamic(extract_generic_args(type_)[0])
+        ):
+            item_type = extract_generic_args(type_)[0]
+            item = self.variable()
+            inner = self.expression(item_type, self._serializer_factory.get_serializer(item_type), item)
+            if inner == item:
+                return f"list({var})"
+            return f"[{inner} for {item} in {var}]"
+        serializer_name = self.bind(serializer, "_serializer")
+        return f"{serializer_name}.serialize({var})"
+
+    def build(self, type_: Type[DataClass]) -> Callable[[DataClass], dict]:
+        plan = self._serializer_factory.get_dataclass_plan(type_)
+        lines = ["def encode(obj):"]
+        items = []
+        for i, field in enumerate(plan.fields):
+            var = f"_f{i}"
+            lines.append(f"    {var} = obj.{field.name}")
+            if not field.optional:
+                field_name = self.bind(field, "_field")
+                lines.append(f"    if {var} is None:")
+                lines.append(f"        {var} = {field_name}.default_value")
+            items.append(f"{field.serialized_name!r}: {self.expression(field.type, field.serializer, var)}")
+        lines.append("    return {" + ", ".join(items) + "}")
+        return self.compile("\n".join(lines), "encode")
+
+
+class _DecoderBuilder(_CodeBuilder):
+    def expression(self, type_: Type, serializer: Serializer, var: str) -> str:
+        if self._serializer_factory.profiler is not None:
+            return f"{self.bind(serializer, '_serializer')}.deserialize({var}, {self.bind(type_, '_type')})"
+        serializer_class = type(serializer)
+        if serializer_class is DefaultSerializer:
+            return var
+        if serializer_class is StringSerializer:
+            return f"str({var})"
+        if serializer_class in (DateTimeSerializer, DateSerializer, TimeSerializer):
+            format = serializer._format  # type: ignore
+            if format is None:
+                return f"{self.bind(_FROMISOFORMAT[serializer_class], '_fromisoformat')}({var})"
+            parse = self.bind(serializer._parse, "_parse")  # type: ignore
+            suffix = {DateTimeSerializer: "", DateSerializer: ".date()", TimeSerializer: ".time()"}[serializer_class]
+            return f"{parse}({var}){suffix}"
+        if serializer_class is DataClassSerializer:
+            return f"{self.bind(self._serializer_factory.get_dataclass_decoder(type_), '_decoder')}({var})"
+        if serializer_class is OptionalSerializer:
+            optional_type = extract_optional_type(type_)
+            inner = self.expression(optional_type, self._serializer_factory.get_serializer(optional_type), var)
+            if inner == var:
+                return var
+            return f"(None if {var} is None else {inner})"
+        if serializer_class is ListSerializer:
+            list_type = self.bind(list, "_list")
+            if is_generic(type_) and extract_generic_args(type_):
+                item_type = extract_generic_args(type_)[0]
+                item = self.variable()
+                inner = self.expression(item_type, self._serializer_factory.get_serializer(item_type), item)
+                result = f"list({var})" if inner == item else f"[{inner} for {item} in {var}]"
+            else:
+                result = f"list({var})"
+            return f"({result} if isinstance({var}, {list_type}) else _raise_wrong_type({list_type}, {var}))"
+        serializer_name = self.bind(serializer, "_serializer")
+        return f"{serializer_name}.deserialize({var}, {self.bind(type_, '_type')})"
+
+    def build(self, type_: Type[DataClass]) -> Callable[[Any], DataClass]:
+        plan = self._serializer_factory.get_dataclass_plan(type_)
+        type_name = self.bind(type_, "_type")
+        dict_type = self.bind(dict, "_dict")
+        lines = [
+            "def decode(data):",
+            f"    if not isinstance(data, {dict_type}):",
+            f"        _raise_wrong_type({dict_type}, data)",
+        ]
+        kwargs: List[str] = []
+        for i, field in enumerate(plan.fields):
+            var = f"_f{i}"
+            lines.append(f"    {var} = data.get({field.serialized_name!r})")
+            if not field.optional:
+                field_name = self.bind(field, "_field")
+                lines.append(f"    if {var} is None:")
+                lines.append(f"        {var} = {field_name}.default_value")
+            kwargs.append(f"{field.name}={self.expression(field.type, field.serializer, var)}")
+        lines.append(f"    return {type_name}(" + ", ".join(kwargs) + ")")
+        return self.compile("\n".join(lines), "decode")
+
+
+def compile_encoder(serializer_factory: "SerializerFactory", type_: Type[DataClass]) -> Callable[[DataClass], dict]:
+    return _EncoderBuilder(serializer_factory).build(type_)
+
+
+def compile_decoder(serializer_factory: "SerializerFactory", type_: Type[DataClass]) -> Callable[[Any], DataClass]:
+    return _DecoderBuilder(serializer_factory).build(type_)
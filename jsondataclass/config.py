@@ -1,8 +1,11 @@
+from contextlib import ExitStack
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type
+from weakref import WeakSet
 
 if TYPE_CHECKING:
-    from .serializers import Serializer  # noqa: F401
+    from .field import Discriminator  # noqa: F401
+    from .serializers import Serializer, SerializerFactory  # noqa: F401
 
 
 def _default_serializer():
@@ -17,3 +20,30 @@ class Config:
     datetime_format: Optional[str] = None
     date_format: Optional[str] = None
     time_format: Optional[str] = None
+    compiled: bool = False
+    discriminators: Dict[Any, "Discriminator"] = field(default_factory=dict)
+    code_cache_dir: Optional[str] = None
+
+    def __setattr__(self, name: str, value: Any):
+        # Factories resolved their serializers and plans with the previous value, so an assignment drops their caches.
+        # Their locks are held from the frozen check to the reset so that a concurrent freeze() is not missed.
+        # Mutating a value in place, e.g. ``discriminators``, is not seen, assign a new one or call clear_cache().
+        factories = list(self.__dict__.get("_factories", ()))
+        with ExitStack() as stack:
+            for factory in factories:
+                stack.enter_context(factory._lock)
+                factory._check_not_frozen()
+            object.__setattr__(self, name, value)
+            for factory in factories:
+                factory._reset_cache("config." + name)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Copies and unpickled configs are not used by the factories of the original.
+        state = dict(self.__dict__)
+        state.pop("_factories", None)
+        return state
+
+    def _add_factory(self, factory: "SerializerFactory"):
+        if "_factories" not in self.__dict__:
+            object.__setattr__(self, "_factories", WeakSet())
+        self.__dict__["_factories"].add(factory)
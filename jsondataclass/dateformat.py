@@ -0,0 +1,265 @@
+import re
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+
+__all__ = ["get_parser", "get_formatter", "get_timezone"]
+
+DateTimeValue = Union[datetime, date, time]
+
+# Same patterns as ``_strptime``, with inner groups made non-capturing so every directive is exactly one group.
+_PATTERNS = {
+    "Y": r"(\d\d\d\d)",
+    "y": r"(\d\d)",
+    "m": r"(1[0-2]|0[1-9]|[1-9])",
+    "d": r"(3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])",
+    "H": r"(2[0-3]|[0-1]\d|\d)",
+    "I": r"(1[0-2]|0[1-9]|[1-9])",
+    "M": r"([0-5]\d|\d)",
+    "S": r"(6[0-1]|[0-5]\d|\d)",
+    "f": r"([0-9]{1,6})",
+    "z": r"([+-]\d\d:?[0-5]\d(?::?[0-5]\d(?:\.\d{1,6})?)?|(?-i:Z))",
+    "p": r"(am|pm)",
+}
+
+_WHITESPACE = re.compile(r"\s+")
+
+_MAX_TIMEZONES = 1024
+
+_timezones: Dict[str, timezone] = {}
+
+_offsets: Dict[Optional[timedelta], str] = {}
+
+
+def _tokenize(format: str) -> Optional[List[Tuple[bool, str]]]:
+    # (True, directive) and (False, literal text) tokens, None when the format has an unsupported directive.
+    tokens: List[Tuple[bool, str]] = []
+    literal: List[str] = []
+    i = 0
+    while i < len(format):
+        char = format[i]
+        if char != "%":
+            literal.append(char)
+            i += 1
+            continue
+        if i + 1 == len(format):
+            return None
+        directive = format[i + 1]
+        if directive == "%":
+            literal.append("%")
+        elif directive in _PATTERNS:
+            if literal:
+                tokens.append((False, "".join(literal)))
+                literal = []
+            tokens.append((True, directive))
+        else:
+            return None
+        i += 2
+    if literal:
+        tokens.append((False, "".join(literal)))
+    return tokens
+
+
+def _am_pm() -> Optional[Tuple[str, str]]:
+    am, pm = time(1).strftime("%p"), time(13).strftime("%p")
+    if (am, pm) != ("AM", "PM"):
+        return None
+    return am, pm
+
+
+def get_timezone(offset: str) -> timezone:
+    """Return the ``timezone`` of a ``%z`` offset string, instances are shared between equal offsets."""
+    tz = _timezones.get(offset)
+    if tz is None:
+        tz = timezone(_parse_offset(offset))
+        if len(_timezones) >= _MAX_TIMEZONES:
+            _timezones.clear()
+        _timezones[offset] = tz
+    return tz
+
+
+def _parse_offset(offset: str) -> timedelta:
+    if offset == "Z":
+        return timedelta(0)
+    value = offset
+    if value[3] == ":":
+        value = value[:3] + value[4:]
+        if len(value) > 5:
+            if value[5] != ":":
+                raise ValueError(f"Inconsistent use of : in {offset}")
+            value = value[:5] + value[6:]
+    seconds = int(value[1:3]) * 3600 + int(value[3:5]) * 60 + int(value[5:7] or 0)
+    microseconds = int(value[8:].ljust(6, "0")) if len(value) > 8 else 0
+    if value[0] == "-":
+        seconds, microseconds = -seconds, -microseconds
+    return timedelta(seconds=seconds, microseconds=microseconds)
+
+
+def _format_offset(offset: Optional[timedelta]) -> str:
+    result = _offsets.get(offset)
+    if result is None:
+        result = ""
+        if offset is not None:
+            sign = "-" if offset < timedelta(0) else "+"
+            hours, rest = divmod(abs(offset), timedelta(hours=1))
+            minutes, rest = divmod(rest, timedelta(minutes=1))
+            result = f"{sign}{hours:02d}{minutes:02d}"
+            if rest.seconds or rest.microseconds:
+                result += f"{rest.seconds:02d}"
+            if rest.microseconds:
+                result += f".{rest.microseconds:06d}"
+        if len(_offsets) >= _MAX_TIMEZONES:
+            _offsets.clear()
+        _offsets[offset] = result
+    return result
+
+
+def _fail(value: str, format: str):
+    raise ValueError(f"time data {value!r} does not match format {format!r}")
+
+
+def _strptime(format: str) -> Callable[[str], datetime]:
+    return lambda value: datetime.strptime(value, format)
+
+
+def _strftime(format: str) -> Callable[[DateTimeValue], str]:
+    return lambda value: value.strftime(format)
+
+
+@lru_cache(maxsize=256)
+def get_parser(format: str) -> Callable[[str], datetime]:
+    """Return a function equivalent to ``datetime.strptime(value, format)`` specialized for ``format``."""
+    tokens = _tokenize(format)
+    directives = [token for is_directive, token in tokens or () if is_directive]
+    if (
+        tokens is None
+        or len(directives) != len(set(directives))
+        or {"Y", "y"} <= set(directives)
+        or {"H", "I"} <= set(directives)
+        or ("p" in directives and _am_pm() is None)
+    ):
+        return _strptime(format)
+
+    pattern = []
+    for is_directive, token in tokens:
+        if is_directive:
+            pattern.append(_PATTERNS[token])
+        else:
+            pattern.append(r"\s+".join(re.escape(part) for part in _WHITESPACE.split(token)))
+    regex = re.compile("".join(pattern), re.IGNORECASE)
+
+    namespace: Dict[str, Any] = {
+        "_match": regex.fullmatch,
+        "_fail": _fail,
+        "_format": format,
+        "_datetime": datetime,
+        "_get_timezone": get_timezone,
+    }
+    lines = ["def parse(value):", "    m = _match(value)", "    if m is None:", "        _fail(value, _format)"]
+    if directives:
+        lines.append("    g = m.groups()")
+    args = {"year": "1900", "month": "1", "day": "1", "hour": "0", "minute": "0", "second": "0", "us": "0"}
+    args["tz"] = "None"
+    for i, directive in enumerate(directives):
+        group = f"g[{i}]"
+        if directive == "Y":
+            args["year"] = f"int({group})"
+        elif directive == "y":
+            lines.append(f"    year = int({group})")
+            lines.append("    year += 2000 if year <= 68 else 1900")
+            args["year"] = "year"
+        elif directive == "m":
+            args["month"] = f"int({group})"
+        elif directive == "d":
+            args["day"] = f"int({group})"
+        elif directive == "H":
+            args["hour"] = f"int({group})"
+        elif directive == "I":
+            lines.append(f"    hour = int({group})")
+            if "p" in directives:
+                lines.append(f"    if g[{directives.index('p')}].lower() == 'pm':")
+                lines.append("        if hour != 12:")
+                lines.append("            hour += 12")
+                lines.append("    elif hour == 12:")
+            else:
+                lines.append("    if hour == 12:")
+            lines.append("        hour = 0")
+            args["hour"] = "hour"
+        elif directive == "M":
+            args["minute"] = f"int({group})"
+        elif directive == "S":
+            args["second"] = f"int({group})"
+        elif directive == "f":
+            args["us"] = f"int({group}.ljust(6, '0'))"
+        elif directive == "z":
+            args["tz"] = f"_get_timezone({group})"
+    lines.append(f"    return _datetime({', '.join(args.values())})")
+    exec(compile("\n".join(lines), f"<jsondataclass parser {format!r}>", "exec"), namespace)
+    return namespace["parse"]
+
+
+@lru_cache(maxsize=256)
+def get_formatter(format: str, type_: Type[DateTimeValue]) -> Callable[[DateTimeValue], str]:
+    """Return a function equivalent to ``value.strftime(format)`` specialized for ``format`` and ``type_`` values.
+
+    Values of other types (e.g. subclasses) are still formatted with ``strftime``.
+    """
+    tokens = _tokenize(format)
+    am_pm = _am_pm()
+    if tokens is None or type_ not in (datetime, date, time) or (am_pm is None and (True, "p") in tokens):
+        return _strftime(format)
+
+    has_date = type_ is not time
+    has_time = type_ is not date
+    if has_date:
+        # Directive -> (template, expression), constants are put into the template.
+        fields: Dict[str, Tuple[str, str]] = {
+            "Y": ("%d", "value.year"),
+            "y": ("%02d", "value.year % 100"),
+            "m": ("%02d", "value.month"),
+            "d": ("%02d", "value.day"),
+        }
+    else:
+        fields = {"Y": ("1900", ""), "y": ("00", ""), "m": ("01", ""), "d": ("01", "")}
+    if has_time:
+        fields.update(
+            {
+                "H": ("%02d", "value.hour"),
+                "I": ("%02d", "value.hour % 12 or 12"),
+                "M": ("%02d", "value.minute"),
+                "S": ("%02d", "value.second"),
+                "f": ("%06d", "value.microsecond"),
+                "z": ("%s", "_format_offset(value.utcoffset())"),
+                "p": ("%s", "_am_pm[value.hour >= 12]"),
+            }
+        )
+    else:
+        fields.update({"H": ("00", ""), "I": ("12", ""), "M": ("00", ""), "S": ("00", ""), "f": ("000000", "")})
+        fields.update({"z": ("", ""), "p": ((am_pm or ("AM",))[0].replace("%", "%%"), "")})
+
+    template = []
+    expressions = []
+    for is_directive, token in tokens:
+        if is_directive:
+            field_template, expression = fields[token]
+            template.append(field_template)
+            if expression:
+                expressions.append(expression)
+        else:
+            template.append(token.replace("%", "%%"))
+
+    namespace: Dict[str, Any] = {
+        "_type": type_,
+        "_format": format,
+        "_template": "".join(template),
+        "_format_offset": _format_offset,
+        "_am_pm": am_pm,
+    }
+    lines = ["def format(value):", "    if value.__class__ is not _type:", "        return value.strftime(_format)"]
+    if has_date and ((True, "Y") in tokens):
+        # strftime pads years below 1000 differently on different platforms.
+        lines.append("    if value.year < 1000:")
+        lines.append("        return value.strftime(_format)")
+    lines.append(f"    return _template % ({''.join(f'{expression}, ' for expression in expressions)})")
+    exec(compile("\n".join(lines), f"<jsondataclass formatter {format!r}>", "exec"), namespace)
+    return namespace["format"]
@@ -0,0 +1,158 @@
+import json
+from json.encoder import encode_basestring, encode_basestring_ascii  # type: ignore
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple, Type
+
+from .plan import FieldPlan
+from .serializers import (
+    DataClassSerializer,
+    DefaultSerializer,
+    DictSerializer,
+    ListSerializer,
+    OptionalSerializer,
+    Serializer,
+    SerializerFactory,
+    StringSerializer,
+    TupleSerializer,
+    UnionSerializer,
+)
+from .typing import DataClass
+
+__all__ = ["DataClassEncoder"]
+
+FLUSH_PARTS = 4096
+
+_INFINITY = float("inf")
+
+
+class DataClassEncoder:
+    """Write JSON text straight from dataclass instances without building the intermediate dict tree."""
+
+    def __init__(
+        self,
+        serializer_factory: SerializerFactory,
+        fp: IO[str],
+        ensure_ascii: bool = True,
+        separators: Optional[Tuple[str, str]] = None,
+        allow_nan: bool = True,
+    ):
+        self._serializer_factory = serializer_factory
+        self._write = fp.write
+        self._item_separator, self._key_separator = separators if separators is not None else (", ", ": ")
+        self._encode_str: Callable[[str], str] = encode_basestring_ascii if ensure_ascii else encode_basestring
+        self._leaf_encoder = json.JSONEncoder(ensure_ascii=ensure_ascii, separators=separators, allow_nan=allow_nan)
+        self._fields: Dict[Type[DataClass], List[Tuple[str, FieldPlan, Callable[[Any], None]]]] = {}
+        self._parts: List[str] = []
+
+    def encode(self, obj: Any):
+        self._encode_value(obj)
+        self._flush()
+
+    def _flush(self):
+        self._write("".join(self._parts))
+        self._parts.clear()
+
+    def _encode_value(self, value: Any):
+        self._encode(value, self._serializer_factory.get_serializer(type(value)))
+
+    def _encode(self, value: Any, serializer: Serializer):
+        self._get_encode_method(serializer)(value)
+
+    def _get_encode_method(self, serializer: Serializer) -> Callable[[Any], None]:
+        serializer_class = type(serializer)
+        if serializer_class is DefaultSerializer:
+            return self._encode_leaf
+        if serializer_class is StringSerializer:
+            return self._encode_string
+        if serializer_class is DataClassSerializer:
+            return self._encode_dataclass
+        if serializer_class is ListSerializer or serializer_class is TupleSerializer:
+            return self._encode_list
+        if serializer_class is DictSerializer:
+            return self._encode_dict
+        if serializer_class is OptionalSerializer:
+            return self._encode_optional
+        if serializer_class is UnionSerializer and serializer.discriminator is None:  # type: ignore
+            return self._encode_optional
+        return lambda value: self._encode_leaf(serializer.serialize(value))
+
+    def _get_fields(self, type_: Type[DataClass]) -> List[Tuple[str, FieldPlan, Callable[[Any], None]]]:
+        fields = self._fields.get(type_)
+        if fields is None:
+            plan = self._serializer_factory.get_dataclass_plan(type_)
+            fields = [
+                (self._encode_key(field.serialized_name), field, self._get_encode_method(field.serializer))
+                for field in plan.fields
+            ]
+            self._fields[type_] = fields
+        return fields
+
+    def _encode_key(self, key: str) -> str:
+        return self._encode_str(key) + self._key_separator
+
+    def _encode_dataclass(self, value: DataClass):
+        parts = self._parts
+        parts.append("{")
+        for i, (key, field, encode) in enumerate(self._get_fields(type(value))):
+            field_value = getattr(value, field.name)
+            if field_value is None and not field.optional:
+                field_value = field.default_value
+            if i:
+                parts.append(self._item_separator)
+            parts.append(key)
+            encode(field_value)
+        parts.append("}")
+        if len(parts) > FLUSH_PARTS:
+            self._flush()
+
+    def _encode_optional(self, value: Any):
+        if value is None:
+            self._parts.append("null")
+        else:
+            self._encode_value(value)
+
+    def _encode_string(self, value: Any):
+        self._parts.append(self._encode_str(str(value)))
+
+    def _encode_list(self, value: Any):
+        parts = self._parts
+        parts.append("[")
+        item_type = encode = None
+        for i, item in enumerate(value):
+            if i:
+                parts.append(self._item_separator)
+            if type(item) is not item_type:
+                item_type = type(item)
+                encode = self._get_encode_method(self._serializer_factory.get_serializer(item_type))
+            encode(item)  # type: ignore
+        parts.append("]")
+
+    def _encode_dict(self, value: dict):
+        parts = self._parts
+        parts.append("{")
+        item_type = encode = None
+        for i, (key, item) in enumerate(value.items()):
+            if i:
+                parts.append(self._item_separator)
+            parts.append(self._encode_key(str(key)))
+            if type(item) is not item_type:
+                item_type = type(item)
+                encode = self._get_encode_method(self._serializer_factory.get_serializer(item_type))
+            encode(item)  # type: ignore
+        parts.append("}")
+
+    def _encode_leaf(self, value: Any):
+        value_type = type(value)
+        if value_type is str:
+            self._parts.append(self._encode_str(value))
+        elif value is None:
+            self._parts.append("null")
+        elif value is True:
+            self._parts.append("true")
+        elif value is False:
+            self._parts.append("false")
+        elif value_type is int:
+            self._parts.append(int.__repr__(value))
+        elif value_type is float and value == value and -_INFINITY < value < _INFINITY:
+            self._parts.append(float.__repr__(value))
+        else:
+            self._parts.extend(self._leaf_encoder.iterencode(value))
@@ -45,6 +45,31 @@ class UnionTypeMatchError(JsonDataClassError):
         return f"{type(self._value)} does not match any type of {self._union!r}"
 
 
+class DiscriminatorMatchError(JsonDataClassError):
+    def __init__(self, union: Type, key: str, value: Any):
+        self._union = union
+        self._key = key
+        self._value = value
+
+    def __str__(self) -> str:
+        tag = self._value.get(self._key) if isinstance(self._value, dict) else None
+        return f"Discriminator {self._key!r} value {tag!r} does not match any type of {self._union!r}"
+
+
+class ValidationError(JsonDataClassError):
+    def __init__(self, path: str, error: Exception):
+        self.path = path
+        self.error = error
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.error}"
+
+
+class FrozenMapperError(JsonDataClassError):
+    def __str__(self) -> str:
+        return "Serializers and config of a frozen mapper can not be changed"
+
+
 if sys.version_info >= (3, 8):
 
     class LiteralTypeMatchError(JsonDataClassError):
@@ -1,5 +1,5 @@
 from dataclasses import MISSING, Field, dataclass, field
-from typing import TYPE_CHECKING, Any, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type
 
 from .exceptions import MissingDefaultValueError
 from .utils import is_optional
@@ -7,17 +7,29 @@ from .utils import is_optional
 if TYPE_CHECKING:
     from .serializers import Serializer  # noqa: F401
 
-__all__ = ["Meta", "jsonfield", "JsonField"]
+__all__ = ["Discriminator", "Meta", "jsonfield", "JsonField"]
 
 _METADATA_KEY = "_jsondataclass"
 
 
+@dataclass
+class Discriminator:
+    """Tag key of a union's JSON objects and tag values of its members.
+
+    Without ``mapping`` tags are taken from the ``key`` field default (or single ``Literal`` value) of each member.
+    """
+
+    key: str
+    mapping: Optional[Dict[Any, Type]] = None
+
+
 @dataclass
 class Meta:
     serialized_name: Optional[str] = ""
     serializer_class: Optional[Type["Serializer"]] = None
     serializer_args: Optional[tuple] = None
     serializer_kwargs: Optional[dict] = None
+    discriminator: Optional[Discriminator] = None
 
 
 def jsonfield(
@@ -26,10 +38,13 @@ def jsonfield(
     serializer_class: Optional[Type["Serializer"]] = None,
     serializer_args: Optional[tuple] = None,
     serializer_kwargs: Optional[dict] = None,
+    discriminator: Optional[Discriminator] = None,
     **field_kwargs,
 ):
     metadata = field_kwargs.setdefault("metadata", {})
-    metadata[_METADATA_KEY] = Meta(serialized_name, serializer_class, serializer_args, serializer_kwargs)
+    metadata[_METADATA_KEY] = Meta(
+        serialized_name, serializer_class, serializer_args, serializer_kwargs, discriminator
+    )
     return field(**field_kwargs)
 
 
@@ -57,6 +72,10 @@ class JsonField:
         kwargs = self._meta.serializer_kwargs
         return kwargs if kwargs is not None else dict()
 
+    @property
+    def discriminator(self) -> Optional[Discriminator]:
+        return self._meta.discriminator
+
     @property
     def default_value(self) -> Any:
         if self._field.default is not MISSING:
@@ -0,0 +1,152 @@
+from dataclasses import fields, is_dataclass
+from typing import Any, Dict, Tuple, Type, TypeVar
+
+from .plan import FieldPlan
+from .serializers import (
+    DataClassSerializer,
+    DefaultSerializer,
+    OptionalSerializer,
+    Serializer,
+    SerializerFactory,
+    StringSerializer,
+)
+from .typing import DataClass
+from .utils import extract_optional_type, type_check
+
+__all__ = ["LazyDecoder", "is_lazy", "materialize"]
+
+T = TypeVar("T")
+
+_PENDING = "__jsondataclass_pending__"
+
+_EAGER_SERIALIZERS = (DefaultSerializer, StringSerializer)
+
+_lazy_classes: Dict[Type, Type] = {}
+_eager_types: Dict[Type, bool] = {}
+
+
+class _LazyField:
+    # A non-data descriptor: it also shadows class level defaults and is bypassed once the value is in __dict__.
+    def __init__(self, name: str):
+        self._name = name
+
+    def __get__(self, obj: Any, owner: Type) -> Any:
+        if obj is None:
+            return getattr(owner.__bases__[0], self._name)
+        # Threads may decode the same field at once: the first stored value wins and is stored before the field leaves
+        # the pending ones, so a field that is not pending anymore is always in __dict__.
+        attrs = obj.__dict__
+        pending = attrs.get(_PENDING, {})
+        entry = pending.get(self._name)
+        if entry is None:
+            return attrs[self._name]
+        decoder, field, data = entry
+        value = attrs.setdefault(self._name, decoder.decode_field(field, data))
+        pending.pop(self._name, None)
+        if not pending:
+            _finalize(obj)
+        return value
+
+
+def _lazy_eq(self, other: Any) -> Any:
+    materialize(self)
+    if is_lazy(other):
+        materialize(other)
+    return self == other
+
+
+def _lazy_reduce_ex(self, protocol: int) -> Any:
+    return materialize(self).__reduce_ex__(protocol)
+
+
+def _lazy_class(type_: Type[T]) -> Type[T]:
+    lazy_class = _lazy_classes.get(type_)
+    if lazy_class is None:
+        namespace: Dict[str, Any] = {field.name: _LazyField(field.name) for field in fields(type_)}
+        namespace["__eq__"] = _lazy_eq
+        namespace["__hash__"] = type_.__hash__
+        namespace["__reduce_ex__"] = _lazy_reduce_ex
+        namespace["__qualname__"] = type_.__qualname__
+        namespace["__module__"] = type_.__module__
+        lazy_class = type(type_.__name__, (type_,), namespace)
+        _lazy_classes[type_] = lazy_class
+    return lazy_class
+
+
+def _is_eager(type_: Type) -> bool:
+    # Lazy instances are created without __init__, so classes that need it to run are decoded eagerly.
+    eager = _eager_types.get(type_)
+    if eager is None:
+        eager = _eager_types[type_] = (
+            hasattr(type_, "__slots__")
+            or hasattr(type_, "__post_init__")
+            or any(not field.init for field in fields(type_))
+        )
+    return eager
+
+
+def _finalize(obj: Any):
+    # Only the thread that removes the pending fields restores the class.
+    if obj.__dict__.pop(_PENDING, None) is not None:
+        object.__setattr__(obj, "__class__", type(obj).__bases__[0])
+
+
+def is_lazy(obj: Any) -> bool:
+    return _PENDING in getattr(obj, "__dict__", ())
+
+
+def materialize(obj: T) -> T:
+    """Decode all pending fields of a lazy dataclass, recursively, and restore its original class."""
+    if not is_dataclass(obj) or isinstance(obj, type):
+        return obj
+    attrs = obj.__dict__
+    pending = attrs.get(_PENDING)
+    if pending is not None:
+        for name, (decoder, field, data) in list(pending.items()):
+            if name not in attrs:
+                attrs.setdefault(name, decoder.decode_field(field, data))
+        _finalize(obj)
+    for field in fields(obj):
+        materialize(getattr(obj, field.name))
+    return obj
+
+
+class LazyDecoder:
+    """Decode dataclasses whose non-primitive fields are converted on first attribute access."""
+
+    def __init__(self, serializer_factory: SerializerFactory):
+        self._serializer_factory = serializer_factory
+
+    def decode(self, data: Any, type_: Type[DataClass]) -> DataClass:
+        if _is_eager(type_):
+            return self._serializer_factory.get_serializer(type_).deserialize(data, type_)
+        type_check(data, dict)
+        plan = self._serializer_factory.get_dataclass_plan(type_)
+        obj = object.__new__(_lazy_class(type_))
+        pending: Dict[str, Tuple[LazyDecoder, FieldPlan, Any]] = {}
+        for field in plan.fields:
+            value = data.get(field.serialized_name)
+            if value is None and not field.optional:
+                value = field.default_value
+            if type(field.serializer) in _EAGER_SERIALIZERS:
+                object.__setattr__(obj, field.name, value)
+            else:
+                pending[field.name] = (self, field, value)
+        if pending:
+            obj.__dict__[_PENDING] = pending
+        else:
+            object.__setattr__(obj, "__class__", type_)
+        return obj
+
+    def decode_field(self, field: FieldPlan, data: Any) -> Any:
+        return self._decode_value(data, field.type, field.serializer)
+
+    def _decode_value(self, data: Any, type_: Type, serializer: Serializer) -> Any:
+        if type(serializer) is OptionalSerializer:
+            if data is None:
+                return None
+            type_ = extract_optional_type(type_)
+            serializer = self._serializer_factory.get_serializer(type_)
+        if type(serializer) is DataClassSerializer:
+            return self.decode(data, type_)
+        return serializer.deserialize(data, type_)
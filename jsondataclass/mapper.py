@@ -1,21 +1,55 @@
 import json
-from typing import Any, Optional, Type, TypeVar
+import os
+import threading
+from dataclasses import dataclass
+from itertools import islice
+from typing import IO, Any, Iterable, Iterator, List, Optional, Type, TypeVar, Union
 
+from .backends import JsonBackend, JsonInput, get_backend
 from .config import Config
-from .serializers import Serializer, SerializerFactory
+from .exceptions import ValidationError
+from .profiling import Profiler
+from .projection import ProjectionSpec
+from .serializers import CacheInfo, DataClassSerializer, Serializer, SerializerFactory
+from .stream import DEFAULT_CHUNK_SIZE, iter_array_items
 from .typing import DataClass
 
 T = TypeVar("T")
 
+PathOrFile = Union[str, os.PathLike, IO]
+
+JSONL_CHUNK_SIZE = 1000
+
+# Options of json.dumps that DataClassEncoder supports, others make dump() fall back to to_json().
+_ENCODER_OPTIONS = frozenset(("ensure_ascii", "separators", "allow_nan"))
+
 
 class DataClassMapper:
-    def __init__(self, serializer_factory: Optional[SerializerFactory] = None, config: Optional[Config] = None):
+    def __init__(
+        self,
+        serializer_factory: Optional[SerializerFactory] = None,
+        config: Optional[Config] = None,
+        backend: Union[JsonBackend, str, None] = None,
+    ):
         if config is None:
             config = Config()
         self._config = config
         if serializer_factory is None:
             serializer_factory = SerializerFactory(self._config)
         self._serializer_factory = serializer_factory
+        self._config._add_factory(serializer_factory)
+        self._pending_types: List[Type] = []
+        self.backend = backend  # type: ignore
+
+    @property
+    def backend(self) -> JsonBackend:
+        return self._backend
+
+    @backend.setter
+    def backend(self, backend: Union[JsonBackend, str, None]):
+        if not isinstance(backend, JsonBackend):
+            backend = get_backend(backend)
+        self._backend = backend
 
     @property
     def default_serializer_class(self) -> Type[Serializer]:
@@ -23,7 +57,7 @@ class DataClassMapper:
 
     @default_serializer_class.setter
     def default_serializer_class(self, serializer_class: Type[Serializer]):
-        self._config.default_serializer_class = serializer_class
+        self._set_config(default_serializer_class=serializer_class)
 
     @property
     def datetime_format(self) -> Optional[str]:
@@ -31,7 +65,7 @@ class DataClassMapper:
 
     @datetime_format.setter
     def datetime_format(self, format: str):
-        self._config.datetime_format = format
+        self._set_config(datetime_format=format)
 
     @property
     def date_format(self) -> Optional[str]:
@@ -39,7 +73,7 @@ class DataClassMapper:
 
     @date_format.setter
     def date_format(self, format: str):
-        self._config.date_format = format
+        self._set_config(date_format=format)
 
     @property
     def time_format(self) -> Optional[str]:
@@ -47,7 +81,71 @@ class DataClassMapper:
 
     @time_format.setter
     def time_format(self, format: str):
-        self._config.time_format = format
+        self._set_config(time_format=format)
+
+    @property
+    def compiled(self) -> bool:
+        return self._config.compiled
+
+    @compiled.setter
+    def compiled(self, compiled: bool):
+        self._set_config(compiled=compiled)
+
+    @property
+    def code_cache_dir(self) -> Optional[str]:
+        return self._config.code_cache_dir
+
+    @code_cache_dir.setter
+    def code_cache_dir(self, directory: Optional[str]):
+        self._set_config(code_cache_dir=directory)
+
+    @property
+    def frozen(self) -> bool:
+        return self._serializer_factory.frozen
+
+    def _set_config(self, **changes: Any):
+        # The config drops the caches of the factory, or raises FrozenMapperError if it is frozen.
+        for name, value in changes.items():
+            setattr(self._config, name, value)
+
+    @property
+    def profiler(self) -> Optional[Profiler]:
+        return self._serializer_factory.profiler
+
+    def enable_profiling(self) -> Profiler:
+        """Record calls per field and per serializer class until ``disable_profiling``.
+
+        All serializers are recreated with instrumentation, the compiled mode calls them instead of inlining.
+        """
+        profiler = Profiler()
+        self._serializer_factory.profiler = profiler
+        return profiler
+
+    def disable_profiling(self) -> Optional[Profiler]:
+        profiler = self._serializer_factory.profiler
+        if profiler is not None:
+            self._serializer_factory.profiler = None
+        return profiler
+
+    def prepare(self, *types: Type, freeze: bool = False):
+        """Resolve serializers of ``types`` and everything reachable from them ahead of the first call.
+
+        Types decorated with ``jsondataclass`` before their forward references could be resolved are included.
+        With ``freeze`` later changes of serializers and config raise ``FrozenMapperError``.
+        """
+        pending = self._pending_types[:]
+        self._serializer_factory.prepare(*types, *pending)
+        # Types decorated by other threads in the meantime stay pending.
+        del self._pending_types[: len(pending)]
+        if freeze:
+            self._serializer_factory.freeze()
+
+    def cache_info(self) -> CacheInfo:
+        """Cache hits and misses, created serializers, built plans, compiled code and invalidations by reason."""
+        return self._serializer_factory.cache_info()
+
+    def explain(self, type_: Type) -> str:
+        return self._serializer_factory.explain(type_)
 
     def register_serializer(self, type_: Type, serializer_class: Type[Serializer]):
         self._serializer_factory.register(type_, serializer_class)
@@ -55,17 +153,36 @@ class DataClassMapper:
     def unregister_serializer(self, type_: Type):
         self._serializer_factory.unregister(type_)
 
-    def from_json(self, json_: str, type_: Type[T], **loads_kwargs: Any) -> T:
-        data = json.loads(json_, **loads_kwargs)
+    def from_json(
+        self, json_: JsonInput, type_: Type[T], projection: Optional[ProjectionSpec] = None, **loads_kwargs: Any
+    ) -> T:
+        data = self._backend.loads(json_, **loads_kwargs)
+        if projection is not None:
+            return self._serializer_factory.get_projection_decoder(type_, projection)(data)
         serializer = self._serializer_factory.get_serializer(type_)
         return serializer.deserialize(data, type_)
 
     def to_json(self, dataclass: DataClass, **dumps_kwargs: Any) -> str:
         serializer = self._serializer_factory.get_serializer(type(dataclass))
         data = serializer.serialize(dataclass)
-        return json.dumps(data, **dumps_kwargs)
+        return self._backend.dumps(data, **dumps_kwargs)
 
-    def from_dict(self, data: dict, type_: Type[T]) -> T:
+    def to_json_bytes(self, dataclass: DataClass, **dumps_kwargs: Any) -> bytes:
+        serializer = self._serializer_factory.get_serializer(type(dataclass))
+        data = serializer.serialize(dataclass)
+        return self._backend.dumps_bytes(data, **dumps_kwargs)
+
+    def dump(self, dataclass: DataClass, fp: IO[str], **dumps_kwargs: Any):
+        if not _ENCODER_OPTIONS.issuperset(dumps_kwargs):
+            fp.write(self.to_json(dataclass, **dumps_kwargs))
+            return
+        from .encoder import DataClassEncoder
+
+        DataClassEncoder(self._serializer_factory, fp, **dumps_kwargs).encode(dataclass)
+
+    def from_dict(self, data: dict, type_: Type[T], projection: Optional[ProjectionSpec] = None) -> T:
+        if projection is not None:
+            return self._serializer_factory.get_projection_decoder(type_, projection)(data)
         serializer = self._serializer_factory.get_serializer(type_)
         return serializer.deserialize(data, type_)
 
@@ -74,22 +191,169 @@ class DataClassMapper:
         data = serializer.serialize(dataclass)
         return data
 
+    def validate(self, data: Any, type_: Type, all_errors: bool = False) -> List[ValidationError]:
+        return self._serializer_factory.get_validator().validate(data, type_, all_errors)
+
+    def from_json_lazy(self, json_: JsonInput, type_: Type[T], **loads_kwargs: Any) -> T:
+        return self.from_dict_lazy(self._backend.loads(json_, **loads_kwargs), type_)
+
+    def from_dict_lazy(self, data: dict, type_: Type[T]) -> T:
+        from .lazy import LazyDecoder
+
+        serializer = self._serializer_factory.get_serializer(type_)
+        if type(serializer) is not DataClassSerializer:
+            return serializer.deserialize(data, type_)
+        return LazyDecoder(self._serializer_factory).decode(data, type_)  # type: ignore
+
+    def from_json_many(self, jsons: Iterable[JsonInput], type_: Type[T], **loads_kwargs: Any) -> List[T]:
+        loads = self._backend.loads
+        return self.from_dict_many((loads(json_, **loads_kwargs) for json_ in jsons), type_)
 
-def from_json(json_: str, type_: Type[T], **loads_kwargs: Any) -> T:
-    mapper = DataClassMapper()
-    return mapper.from_json(json_, type_)
+    def to_json_many(self, dataclasses: Iterable[DataClass], **dumps_kwargs: Any) -> List[str]:
+        dumps = self._backend.dumps
+        return [dumps(data, **dumps_kwargs) for data in self.to_dict_many(dataclasses)]
+
+    def from_dict_many(self, data: Iterable[dict], type_: Type[T]) -> List[T]:
+        serializer = self._serializer_factory.get_serializer(type_)
+        return serializer.deserialize_many(data, type_)
+
+    def to_dict_many(self, dataclasses: Iterable[DataClass]) -> List[dict]:
+        dataclasses = list(dataclasses)
+        if not dataclasses:
+            return []
+        serializer = self._serializer_factory.get_serializer(type(dataclasses[0]))
+        return serializer.serialize_many(dataclasses)
+
+    def to_columns(
+        self, instances: Iterable[DataClass], type_: Type[DataClass], use_numpy: Optional[bool] = None
+    ) -> dict:
+        from .columns import to_columns
+
+        return to_columns(self._serializer_factory, instances, type_, use_numpy)
+
+    def from_columns(self, columns: dict, type_: Type[T]) -> List[T]:
+        from .columns import from_columns
+
+        return from_columns(self._serializer_factory, columns, type_)
+
+    def iter_jsonl(
+        self, file: PathOrFile, type_: Type[T], chunk_size: int = JSONL_CHUNK_SIZE, **loads_kwargs: Any
+    ) -> Iterator[T]:
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, encoding="utf-8") as fp:
+                yield from self.iter_jsonl(fp, type_, chunk_size, **loads_kwargs)
+            return
+        lines = (line for line in file if line.strip())
+        while True:
+            chunk = self.from_json_many(islice(lines, chunk_size), type_, **loads_kwargs)
+            if not chunk:
+                return
+            yield from chunk
+
+    def write_jsonl(
+        self,
+        file: PathOrFile,
+        dataclasses: Iterable[DataClass],
+        chunk_size: int = JSONL_CHUNK_SIZE,
+        **dumps_kwargs: Any,
+    ) -> int:
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "w", encoding="utf-8") as fp:
+                return self.write_jsonl(fp, dataclasses, chunk_size, **dumps_kwargs)
+        count = 0
+        iterator = iter(dataclasses)
+        while True:
+            chunk = self.to_json_many(islice(iterator, chunk_size), **dumps_kwargs)
+            if not chunk:
+                return count
+            file.write("".join(f"{line}\n" for line in chunk))
+            count += len(chunk)
+
+    def iter_json_array(
+        self, file: PathOrFile, type_: Type[T], chunk_size: int = DEFAULT_CHUNK_SIZE, **loads_kwargs: Any
+    ) -> Iterator[T]:
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, encoding="utf-8") as fp:
+                yield from self.iter_json_array(fp, type_, chunk_size, **loads_kwargs)
+            return
+        decoder_class = loads_kwargs.pop("cls", json.JSONDecoder)
+        items = iter_array_items(file, chunk_size, decoder_class(**loads_kwargs))
+        serializer = self._serializer_factory.get_serializer(type_)
+        for item in items:
+            yield serializer.deserialize(item, type_)
+
+
+_default_mapper: Optional[DataClassMapper] = None
+_default_mapper_lock = threading.Lock()
+
+
+def get_default_mapper() -> DataClassMapper:
+    global _default_mapper
+    mapper = _default_mapper
+    if mapper is None:
+        with _default_mapper_lock:
+            if _default_mapper is None:
+                _default_mapper = DataClassMapper()
+            mapper = _default_mapper
+    return mapper
+
+
+def set_default_mapper(mapper: Optional[DataClassMapper]):
+    global _default_mapper
+    _default_mapper = mapper
+
+
+def jsondataclass(cls: Optional[type] = None, *, mapper: Optional[DataClassMapper] = None, **dataclass_kwargs: Any):
+    """Class decorator that applies ``dataclass`` (unless ``cls`` already is one) and prepares ``cls`` with ``mapper``
+    (the default mapper by default).
+
+    Classes with forward references that can not be resolved yet are prepared by the next ``mapper.prepare()`` call.
+    """
+
+    def wrap(cls: type) -> type:
+        if "__dataclass_fields__" not in cls.__dict__:
+            cls = dataclass(cls, **dataclass_kwargs)  # type: ignore
+        target = mapper if mapper is not None else get_default_mapper()
+        try:
+            target._serializer_factory.prepare(cls)
+        except NameError:
+            target._pending_types.append(cls)
+        return cls
+
+    return wrap if cls is None else wrap(cls)
+
+
+def from_json(json_: JsonInput, type_: Type[T], projection: Optional[ProjectionSpec] = None, **loads_kwargs: Any) -> T:
+    return get_default_mapper().from_json(json_, type_, projection, **loads_kwargs)
 
 
 def to_json(dataclass: DataClass, **dumps_kwargs: Any) -> str:
-    mapper = DataClassMapper()
-    return mapper.to_json(dataclass, **dumps_kwargs)
+    return get_default_mapper().to_json(dataclass, **dumps_kwargs)
+
+
+def dump(dataclass: DataClass, fp: IO[str], **dumps_kwargs: Any):
+    get_default_mapper().dump(dataclass, fp, **dumps_kwargs)
 
 
-def from_dict(data: dict, type_: Type[T]) -> T:
-    mapper = DataClassMapper()
-    return mapper.from_dict(data, type_)
+def from_dict(data: dict, type_: Type[T], projection: Optional[ProjectionSpec] = None) -> T:
+    return get_default_mapper().from_dict(data, type_, projection)
+
+
+def to_json_bytes(dataclass: DataClass, **dumps_kwargs: Any) -> bytes:
+    return get_default_mapper().to_json_bytes(dataclass, **dumps_kwargs)
 
 
 def to_dict(dataclass: DataClass) -> dict:
-    mapper = DataClassMapper()
-    return mapper.to_dict(dataclass)
+    return get_default_mapper().to_dict(dataclass)
+
+
+def iter_jsonl(file: PathOrFile, type_: Type[T], **loads_kwargs: Any) -> Iterator[T]:
+    return get_default_mapper().iter_jsonl(file, type_, **loads_kwargs)
+
+
+def iter_json_array(file: PathOrFile, type_: Type[T], **loads_kwargs: Any) -> Iterator[T]:
+    return get_default_mapper().iter_json_array(file, type_, **loads_kwargs)
+
+
+def write_jsonl(file: PathOrFile, dataclasses: Iterable[DataClass], **dumps_kwargs: Any) -> int:
+    return get_default_mapper().write_jsonl(file, dataclasses, **dumps_kwargs)
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Tuple, Type
+
+from .field import JsonField
+from .typing import DataClass
+
+if TYPE_CHECKING:
+    from .serializers import Serializer  # noqa: F401
+
+__all__ = ["FieldPlan", "DataClassPlan"]
+
+
+@dataclass
+class FieldPlan:
+    name: str
+    serialized_name: str
+    type: Type
+    optional: bool
+    serializer: "Serializer"
+    field: JsonField
+
+    @property
+    def default_value(self) -> Any:
+        return self.field.default_value
+
+
+@dataclass
+class DataClassPlan:
+    type: Type[DataClass]
+    fields: Tuple[FieldPlan, ...]
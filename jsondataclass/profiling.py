@@ -0,0 +1,145 @@
+import copy
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .serializers import Serializer  # noqa: F401
+
+__all__ = ["Profiler", "ProfileEntry"]
+
+_METHODS = ("serialize", "deserialize", "serialize_many", "deserialize_many")
+
+# ("field", dataclass, field name) or ("serializer", serializer class).
+Key = Tuple[Any, ...]
+
+
+@dataclass
+class ProfileEntry:
+    kind: str
+    name: str
+    target: Any
+    calls: int
+    total_time: float
+    self_time: float
+
+
+class Profiler:
+    """Call counts and times of serializers per ``(dataclass, field)`` and per ``Serializer`` class.
+
+    Serializers are instrumented by replacing their methods on the instance, so nothing is checked on the hot path
+    of mappers without a profiler. Total time includes nested calls (counted once for recursive calls), self time
+    excludes nested calls of the same kind.
+    """
+
+    def __init__(self, timer: Callable[[], float] = time.perf_counter):
+        self._timer = timer
+        self._stats: Dict[Key, List[float]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def instrument(self, serializer: "Serializer") -> "Serializer":
+        """Record calls of ``serializer`` under its class."""
+        self._wrap(serializer, (("serializer", type(serializer)),))
+        return serializer
+
+    def instrument_field(self, serializer: "Serializer", dataclass: type, field_name: str) -> "Serializer":
+        """Return a copy of ``serializer`` that records calls under its class and the field."""
+        serializer = copy.copy(serializer)
+        self._wrap(serializer, (("field", dataclass, field_name), ("serializer", type(serializer))))
+        return serializer
+
+    def _wrap(self, serializer: "Serializer", keys: Tuple[Key, ...]):
+        for name in _METHODS:
+            method = getattr(type(serializer), name).__get__(serializer)
+            setattr(serializer, name, self._timed(method, keys))
+
+    def _timed(self, method: Callable, keys: Tuple[Key, ...]) -> Callable:
+        def timed(*args: Any) -> Any:
+            frames = self._enter(keys)
+            try:
+                return method(*args)
+            finally:
+                self._exit(frames)
+
+        return timed
+
+    def _state(self) -> Tuple[Dict[str, list], Dict[Key, int]]:
+        # Per thread stacks of [key, start, time of nested calls] frames and recursion depths.
+        local = self._local
+        try:
+            return local.stacks, local.active
+        except AttributeError:
+            local.stacks, local.active = {"field": [], "serializer": []}, {}
+            return local.stacks, local.active
+
+    def _enter(self, keys: Tuple[Key, ...]) -> list:
+        stacks, active = self._state()
+        start = self._timer()
+        frames = []
+        for key in keys:
+            frame = [key, start, 0.0]
+            stacks[key[0]].append(frame)
+            active[key] = active.get(key, 0) + 1
+            frames.append(frame)
+        return frames
+
+    def _exit(self, frames: list):
+        end = self._timer()
+        stacks, active = self._state()
+        with self._lock:
+            for key, start, nested in frames:
+                stack = stacks[key[0]]
+                stack.pop()
+                elapsed = end - start
+                if stack:
+                    stack[-1][2] += elapsed
+                active[key] -= 1
+                stats = self._stats.get(key)
+                if stats is None:
+                    stats = self._stats[key] = [0, 0.0, 0.0]
+                stats[0] += 1
+                if not active[key]:
+                    stats[1] += elapsed
+                stats[2] += elapsed - nested
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+
+    def report(self, sort_by: str = "total_time", kind: Optional[str] = None) -> List[ProfileEntry]:
+        """Entries sorted by ``sort_by`` (``calls``, ``total_time`` or ``self_time``), descending."""
+        with self._lock:
+            stats = list(self._stats.items())
+        entries = []
+        for key, (calls, total_time, self_time) in stats:
+            if kind is not None and key[0] != kind:
+                continue
+            if key[0] == "field":
+                name, target = f"{key[1].__qualname__}.{key[2]}", key[1:]
+            else:
+                name, target = key[1].__qualname__, key[1]
+            entries.append(ProfileEntry(key[0], name, target, int(calls), total_time, self_time))
+        entries.sort(key=lambda entry: getattr(entry, sort_by), reverse=True)
+        return entries
+
+    def to_dict(self, sort_by: str = "total_time") -> Dict[str, Dict[str, Dict[str, float]]]:
+        """``{kind: {name: {"calls": ..., "total_time": ..., "self_time": ...}}}`` in ``report`` order."""
+        result: Dict[str, Dict[str, Dict[str, float]]] = {"field": {}, "serializer": {}}
+        for entry in self.report(sort_by):
+            result[entry.kind][entry.name] = {
+                "calls": entry.calls,
+                "total_time": entry.total_time,
+                "self_time": entry.self_time,
+            }
+        return result
+
+    def format(self, sort_by: str = "total_time", limit: Optional[int] = None) -> str:
+        lines = [f"{'kind':<10} {'name':<40} {'calls':>10} {'total ms':>10} {'self ms':>10}"]
+        for entry in self.report(sort_by)[:limit]:
+            lines.append(
+                f"{entry.kind:<10} {entry.name:<40} {entry.calls:>10}"
+                f" {entry.total_time * 1000:>10.3f} {entry.self_time * 1000:>10.3f}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,198 @@
+from dataclasses import MISSING, is_dataclass
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Type, Union
+
+from .plan import FieldPlan
+from .serializers import (
+    DataClassSerializer,
+    DictSerializer,
+    ListSerializer,
+    OptionalSerializer,
+    SerializerFactory,
+    TupleSerializer,
+)
+from .utils import extract_generic_args, extract_optional_type, is_generic, type_check
+
+__all__ = ["NOT_LOADED", "ProjectionSpec", "compile_projection", "normalize_projection"]
+
+# Dotted paths (``"items[*].sku"``), nested specs (``{"items": {"sku": True}}``) or collections of both.
+ProjectionSpec = Any
+
+# Field name -> None for the whole field or the projection of its value.
+Projection = FrozenSet[Tuple[str, Any]]
+
+_CONTAINER_SERIALIZERS = (DataClassSerializer, OptionalSerializer, ListSerializer, TupleSerializer, DictSerializer)
+
+
+class _NotLoaded:
+    def __repr__(self) -> str:
+        return "NOT_LOADED"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return _get_not_loaded, ()
+
+
+NOT_LOADED: Any = _NotLoaded()
+"""Value of fields without defaults that were not selected by a projection."""
+
+
+def _get_not_loaded() -> Any:
+    # Unpickled sentinels are the module's one.
+    return NOT_LOADED
+
+
+def _get_node(tree: Dict[str, Any], path: str) -> Optional[Dict[str, Any]]:
+    # The sub tree of ``path``, None when the whole field is already selected.
+    names = path.split(".")
+    for name in names:
+        if name.endswith("[*]"):
+            name = name[:-3]
+        if not name.isidentifier():
+            raise ValueError(f"Invalid projection path {path!r}")
+        if name in tree and tree[name] is None:
+            return None
+        tree = tree.setdefault(name, {})
+    return tree
+
+
+def _add_path(tree: Dict[str, Any], path: str):
+    parent, _, name = path.rpartition(".")
+    node = _get_node(tree, parent) if parent else tree
+    if node is not None:
+        _get_node(node, name)
+        node[name[:-3] if name.endswith("[*]") else name] = None
+
+
+def _parse(spec: ProjectionSpec, tree: Dict[str, Any]):
+    if isinstance(spec, str):
+        _add_path(tree, spec)
+    elif isinstance(spec, dict):
+        for path, sub_spec in spec.items():
+            if sub_spec is True or sub_spec is None:
+                _add_path(tree, path)
+                continue
+            node = _get_node(tree, path)
+            if node is not None:
+                _parse(sub_spec, node)
+    else:
+        for item in spec:
+            _parse(item, tree)
+
+
+def _freeze(tree: Dict[str, Any]) -> Projection:
+    return frozenset((name, None if value is None else _freeze(value)) for name, value in tree.items())
+
+
+def normalize_projection(spec: ProjectionSpec) -> Projection:
+    """Convert a projection spec to a hashable tree of ``(field name, sub projection or None)`` pairs."""
+    tree: Dict[str, Any] = {}
+    _parse(spec, tree)
+    return _freeze(tree)
+
+
+def _compile_dataclass(
+    serializer_factory: SerializerFactory, type_: Type, projection: Projection, decoders: Dict[tuple, Callable]
+) -> Callable[[Any], Any]:
+    key = (type_, projection)
+    if key in decoders:
+        # Recursive dataclasses reach their own projection while it is being compiled.
+        return lambda data: decoders[key](data)
+    decoders[key] = None  # type: ignore
+    plan = serializer_factory.get_dataclass_plan(type_)
+    names = {field.name for field in plan.fields}
+    for name, _ in projection:
+        if name not in names:
+            raise ValueError(f"{type_.__name__} has no field {name!r}")
+    selected = dict(projection)
+    fields: List[Tuple[str, str, bool, Any, Callable[[Any], Any]]] = []
+    defaults: Dict[str, Any] = {}
+    factories: List[Tuple[str, Callable[[], Any]]] = []
+    for field in plan.fields:
+        if field.name in selected:
+            sub_projection = selected[field.name]
+            if sub_projection is None:
+                decode = _field_decoder(field)
+            else:
+                if type(field.serializer) not in _CONTAINER_SERIALIZERS:
+                    raise ValueError(f"Can not project into {type_.__name__}.{field.name} of type {field.type!r}")
+                decode = _compile(serializer_factory, field.type, sub_projection, decoders)
+            fields.append((field.name, field.serialized_name, field.optional, field, decode))
+        elif field.field.default_factory is not MISSING:
+            factories.append((field.name, field.field.default_factory))
+        elif field.field.default is not MISSING:
+            defaults[field.name] = field.field.default
+        else:
+            defaults[field.name] = None if field.optional else NOT_LOADED
+
+    def decode_dataclass(data: Any) -> Any:
+        type_check(data, dict)
+        init_kwargs = dict(defaults)
+        for name, factory in factories:
+            init_kwargs[name] = factory()
+        for name, serialized_name, optional, field, decode in fields:
+            value = data.get(serialized_name)
+            if value is None and not optional:
+                value = field.default_value
+            init_kwargs[name] = decode(value)
+        return type_(**init_kwargs)
+
+    decoders[key] = decode_dataclass
+    return decode_dataclass
+
+
+def _field_decoder(field: FieldPlan) -> Callable[[Any], Any]:
+    deserialize = field.serializer.deserialize
+    field_type = field.type
+    return lambda value: deserialize(value, field_type)
+
+
+def _compile(
+    serializer_factory: SerializerFactory, type_: Type, projection: Projection, decoders: Dict[tuple, Callable]
+) -> Callable[[Any], Any]:
+    serializer_class = type(serializer_factory.get_serializer(type_))
+    if serializer_class is DataClassSerializer and is_dataclass(type_):
+        return _compile_dataclass(serializer_factory, type_, projection, decoders)
+    if serializer_class is OptionalSerializer:
+        decode_optional = _compile(serializer_factory, extract_optional_type(type_), projection, decoders)
+        return lambda data: None if data is None else decode_optional(data)
+    args: Tuple[Any, ...] = ()
+    if is_generic(type_):
+        args = extract_generic_args(type_)
+    if serializer_class is ListSerializer and args:
+        decode_item = _compile(serializer_factory, args[0], projection, decoders)
+
+        def decode_list(data: Any) -> list:
+            type_check(data, list)
+            return [decode_item(item) for item in data]
+
+        return decode_list
+    if serializer_class is TupleSerializer and len(args) == 2 and args[1] is Ellipsis:
+        decode_tuple_item = _compile(serializer_factory, args[0], projection, decoders)
+
+        def decode_tuple(data: Any) -> tuple:
+            type_check(data, list)
+            return tuple(decode_tuple_item(item) for item in data)
+
+        return decode_tuple
+    if serializer_class is DictSerializer and len(args) == 2:
+        key_type = args[0]
+        decode_value = _compile(serializer_factory, args[1], projection, decoders)
+
+        def decode_dict(data: Any) -> dict:
+            type_check(data, dict)
+            return {key_type(key): decode_value(value) for key, value in data.items()}
+
+        return decode_dict
+    raise ValueError(f"Can not project into {type_!r}")
+
+
+def compile_projection(
+    serializer_factory: SerializerFactory, type_: Type, projection: Union[Projection, ProjectionSpec]
+) -> Callable[[Any], Any]:
+    """Build a decoder of ``type_`` that only deserializes the fields selected by ``projection``.
+
+    Other fields get their declared defaults, ``None`` for optionals or ``NOT_LOADED``. ``type_`` may be a dataclass
+    or a list, tuple, dict or optional of dataclasses, in which case the projection applies to every item.
+    """
+    if not isinstance(projection, frozenset) or not all(isinstance(item, tuple) for item in projection):
+        projection = normalize_projection(projection)
+    return _compile(serializer_factory, type_, projection, {})
@@ -1,13 +1,40 @@
 import sys
+import threading
 from abc import abstractmethod
+from dataclasses import MISSING, dataclass, is_dataclass
 from datetime import date, datetime, time, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Collection, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from .config import Config
-from .exceptions import JsonDataClassError, TupleTypeMatchError, UnionTypeMatchError
-from .field import JsonField
+from .dateformat import get_formatter, get_parser
+from .exceptions import (
+    DiscriminatorMatchError,
+    FrozenMapperError,
+    JsonDataClassError,
+    TupleTypeMatchError,
+    UnionTypeMatchError,
+)
+from .field import Discriminator, JsonField
+from .plan import DataClassPlan, FieldPlan
 from .typing import DataClass
 from .utils import (
     dataclass_fields,
@@ -18,10 +45,25 @@ from .utils import (
     is_generic,
     is_optional,
     is_subclass,
+    is_union,
     type_check,
 )
 
+if TYPE_CHECKING:
+    from .codecache import CodeCache  # noqa: F401
+    from .profiling import Profiler  # noqa: F401
+    from .validation import Validator  # noqa: F401
+
 T = TypeVar("T")
+V = TypeVar("V")
+
+_NoneType: type = type(None)
+
+# Enums without their own _missing_ hook only accept the values of their members.
+_ENUM_MISSING = vars(Enum)["_missing_"].__func__
+
+# (member type, serializer, predicate, instance type) of an untagged union member.
+_Candidate = Tuple[Type, "Serializer", Optional[Callable[[Any], bool]], Optional[type]]
 
 
 class Serializer(Generic[T]):
@@ -41,6 +83,17 @@ class Serializer(Generic[T]):
     def deserialize(self, data: Any, type_: Type[T]) -> T:
         ...
 
+    def serialize_many(self, data: Iterable[T]) -> List[Any]:
+        serialize = self.serialize
+        return [serialize(item) for item in data]
+
+    def deserialize_many(self, data: Iterable[Any], type_: Type[T]) -> List[T]:
+        deserialize = self.deserialize
+        return [deserialize(item, type_) for item in data]
+
+    def prepare(self, type_: Type[T]):
+        """Build the per-type state of this serializer ahead of the first call."""
+
 
 class DefaultSerializer(Serializer[Any]):
     def serialize(self, data: Any) -> Any:
@@ -49,6 +102,17 @@ class DefaultSerializer(Serializer[Any]):
     def deserialize(self, data: Any, type_: Type) -> Any:
         return data
 
+    # The bulk shortcuts skip serialize/deserialize, so subclasses that override them go through the items one by one.
+    def serialize_many(self, data: Iterable[Any]) -> List[Any]:
+        if type(self) is not DefaultSerializer:
+            return super().serialize_many(data)
+        return list(data)
+
+    def deserialize_many(self, data: Iterable[Any], type_: Type) -> List[Any]:
+        if type(self) is not DefaultSerializer:
+            return super().deserialize_many(data, type_)
+        return list(data)
+
 
 class StringSerializer(Serializer[str]):
     def serialize(self, data: Any) -> str:
@@ -57,12 +121,35 @@ class StringSerializer(Serializer[str]):
     def deserialize(self, data: Any, type_: Type[str]) -> str:
         return str(data)
 
+    def serialize_many(self, data: Iterable[Any]) -> List[str]:
+        if type(self) is not StringSerializer:
+            return super().serialize_many(data)
+        return list(map(str, data))
+
+    def deserialize_many(self, data: Iterable[Any], type_: Type[str]) -> List[str]:
+        if type(self) is not StringSerializer:
+            return super().deserialize_many(data, type_)
+        return list(map(str, data))
+
+
+def _get_homogeneous_serializer(data: Collection, serializer_factory: "SerializerFactory") -> Optional["Serializer"]:
+    types = set(map(type, data))
+    if len(types) == 1:
+        return serializer_factory.get_serializer(types.pop())
+    return None
+
 
 def _serialize_collection(data: Collection, serializer_factory: "SerializerFactory") -> List:
+    serializer = _get_homogeneous_serializer(data, serializer_factory)
+    if serializer is not None:
+        return serializer.serialize_many(data)
     result = []
+    type_ = None
     for value in data:
-        serializer = serializer_factory.get_serializer(type(value))
-        result.append(serializer.serialize(value))
+        if type(value) is not type_:
+            type_ = type(value)
+            serializer = serializer_factory.get_serializer(type_)
+        result.append(serializer.serialize(value))  # type: ignore
     return result
 
 
@@ -76,7 +163,7 @@ class ListSerializer(Serializer[List]):
             return list(data)
         item_type = extract_generic_args(type_)[0]
         serializer = self._serializer_factory.get_serializer(item_type)
-        return list(serializer.deserialize(item, item_type) for item in data)
+        return serializer.deserialize_many(data, item_type)
 
 
 class TupleSerializer(Serializer[Tuple]):
@@ -90,7 +177,7 @@ class TupleSerializer(Serializer[Tuple]):
         if len(item_types) == 2 and item_types[1] is Ellipsis:
             item_type = item_types[0]
             serializer = self._serializer_factory.get_serializer(item_type)
-            return tuple(serializer.deserialize(item, item_type) for item in data)
+            return tuple(serializer.deserialize_many(data, item_type))
         if len(item_types) != len(data):
             raise TupleTypeMatchError(type_, data)
         result = []
@@ -108,18 +195,22 @@ class TupleSerializer(Serializer[Tuple]):
 
 class DictSerializer(Serializer[Dict]):
     def serialize(self, data: Dict) -> Dict:
-        result = {}
-        for key, value in data.items():
-            serializer = self._serializer_factory.get_serializer(type(value))
-            result[str(key)] = serializer.serialize(value)
-        return result
+        serializer = _get_homogeneous_serializer(data.values(), self._serializer_factory)
+        if serializer is None:
+            return dict(zip(map(str, data), _serialize_collection(data.values(), self._serializer_factory)))
+        if type(serializer) is DefaultSerializer and all(type(key) is str for key in data):
+            return dict(data)
+        serialize = serializer.serialize
+        return {str(key): serialize(value) for key, value in data.items()}
 
     def _deserialize_generic(self, data: dict, type_: Type[Dict]) -> Dict:
         key_type, value_type = extract_generic_args(type_)[:2]
         if isinstance(key_type, TypeVar):  # type: ignore
             return dict(data)
         serializer = self._serializer_factory.get_serializer(value_type)
-        return dict((key_type(key), serializer.deserialize(value, value_type)) for key, value in data.items())
+        if key_type is str and type(serializer) is DefaultSerializer and all(type(key) is str for key in data):
+            return dict(data)
+        return dict(zip(map(key_type, data), serializer.deserialize_many(data.values(), value_type)))
 
     def deserialize(self, data: dict, type_: Type[Dict]) -> Dict:
         type_check(data, dict)
@@ -129,34 +220,54 @@ class DictSerializer(Serializer[Dict]):
 
 
 class DataClassSerializer(Serializer[DataClass]):
-    def _get_field_serializer(self, field: JsonField):
-        serializer_class = field.serializer_class
-        if serializer_class is None:
-            serializer_class = self._serializer_factory.get_serializer_class(field.type)
-        return self._serializer_factory.create_serializer(
-            serializer_class, *field.serializer_args, **field.serializer_kwargs
-        )
-
     def serialize(self, data: DataClass) -> dict:
+        return self._get_encoder(type(data))(data)
+
+    def deserialize(self, data: dict, type_: Type[DataClass]) -> DataClass:
+        return self._get_decoder(type_)(data)
+
+    def serialize_many(self, data: Iterable[DataClass]) -> List[dict]:
+        result = []
+        type_ = encoder = None
+        for item in data:
+            if type(item) is not type_:
+                type_ = type(item)
+                encoder = self._get_encoder(type_)
+            result.append(encoder(item))  # type: ignore
+        return result
+
+    def deserialize_many(self, data: Iterable[Any], type_: Type[DataClass]) -> List[DataClass]:
+        decoder = self._get_decoder(type_)
+        return [decoder(item) for item in data]
+
+    def _get_encoder(self, type_: Type[DataClass]) -> Callable[[DataClass], dict]:
+        if self._config.compiled:
+            return self._serializer_factory.get_dataclass_encoder(type_)
+        return partial(self._serialize_plan, self._serializer_factory.get_dataclass_plan(type_))
+
+    def _get_decoder(self, type_: Type[DataClass]) -> Callable[[Any], DataClass]:
+        if self._config.compiled:
+            return self._serializer_factory.get_dataclass_decoder(type_)
+        return partial(self._deserialize_plan, self._serializer_factory.get_dataclass_plan(type_))
+
+    def _serialize_plan(self, plan: DataClassPlan, data: DataClass) -> dict:
         result = {}
-        for field in dataclass_fields(type(data)):
+        for field in plan.fields:
             value = getattr(data, field.name)
-            if value is None and not is_optional(field.type):
+            if value is None and not field.optional:
                 value = field.default_value
-            serializer = self._get_field_serializer(field)
-            result[field.serialized_name] = serializer.serialize(value)
+            result[field.serialized_name] = field.serializer.serialize(value)
         return result
 
-    def deserialize(self, data: dict, type_: Type[DataClass]) -> DataClass:
+    def _deserialize_plan(self, plan: DataClassPlan, data: dict) -> DataClass:
         type_check(data, dict)
         init_kwargs = {}
-        for field in dataclass_fields(type_):
+        for field in plan.fields:
             value = data.get(field.serialized_name)
-            if value is None and not is_optional(field.type):
+            if value is None and not field.optional:
                 value = field.default_value
-            serializer = self._get_field_serializer(field)
-            init_kwargs[field.name] = serializer.deserialize(value, field.type)
-        return type_(**init_kwargs)
+            init_kwargs[field.name] = field.serializer.deserialize(value, field.type)
+        return plan.type(**init_kwargs)
 
 
 class OptionalSerializer(Serializer[Optional[Type]]):
@@ -175,77 +286,163 @@ class OptionalSerializer(Serializer[Optional[Type]]):
 
 
 class UnionSerializer(Serializer[Union[Type]]):
+    def __init__(
+        self,
+        serializer_factory: "SerializerFactory" = None,
+        config: Config = None,
+        discriminator: Optional[Discriminator] = None,
+    ):
+        super().__init__(serializer_factory, config)
+        self.discriminator = discriminator
+        # Keyed by the members, unions that only differ in their order are equal but are tried in their own order.
+        self._tables: Dict[Tuple[Type, ...], Dict[Any, Tuple[Type, Serializer]]] = {}
+        self._candidates: Dict[Tuple[Type, ...], List[_Candidate]] = {}
+        self._tags: Dict[Type, Any] = {}
+        if discriminator is not None and discriminator.mapping is not None:
+            for tag, member_type in reversed(list(discriminator.mapping.items())):
+                self._tags[member_type] = tag
+
     def serialize(self, data: Any) -> Any:
         serializer = self._serializer_factory.get_serializer(type(data))
-        return serializer.serialize(data)
+        result = serializer.serialize(data)
+        if self._tags and type(result) is dict and self.discriminator.key not in result:  # type: ignore
+            tag = self._tags.get(type(data), MISSING)
+            if tag is not MISSING:
+                result[self.discriminator.key] = tag  # type: ignore
+        return result
 
-    def deserialize(self, data: Any, type_: Type[Union[Type]]) -> Union[Type]:
-        union_types = extract_union_types(type_)
-        if type(data) in union_types:
-            union_type = type(data)
-            serializer = self._serializer_factory.get_serializer(union_type)
+    def deserialize(self, data: Any, type_: Type[Union[Type]]) -> Any:
+        if self.discriminator is not None:
+            if data is None and _NoneType in extract_union_types(type_):
+                return None
+            union_type, serializer = self.get_tagged_member(data, type_)
             return serializer.deserialize(data, union_type)
-        for union_type in union_types:
+        candidates = self.get_candidates(type_)
+        data_type = type(data)
+        for union_type, serializer, predicate, instance_type in candidates:
+            if union_type is data_type:
+                return serializer.deserialize(data, union_type)
+        for union_type, serializer, predicate, instance_type in candidates:
+            if predicate is not None and not predicate(data):
+                continue
             try:
-                serializer = self._serializer_factory.get_serializer(union_type)
                 value = serializer.deserialize(data, union_type)
-                if isinstance(value, union_type):
-                    return value
             except (TypeError, ValueError, JsonDataClassError):
-                pass
+                continue
+            if instance_type is None or isinstance(value, instance_type):
+                return value
         raise UnionTypeMatchError(type_, data)
 
-
-def _serialize_datetime(data: Union[datetime, date, time], format: Optional[str]) -> str:
-    if format is None:
-        return data.isoformat()
-    return data.strftime(format)
+    def get_candidates(self, type_: Type[Union[Type]]) -> List[_Candidate]:
+        """(member type, serializer, predicate, instance type) of every member of an untagged union."""
+        members: Tuple[Type, ...] = type_.__args__  # type: ignore
+        candidates = self._candidates.get(members)
+        if candidates is None:
+            candidates = []
+            for union_type in members:
+                serializer = self._serializer_factory.get_serializer(union_type)
+                instance_type = _get_instance_type(union_type)
+                predicate = _get_union_member_predicate(
+                    self._serializer_factory, union_type, serializer, instance_type
+                )
+                candidates.append((union_type, serializer, predicate, instance_type))
+            self._candidates[members] = candidates
+        return candidates
+
+    def get_tagged_member(self, data: Any, type_: Type[Union[Type]]) -> Tuple[Type, Serializer]:
+        members: Tuple[Type, ...] = type_.__args__  # type: ignore
+        table = self._tables.get(members)
+        if table is None:
+            table = self._tables[members] = self._build_table(type_)
+        try:
+            return table[data[self.discriminator.key]]  # type: ignore
+        except (KeyError, TypeError, IndexError):
+            raise DiscriminatorMatchError(type_, self.discriminator.key, data)  # type: ignore
+
+    def prepare(self, type_: Type[Union[Type]]):
+        if self.discriminator is None:
+            self.get_candidates(type_)
+            return
+        members: Tuple[Type, ...] = type_.__args__  # type: ignore
+        if members not in self._tables:
+            self._tables[members] = self._build_table(type_)
+
+    def _build_table(self, type_: Type[Union[Type]]) -> Dict[Any, Tuple[Type, Serializer]]:
+        union_types = extract_union_types(type_)
+        mapping: Optional[Dict[Any, Type]] = self.discriminator.mapping  # type: ignore
+        if mapping is None:
+            mapping = {}
+            for union_type in union_types:
+                if union_type is not _NoneType:
+                    mapping.setdefault(self._get_tag(union_type), union_type)
+        table: Dict[Any, Tuple[Type, Serializer]] = {}
+        for tag, union_type in mapping.items():
+            if union_type not in union_types:
+                raise TypeError(f"{union_type!r} is not a member of {type_!r}")
+            table[tag] = (union_type, self._serializer_factory.get_serializer(union_type))
+        return table
+
+    def _get_tag(self, type_: Type[DataClass]) -> Any:
+        key = self.discriminator.key  # type: ignore
+        if is_dataclass(type_):
+            for field in self._serializer_factory.get_dataclass_plan(type_).fields:
+                if field.serialized_name != key:
+                    continue
+                if field.field.default is not MISSING:
+                    return field.field.default
+                literal_values = _get_literal_values(field.type)
+                if literal_values is not None and len(literal_values) == 1:
+                    return literal_values[0]
+        raise TypeError(f"Cannot get discriminator {key!r} value of {type_!r}, use Discriminator.mapping")
 
 
 class DateTimeSerializerBase(Serializer[T]):
     _config_format_attr = NotImplemented
+    _value_type: Type = NotImplemented
 
     def __init__(
         self, serializer_factory: "SerializerFactory" = None, config: Config = None, format: Optional[str] = None
     ):
         super().__init__(serializer_factory, config)
         self._format: Optional[str] = format if format is not None else getattr(self._config, self._config_format_attr)
+        if self._format is not None:
+            self._parse = get_parser(self._format)
+            self._format_value = get_formatter(self._format, self._value_type)
+
+    def serialize(self, data: T) -> str:
+        if self._format is None:
+            return data.isoformat()  # type: ignore
+        return self._format_value(data)  # type: ignore
 
 
 class DateTimeSerializer(DateTimeSerializerBase[datetime]):
     _config_format_attr = "datetime_format"
-
-    def serialize(self, data: datetime) -> str:
-        return _serialize_datetime(data, self._format)
+    _value_type = datetime
 
     def deserialize(self, data: str, type_: Type[datetime]) -> datetime:
         if self._format is None:
             return datetime.fromisoformat(data)
-        return datetime.strptime(data, self._format)
+        return self._parse(data)
 
 
 class DateSerializer(DateTimeSerializerBase[date]):
     _config_format_attr = "date_format"
-
-    def serialize(self, data: date) -> str:
-        return _serialize_datetime(data, self._format)
+    _value_type = date
 
     def deserialize(self, data: str, type_: Type[date]) -> date:
         if self._format is None:
             return date.fromisoformat(data)
-        return datetime.strptime(data, self._format).date()
+        return self._parse(data).date()
 
 
 class TimeSerializer(DateTimeSerializerBase[time]):
     _config_format_attr = "time_format"
-
-    def serialize(self, data: time) -> str:
-        return _serialize_datetime(data, self._format)
+    _value_type = time
 
     def deserialize(self, data: str, type_: Type[time]) -> time:
         if self._format is None:
             return time.fromisoformat(data)
-        return datetime.strptime(data, self._format).time()
+        return self._parse(data).time()
 
 
 class TimestampSerializer(Serializer[datetime]):
@@ -266,11 +463,37 @@ class TimestampSerializer(Serializer[datetime]):
 
 
 class EnumSerializer(Serializer[Enum]):
+    def __init__(self, serializer_factory: "SerializerFactory" = None, config: Config = None):
+        super().__init__(serializer_factory, config)
+        self._members: Dict[Type[Enum], Dict[Any, Enum]] = {}
+
     def serialize(self, data: Enum) -> Any:
         return data.value
 
     def deserialize(self, data: Any, type_: Type[Enum]) -> Enum:
-        return type_(data)
+        members = self._members.get(type_)
+        if members is None:
+            members = self._members[type_] = _get_enum_members(type_)
+        try:
+            return members[data]
+        except (KeyError, TypeError):
+            # Unhashable values, _missing_ hooks and errors are left to the enum itself.
+            return type_(data)
+
+    def prepare(self, type_: Type[Enum]):
+        if type_ not in self._members:
+            self._members[type_] = _get_enum_members(type_)
+
+
+def _get_enum_members(type_: Type[Enum]) -> Dict[Any, Enum]:
+    members: Dict[Any, Enum] = {}
+    # __members__ includes aliases, they resolve to the canonical member with the same value.
+    for member in type_.__members__.values():
+        try:
+            members.setdefault(member.value, member)
+        except TypeError:
+            pass
+    return members
 
 
 class DecimalSerializer(Serializer[Decimal]):
@@ -281,6 +504,70 @@ class DecimalSerializer(Serializer[Decimal]):
         return Decimal(data)
 
 
+def _get_literal_values(type_: Type) -> Optional[Tuple[Any, ...]]:
+    if sys.version_info >= (3, 8):
+        from .utils import extract_literal_values, is_literal
+
+        if is_literal(type_):
+            return extract_literal_values(type_)
+    return None
+
+
+def _get_instance_type(type_: Type) -> Optional[type]:
+    instance_type = extract_generic_origin(type_) if is_generic(type_) else type_
+    try:
+        isinstance(None, instance_type)
+    except TypeError:
+        return None
+    return instance_type
+
+
+def _get_union_member_predicate(
+    serializer_factory: "SerializerFactory", type_: Type, serializer: Serializer, instance_type: Optional[type]
+) -> Optional[Callable[[Any], bool]]:
+    # A cheap check of the JSON value that rejects members whose deserialization is bound to fail.
+    serializer_class = type(serializer)
+    if serializer_class is DataClassSerializer:
+        required = [
+            field.serialized_name
+            for field in serializer_factory.get_dataclass_plan(type_).fields
+            if not field.optional and field.field.default is MISSING and field.field.default_factory is MISSING
+        ]
+        return lambda data: isinstance(data, dict) and all(data.get(key) is not None for key in required)
+    if serializer_class is DictSerializer:
+        return lambda data: isinstance(data, dict)
+    if serializer_class is ListSerializer:
+        return lambda data: isinstance(data, list)
+    if serializer_class is TupleSerializer:
+        item_types: Tuple[Any, ...] = ()
+        if is_generic(type_):
+            item_types = extract_generic_args(type_)
+        if item_types and item_types[-1] is not Ellipsis:
+            return lambda data: isinstance(data, list) and len(data) == len(item_types)
+        return lambda data: isinstance(data, list)
+    if serializer_class in (DateTimeSerializer, DateSerializer, TimeSerializer):
+        return lambda data: isinstance(data, str)
+    if serializer_class is TimestampSerializer:
+        return lambda data: isinstance(data, (int, float))
+    if serializer_class is DecimalSerializer:
+        return lambda data: isinstance(data, (int, float, str))
+    if serializer_class is EnumSerializer and getattr(type_._missing_, "__func__", None) is _ENUM_MISSING:
+        try:
+            values = frozenset(member.value for member in type_)
+        except TypeError:
+            return None
+        return lambda data: data in values if data.__hash__ is not None else False
+    literal_values = _get_literal_values(type_)
+    if literal_values is not None:
+        # Narrowed copies, the closures would see the Optional types.
+        literals: Tuple[Any, ...] = literal_values
+        return lambda data: data in literals
+    if serializer_class is DefaultSerializer and instance_type is not None:
+        class_: type = instance_type
+        return lambda data: isinstance(data, class_)
+    return None
+
+
 SERIALIZERS: tuple = (
     (DataClass, DataClassSerializer),
     (str, StringSerializer),
@@ -303,48 +590,475 @@ if sys.version_info >= (3, 8):
     from .exceptions import LiteralTypeMatchError
 
     class LiteralSerializer(Serializer):
+        def __init__(self, serializer_factory: "SerializerFactory" = None, config: Config = None):
+            super().__init__(serializer_factory, config)
+            # Keyed by id: hashing a Literal type hashes all of its values and costs more than the lookup itself.
+            self._values: Dict[int, Tuple[Type, FrozenSet, Tuple]] = {}
+
         def serialize(self, data: Any) -> Any:
             return data
 
         def deserialize(self, data: Any, type_: Type) -> Any:
-            literal_values = extract_literal_values(type_)
-            if data not in literal_values:
-                raise LiteralTypeMatchError(type_, data)
-            return data
+            values = self._values.get(id(type_))
+            if values is None or values[0] is not type_:
+                values = self._values[id(type_)] = (type_, *_get_literal_table(type_))
+            _, hashable_values, unhashable_values = values
+            try:
+                if data in hashable_values:
+                    return data
+            except TypeError:
+                pass
+            if unhashable_values and data in unhashable_values:
+                return data
+            raise LiteralTypeMatchError(type_, data)
+
+        def prepare(self, type_: Type):
+            values = self._values.get(id(type_))
+            if values is None or values[0] is not type_:
+                self._values[id(type_)] = (type_, *_get_literal_table(type_))
+
+    def _get_literal_table(type_: Type) -> Tuple[FrozenSet, Tuple]:
+        hashable_values = []
+        unhashable_values = []
+        for value in extract_literal_values(type_):
+            try:
+                hash(value)
+            except TypeError:
+                unhashable_values.append(value)
+            else:
+                hashable_values.append(value)
+        return frozenset(hashable_values), tuple(unhashable_values)
 
     SERIALIZERS += ((Literal, LiteralSerializer),)
 
 
+@dataclass
+class CacheInfo:
+    """Counters of a ``SerializerFactory`` since it was created.
+
+    Counters are updated without a lock, concurrent threads may lose a few increments.
+    """
+
+    serializer_hits: int
+    serializer_misses: int
+    serializer_class_hits: int
+    serializer_class_misses: int
+    serializers_created: int
+    plans_built: int
+    encoders_compiled: int
+    decoders_compiled: int
+    projections_compiled: int
+    invalidations: Dict[str, int]
+
+
 class SerializerFactory:
+    """Resolves and caches serializers, dataclass plans and compiled code.
+
+    A factory can be shared by any number of threads. The registry and the caches are dicts that are never mutated
+    once published: writers copy them, add the entry and replace the attribute under ``_lock``, so lookups never
+    take a lock and never see a partially built entry. Every invalidation bumps ``_generation``, and entries that were
+    computed before an invalidation are returned to their caller but not published.
+
+    Per-type memo tables inside serializers and helpers (``UnionSerializer`` tables and candidates, ``EnumSerializer``
+    members, ``LiteralSerializer`` values, the fields of ``Validator`` and ``DataClassEncoder``) are the exception:
+    they are mutated in place. Their entries are derived from the type alone, so concurrent first calls store equal
+    values, and a single dict store is atomic.
+    """
+
     def __init__(self, config: Optional[Config] = None):
         self._serializers: Dict[Type, Type[Serializer]] = dict(SERIALIZERS)
         if config is None:
             config = Config()
         self._config = config
+        config._add_factory(self)
+        self._resolved: Dict[Type, Type[Serializer]] = {}
+        self._plans: Dict[Type, DataClassPlan] = {}
+        self._type_serializers: Dict[Type, Serializer] = {}
+        self._serializer_instances: Dict[tuple, Serializer] = {}
+        self._encoders: Dict[Type, Callable[[DataClass], dict]] = {}
+        self._decoders: Dict[Type, Callable[[Any], DataClass]] = {}
+        self._projections: Dict[tuple, Callable[[Any], Any]] = {}
+        self._validator: Optional["Validator"] = None
+        self._frozen = False
+        self._profiler: Optional["Profiler"] = None
+        self._lock = threading.RLock()
+        self._generation = 0
+        # Placeholders of encoders and decoders being compiled, only accessed under the lock.
+        self._compiling: Dict[tuple, Callable[[Any], Any]] = {}
+        self._serializer_hits = 0
+        self._serializer_misses = 0
+        self._serializer_class_hits = 0
+        self._serializer_class_misses = 0
+        self._serializers_created = 0
+        self._plans_built = 0
+        self._encoders_compiled = 0
+        self._decoders_compiled = 0
+        self._projections_compiled = 0
+        self._invalidations: Dict[str, int] = {}
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(
+            self._serializer_hits,
+            self._serializer_misses,
+            self._serializer_class_hits,
+            self._serializer_class_misses,
+            self._serializers_created,
+            self._plans_built,
+            self._encoders_compiled,
+            self._decoders_compiled,
+            self._projections_compiled,
+            dict(self._invalidations),
+        )
+
+    @property
+    def profiler(self) -> Optional["Profiler"]:
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, profiler: Optional["Profiler"]):
+        # Serializers are instrumented when created, so existing ones are dropped even when frozen.
+        with self._lock:
+            self._profiler = profiler
+            self._reset_cache("profiler")
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    def freeze(self):
+        """Make ``register``, ``unregister`` and ``clear_cache`` raise ``FrozenMapperError``."""
+        with self._lock:
+            self._frozen = True
 
     def register(self, type_: Type, serializer_class: Type[Serializer]):
-        self._serializers[type_] = serializer_class
+        with self._lock:
+            self._check_not_frozen()
+            serializers = dict(self._serializers)
+            serializers[type_] = serializer_class
+            self._serializers = serializers
+            self._reset_cache("register")
 
     def unregister(self, type_: Type):
-        del self._serializers[type_]
+        with self._lock:
+            self._check_not_frozen()
+            serializers = dict(self._serializers)
+            del serializers[type_]
+            self._serializers = serializers
+            self._reset_cache("unregister")
+
+    def clear_cache(self, reason: str = "clear_cache"):
+        """Drop all cached serializers, plans and code, ``reason`` is counted in ``cache_info().invalidations``."""
+        with self._lock:
+            self._check_not_frozen()
+            self._reset_cache(reason)
+
+    def _check_not_frozen(self):
+        if self._frozen:
+            raise FrozenMapperError()
+
+    def _reset_cache(self, reason: str):
+        # Called under the lock after the registry or config changed, entries computed from the previous state fail
+        # the generation check in _publish.
+        self._generation += 1
+        self._invalidations[reason] = self._invalidations.get(reason, 0) + 1
+        self._resolved = {}
+        self._plans = {}
+        self._type_serializers = {}
+        self._serializer_instances = {}
+        self._encoders = {}
+        self._decoders = {}
+        self._projections = {}
+        self._validator = None
+
+    def _publish(self, cache_name: str, key: Any, value: V, generation: int) -> V:
+        """Add ``value`` computed at ``generation`` to a copy of the cache and return the cached entry of ``key``."""
+        with self._lock:
+            if generation != self._generation:
+                return value
+            cache = getattr(self, cache_name)
+            cached = cache.get(key)
+            if cached is not None:
+                # Another thread published the entry first, all callers share it.
+                return cached
+            cache = dict(cache)
+            cache[key] = value
+            setattr(self, cache_name, cache)
+        return value
 
     def create_serializer(self, serializer_class: Type[Serializer], *args, **kwargs) -> Serializer:
-        return serializer_class(self, self._config, *args, **kwargs)
+        serializer = serializer_class(self, self._config, *args, **kwargs)
+        self._serializers_created += 1
+        if self._profiler is not None:
+            self._profiler.instrument(serializer)
+        return serializer
 
     def get_serializer_class(self, type_: Type) -> Type[Serializer]:
+        try:
+            serializer_class = self._resolved[type_]
+        except KeyError:
+            pass
+        except TypeError:
+            self._serializer_class_misses += 1
+            return self._resolve_serializer_class(type_)
+        else:
+            self._serializer_class_hits += 1
+            return serializer_class
+        self._serializer_class_misses += 1
+        generation = self._generation
+        return self._publish("_resolved", type_, self._resolve_serializer_class(type_), generation)
+
+    def _resolve_serializer_class(self, type_: Type) -> Type[Serializer]:
         serializer_class = self._serializers.get(type_)
         if serializer_class:
             return serializer_class
         if is_generic(type_):
             type_ = extract_generic_origin(type_)
             return self.get_serializer_class(type_)
-        for t, serializer_class in self._serializers.items():
-            if is_subclass(type_, t):
+        for base in getattr(type_, "__mro__", ())[1:]:
+            serializer_class = self._serializers.get(base)
+            if serializer_class:
                 return serializer_class
+        serializer_class = self._resolve_virtual_base(type_)
+        if serializer_class:
+            return serializer_class
         if self._config.default_serializer_class is not None:
             return self._config.default_serializer_class
         return DefaultSerializer
 
+    def _resolve_virtual_base(self, type_: Type) -> Optional[Type[Serializer]]:
+        # Bases that are not in the MRO (e.g. ``DataClass`` or ABCs with ``register``/``__subclasshook__``).
+        # The most specific one wins, ties are broken by registration order.
+        serializers = self._serializers
+        bases = [t for t in serializers if is_subclass(type_, t)]
+        for base in bases:
+            if not any(other is not base and is_subclass(other, base) for other in bases):
+                return serializers[base]
+        return None
+
     def get_serializer(self, type_: Type) -> Serializer:
-        serializer_class = self.get_serializer_class(type_)
-        return self.create_serializer(serializer_class)
+        try:
+            serializer = self._type_serializers[type_]
+        except KeyError:
+            pass
+        except TypeError:
+            self._serializer_misses += 1
+            return self.create_serializer(self.get_serializer_class(type_))
+        else:
+            self._serializer_hits += 1
+            return serializer
+        self._serializer_misses += 1
+        generation = self._generation
+        discriminator = self._config.discriminators.get(type_)
+        if discriminator is not None:
+            serializer = self._get_serializer_instance(UnionSerializer, discriminator=discriminator)
+        else:
+            serializer = self._get_serializer_instance(self.get_serializer_class(type_))
+        return self._publish("_type_serializers", type_, serializer, generation)
+
+    def get_field_serializer(self, field: JsonField) -> Serializer:
+        serializer_class = field.serializer_class
+        kwargs = field.serializer_kwargs
+        if field.discriminator is not None:
+            if serializer_class is None:
+                serializer_class = UnionSerializer
+            kwargs = dict(kwargs, discriminator=field.discriminator)
+        elif serializer_class is None:
+            if self._config.discriminators and field.type in self._config.discriminators:
+                return self.get_serializer(field.type)
+            serializer_class = self.get_serializer_class(field.type)
+        return self._get_serializer_instance(serializer_class, *field.serializer_args, **kwargs)
+
+    def _get_serializer_instance(self, serializer_class: Type[Serializer], *args, **kwargs) -> Serializer:
+        try:
+            key = (serializer_class, args, frozenset(kwargs.items()))
+            return self._serializer_instances[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return self.create_serializer(serializer_class, *args, **kwargs)
+        generation = self._generation
+        return self._publish(
+            "_serializer_instances", key, self.create_serializer(serializer_class, *args, **kwargs), generation
+        )
+
+    def get_dataclass_plan(self, type_: Type[DataClass]) -> DataClassPlan:
+        plan = self._plans.get(type_)
+        if plan is None:
+            generation = self._generation
+            plan = self._build_dataclass_plan(type_)
+            self._plans_built += 1
+            plan = self._publish("_plans", type_, plan, generation)
+        return plan
+
+    def _build_dataclass_plan(self, type_: Type[DataClass]) -> DataClassPlan:
+        fields = tuple(
+            FieldPlan(
+                name=field.name,
+                serialized_name=field.serialized_name,
+                type=field.type,
+                optional=is_optional(field.type),
+                serializer=self._get_plan_field_serializer(type_, field),
+                field=field,
+            )
+            for field in dataclass_fields(type_)
+        )
+        return DataClassPlan(type_, fields)
+
+    def _get_plan_field_serializer(self, type_: Type[DataClass], field: JsonField) -> Serializer:
+        serializer = self.get_field_serializer(field)
+        if self._profiler is not None:
+            serializer = self._profiler.instrument_field(serializer, type_, field.name)
+        return serializer
+
+    def get_validator(self) -> "Validator":
+        """The validator of this factory, its per-dataclass state is dropped with the other caches."""
+        validator = self._validator
+        if validator is None:
+            from .validation import Validator
+
+            validator = self._validator = Validator(self)
+        return validator
+
+    def get_code_cache(self) -> Optional["CodeCache"]:
+        if self._config.code_cache_dir is None:
+            return None
+        from .codecache import get_code_cache
+
+        return get_code_cache(self._config.code_cache_dir)
+
+    def get_dataclass_encoder(self, type_: Type[DataClass]) -> Callable[[DataClass], dict]:
+        encoder = self._encoders.get(type_)
+        if encoder is None:
+            from .compiler import compile_encoder
+
+            encoder = self._compile("_encoders", type_, compile_encoder, self.get_dataclass_encoder)
+        return encoder
+
+    def get_dataclass_decoder(self, type_: Type[DataClass]) -> Callable[[Any], DataClass]:
+        decoder = self._decoders.get(type_)
+        if decoder is None:
+            from .compiler import compile_decoder
+
+            decoder = self._compile("_decoders", type_, compile_decoder, self.get_dataclass_decoder)
+        return decoder
+
+    def _compile(
+        self,
+        cache_name: str,
+        type_: Type[DataClass],
+        compile_: Callable[["SerializerFactory", Type[DataClass]], Callable[[Any], Any]],
+        getter: Callable[[Type[DataClass]], Callable[[Any], Any]],
+    ) -> Callable[[Any], Any]:
+        # Compiled under the lock so that every type is compiled once and no other thread sees the placeholder.
+        with self._lock:
+            code = getattr(self, cache_name).get(type_)
+            if code is not None:
+                return code
+            key = (cache_name, type_)
+            code = self._compiling.get(key)
+            if code is not None:
+                return code
+            # Recursive dataclasses reach the code while it is being compiled.
+            self._compiling[key] = lambda data: getter(type_)(data)
+            try:
+                code = compile_(self, type_)
+            finally:
+                del self._compiling[key]
+            if cache_name == "_encoders":
+                self._encoders_compiled += 1
+            else:
+                self._decoders_compiled += 1
+            return self._publish(cache_name, type_, code, self._generation)
+
+    def get_projection_decoder(self, type_: Type, projection: Any) -> Callable[[Any], Any]:
+        try:
+            key = (type_, projection)
+            decoder = self._projections.get(key)
+        except TypeError:
+            from .projection import normalize_projection
+
+            key = (type_, normalize_projection(projection))
+            decoder = self._projections.get(key)
+        if decoder is None:
+            from .projection import compile_projection
+
+            generation = self._generation
+            decoder = compile_projection(self, type_, key[1])
+            self._projections_compiled += 1
+            decoder = self._publish("_projections", key, decoder, generation)
+        return decoder
+
+    def prepare(self, *types: Type):
+        """Resolve serializers, plans and (in compiled mode) code of ``types`` and every type reachable from them."""
+        seen: Set[Any] = set()
+        stack = list(types)
+        while stack:
+            type_ = stack.pop()
+            try:
+                if type_ in seen:
+                    continue
+                seen.add(type_)
+            except TypeError:
+                continue
+            serializer = self.get_serializer(type_)
+            serializer.prepare(type_)
+            if isinstance(serializer, DataClassSerializer) and is_dataclass(type_):
+                if self._config.compiled:
+                    self.get_dataclass_encoder(type_)
+                    self.get_dataclass_decoder(type_)
+                for field in self.get_dataclass_plan(type_).fields:
+                    field.serializer.prepare(field.type)
+                    stack.append(field.type)
+            elif is_generic(type_) and _get_literal_values(type_) is None:
+                stack.extend(arg for arg in extract_generic_args(type_) if isinstance(arg, type) or is_generic(arg))
+
+    def explain(self, type_: Type) -> str:
+        """Describe the resolved serializer of every field of ``type_`` and of the dataclasses reachable from it."""
+        lines = []
+        seen: Set[Any] = set()
+        queue = [type_]
+        while queue:
+            type_ = queue.pop(0)
+            if type_ in seen:
+                continue
+            seen.add(type_)
+            lines.append(f"{_type_name(type_)} -> {type(self.get_serializer(type_)).__qualname__}")
+            if not is_dataclass(type_):
+                queue.extend(_nested_dataclasses(type_))
+                continue
+            for field in self.get_dataclass_plan(type_).fields:
+                line = f"  {field.name} ({field.serialized_name!r}): {_type_name(field.type)}"
+                line += f" -> {type(field.serializer).__qualname__}"
+                if field.field.discriminator is not None:
+                    line += f" [discriminator {field.field.discriminator.key!r}]"
+                lines.append(line)
+                queue.extend(_nested_dataclasses(field.type))
+        return "\n".join(lines)
+
+
+def _type_name(type_: Any) -> str:
+    # Names without module prefixes, "typing.List[app.models.Item]" -> "List[Item]", literal values are kept as is.
+    if type_ is Ellipsis:
+        return "..."
+    if not is_generic(type_):
+        if isinstance(type_, type):
+            return type_.__qualname__
+        return getattr(type_, "_name", None) or repr(type_)
+    literal_values = _get_literal_values(type_)
+    if literal_values is not None:
+        return f"Literal[{', '.join(map(repr, literal_values))}]"
+    args = getattr(type_, "__args__", None)
+    if is_optional(type_):
+        return f"Optional[{_type_name(args[1] if args[0] is _NoneType else args[0])}]"
+    name = "Union" if is_union(type_) else getattr(type_, "_name", None) or _type_name(type_.__origin__)
+    if not args or getattr(type_, "_special", False):
+        return name
+    return f"{name}[{', '.join(map(_type_name, args))}]"
+
+
+def _nested_dataclasses(type_: Any) -> List[Type]:
+    if is_dataclass(type_):
+        return [type_]
+    if not is_generic(type_) or _get_literal_values(type_) is not None:
+        return []
+    return [nested for arg in extract_generic_args(type_) for nested in _nested_dataclasses(arg)]
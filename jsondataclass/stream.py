@@ -0,0 +1,96 @@
+import codecs
+import json
+import re
+from typing import IO, Any, Iterator, Optional
+
+__all__ = ["iter_array_items"]
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Longest text a decode error, or a decoded number, can be followed by when the element merely continues in the next
+# chunk: a prefix of "-Infinity", of a surrogate pair escape or of an exponent.
+_MAX_LOOKAHEAD = 16
+
+
+class _Buffer:
+    def __init__(self, file: IO, chunk_size: int):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._decoder: Optional[codecs.IncrementalDecoder] = None
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size: Optional[int] = None) -> bool:
+        if self.eof:
+            return False
+        chunk = self._read(size or self._chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        pos, self.pos = self.pos, 0
+        self.text = self.text[pos:] + chunk
+        return True
+
+    def _read(self, size: int) -> str:
+        while True:
+            chunk = self._file.read(size)
+            if not isinstance(chunk, (bytes, bytearray)):
+                return chunk
+            if self._decoder is None:
+                self._decoder = codecs.getincrementaldecoder("utf-8")()
+            text = self._decoder.decode(chunk, final=not chunk)
+            if text or not chunk:
+                return text
+
+    def grow(self) -> bool:
+        # Read at least as much as is already buffered, so a value spanning many chunks is parsed O(log n) times.
+        return self.fill(max(self._chunk_size, len(self.text) - self.pos))
+
+    def peek(self) -> str:
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()  # type: ignore
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {chars!r}", self.text, self.pos)
+        self.pos += 1
+        return char
+
+
+def iter_array_items(
+    file: IO, chunk_size: int = DEFAULT_CHUNK_SIZE, decoder: Optional[json.JSONDecoder] = None
+) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array read from ``file`` chunk by chunk."""
+    if decoder is None:
+        decoder = json.JSONDecoder()
+    buffer = _Buffer(file, chunk_size)
+    buffer.expect("[")
+    if buffer.peek() == "]":
+        buffer.pos += 1
+        return
+    while True:
+        buffer.peek()
+        try:
+            value, end = decoder.raw_decode(buffer.text, buffer.pos)
+        except json.JSONDecodeError as e:
+            # An unterminated string may end in a later chunk, any other error followed by more text is final, so a
+            # malformed element does not make the rest of the file buffered.
+            final = e.pos + _MAX_LOOKAHEAD < len(buffer.text) and not e.msg.startswith("Unterminated string")
+            if not final and buffer.grow():
+                continue
+            raise
+        if end + _MAX_LOOKAHEAD >= len(buffer.text) and not isinstance(value, (str, list, dict)) and buffer.grow():
+            # A number or literal near the end of the buffer may continue in the next chunk, "-0." decodes as -0.
+            continue
+        buffer.pos = end
+        yield value
+        if buffer.expect(",]") == "]":
+            return
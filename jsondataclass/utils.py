@@ -44,9 +44,9 @@ def extract_generic_origin(type_: Type[Any]) -> Any:
 
 
 def type_check(data: Any, type_: Type):
-    from .exceptions import WrongTypeError
-
     if not isinstance(data, type_):
+        from .exceptions import WrongTypeError
+
         raise WrongTypeError(type_, data)
 
 
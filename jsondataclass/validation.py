@@ -0,0 +1,204 @@
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+from .exceptions import TupleTypeMatchError, UnionTypeMatchError, ValidationError, WrongTypeError
+from .plan import DataClassPlan, FieldPlan
+from .serializers import (
+    DataClassSerializer,
+    DefaultSerializer,
+    DictSerializer,
+    ListSerializer,
+    OptionalSerializer,
+    Serializer,
+    SerializerFactory,
+    StringSerializer,
+    TupleSerializer,
+    UnionSerializer,
+)
+from .utils import extract_generic_args, extract_optional_type, extract_union_types, is_generic
+
+__all__ = ["Validator"]
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z")
+
+# Serializers that accept any value.
+_NO_CHECK = (DefaultSerializer, StringSerializer)
+
+# Paths are built lazily as (parent, key) pairs and only formatted for errors.
+Path = Optional[Tuple[Any, Any]]
+
+
+class _Stop(Exception):
+    pass
+
+
+class _Errors(List[ValidationError]):
+    def __init__(self, all_errors: bool):
+        super().__init__()
+        self.all_errors = all_errors
+
+
+def _format_path(path: Path) -> str:
+    keys = []
+    while path is not None:
+        path, key = path
+        keys.append(key)
+    result = "$"
+    for key in reversed(keys):
+        if isinstance(key, int):
+            result += f"[{key}]"
+        elif _IDENTIFIER.match(key):
+            result += f".{key}"
+        else:
+            result += f"[{key!r}]"
+    return result
+
+
+class Validator:
+    """Check that data would be accepted by ``from_dict`` without building the result.
+
+    Dataclasses, collections, optionals and unions are walked, other values are checked by their serializers.
+    """
+
+    def __init__(self, serializer_factory: SerializerFactory):
+        self._serializer_factory = serializer_factory
+        self._fields: Dict[Type, Tuple[DataClassPlan, List[Tuple[str, FieldPlan, Optional[Serializer]]]]] = {}
+        self._methods: Dict[Type[Serializer], Callable[[Any, Type, Any, Path, _Errors], None]] = {
+            DataClassSerializer: self._validate_dataclass,
+            ListSerializer: self._validate_list,
+            TupleSerializer: self._validate_tuple,
+            DictSerializer: self._validate_dict,
+            OptionalSerializer: self._validate_optional,
+            UnionSerializer: self._validate_union,
+        }
+
+    def validate(self, data: Any, type_: Type, all_errors: bool = False) -> List[ValidationError]:
+        errors = _Errors(all_errors)
+        try:
+            self._validate(data, type_, self._serializer_factory.get_serializer(type_), None, errors)
+        except _Stop:
+            pass
+        return list(errors)
+
+    def _error(self, path: Path, error: Exception, errors: _Errors):
+        errors.append(ValidationError(_format_path(path), error))
+        if not errors.all_errors:
+            raise _Stop
+
+    def _validate(self, data: Any, type_: Type, serializer: Serializer, path: Path, errors: _Errors):
+        method = self._methods.get(type(serializer))
+        if method is not None:
+            method(data, type_, serializer, path, errors)
+        elif type(serializer) not in _NO_CHECK:
+            try:
+                serializer.deserialize(data, type_)
+            except Exception as e:
+                self._error(path, e, errors)
+
+    def _get_fields(self, type_: Type) -> List[Tuple[str, FieldPlan, Optional[Serializer]]]:
+        plan = self._serializer_factory.get_dataclass_plan(type_)
+        entry = self._fields.get(type_)
+        if entry is None or entry[0] is not plan:
+            fields = [
+                (field.serialized_name, field, None if type(field.serializer) in _NO_CHECK else field.serializer)
+                for field in plan.fields
+            ]
+            entry = self._fields[type_] = (plan, fields)
+        return entry[1]
+
+    def _validate_dataclass(self, data: Any, type_: Type, serializer: Serializer, path: Path, errors: _Errors):
+        if not isinstance(data, dict):
+            self._error(path, WrongTypeError(dict, data), errors)
+            return
+        for name, field, field_serializer in self._get_fields(type_):
+            value = data.get(name)
+            if value is None and not field.optional:
+                try:
+                    value = field.default_value
+                except Exception as e:
+                    self._error((path, name), e, errors)
+                    continue
+            if field_serializer is not None:
+                self._validate(value, field.type, field_serializer, (path, name), errors)
+
+    def _validate_items(self, data: list, item_type: Type, path: Path, errors: _Errors):
+        serializer = self._serializer_factory.get_serializer(item_type)
+        if type(serializer) in _NO_CHECK:
+            return
+        for i, item in enumerate(data):
+            self._validate(item, item_type, serializer, (path, i), errors)
+
+    def _validate_list(self, data: Any, type_: Type, serializer: Serializer, path: Path, errors: _Errors):
+        if not isinstance(data, list):
+            self._error(path, WrongTypeError(list, data), errors)
+        elif is_generic(type_) and extract_generic_args(type_):
+            self._validate_items(data, extract_generic_args(type_)[0], path, errors)
+
+    def _validate_tuple(self, data: Any, type_: Type, serializer: Serializer, path: Path, errors: _Errors):
+        if not isinstance(data, list):
+            self._error(path, WrongTypeError(list, data), errors)
+            return
+        item_types: Tuple[Any, ...] = ()
+        if is_generic(type_):
+            item_types = extract_generic_args(type_)
+        if len(item_types) == 2 and item_types[1] is Ellipsis:
+            self._validate_items(data, item_types[0], path, errors)
+        elif item_types and len(item_types) != len(data):
+            self._error(path, TupleTypeMatchError(type_, data), errors)
+        else:
+            for i, (item, item_type) in enumerate(zip(data, item_types)):
+                item_serializer = self._serializer_factory.get_serializer(item_type)
+                self._validate(item, item_type, item_serializer, (path, i), errors)
+
+    def _validate_dict(self, data: Any, type_: Type, serializer: Serializer, path: Path, errors: _Errors):
+        if not isinstance(data, dict):
+            self._error(path, WrongTypeError(dict, data), errors)
+            return
+        if not is_generic(type_):
+            return
+        key_type, value_type = extract_generic_args(type_)[:2]
+        if isinstance(key_type, TypeVar):  # type: ignore
+            return
+        value_serializer = self._serializer_factory.get_serializer(value_type)
+        check_values = type(value_serializer) not in _NO_CHECK
+        for key, value in data.items():
+            if key_type is not str:
+                try:
+                    key_type(key)
+                except Exception as e:
+                    self._error((path, str(key)), e, errors)
+                    continue
+            if check_values:
+                self._validate(value, value_type, value_serializer, (path, str(key)), errors)
+
+    def _validate_optional(self, data: Any, type_: Type, serializer: Serializer, path: Path, errors: _Errors):
+        if data is not None:
+            optional_type = extract_optional_type(type_)
+            self._validate(data, optional_type, self._serializer_factory.get_serializer(optional_type), path, errors)
+
+    def _validate_union(self, data: Any, type_: Type, serializer: UnionSerializer, path: Path, errors: _Errors):
+        if serializer.discriminator is not None:
+            if data is None and type(None) in extract_union_types(type_):
+                return
+            try:
+                union_type, member_serializer = serializer.get_tagged_member(data, type_)
+            except Exception as e:
+                self._error(path, e, errors)
+                return
+            self._validate(data, union_type, member_serializer, path, errors)
+            return
+        candidates = serializer.get_candidates(type_)
+        for union_type, member_serializer, predicate, instance_type in candidates:
+            if union_type is type(data):
+                self._validate(data, union_type, member_serializer, path, errors)
+                return
+        for union_type, member_serializer, predicate, instance_type in candidates:
+            if predicate is not None and not predicate(data):
+                continue
+            member_errors = _Errors(False)
+            try:
+                self._validate(data, union_type, member_serializer, path, member_errors)
+            except _Stop:
+                continue
+            return
+        self._error(path, UnionTypeMatchError(type_, data), errors)
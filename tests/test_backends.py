@@ -0,0 +1,37 @@
+import pytest
+
+from jsondataclass.backends import JsonBackend, OrjsonBackend, StdlibBackend, get_backend
+
+
+@pytest.mark.parametrize("data", ['{"foo": [1, "a"]}', b'{"foo": [1, "a"]}', bytearray(b'{"foo": [1, "a"]}')])
+def test_stdlib_backend_loads(data):
+    backend = StdlibBackend()
+    assert backend.loads(data) == {"foo": [1, "a"]}
+    if not isinstance(data, str):
+        assert backend.loads(memoryview(data)) == {"foo": [1, "a"]}
+
+
+def test_stdlib_backend_dumps():
+    backend = StdlibBackend()
+    assert backend.dumps({"foo": 1}) == '{"foo": 1}'
+    assert backend.dumps({"foo": 1}, separators=(",", ":")) == '{"foo":1}'
+    assert backend.dumps_bytes({"foo": "é"}, ensure_ascii=False) == '{"foo": "é"}'.encode("utf-8")
+
+
+def test_orjson_backend():
+    pytest.importorskip("orjson")
+    backend = OrjsonBackend()
+    assert backend.loads(memoryview(b'{"foo": 1}')) == {"foo": 1}
+    assert backend.dumps({"foo": 1}) == '{"foo":1}'
+    assert backend.dumps_bytes({"foo": 1}) == b'{"foo":1}'
+
+
+def test_get_backend():
+    assert isinstance(get_backend(), StdlibBackend)
+    assert isinstance(get_backend("json"), StdlibBackend)
+    assert isinstance(get_backend("auto"), JsonBackend)
+
+
+def test_get_backend_unknown():
+    with pytest.raises(ValueError):
+        get_backend("foo")
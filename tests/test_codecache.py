@@ -0,0 +1,99 @@
+import marshal
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+import pytest
+
+from jsondataclass.codecache import CodeCache, get_code_cache
+from jsondataclass.config import Config
+from jsondataclass.mapper import DataClassMapper
+
+
+@dataclass
+class Item:
+    sku: str
+    created: datetime
+
+
+@dataclass
+class Order:
+    id: int
+    items: List[Item]
+    parent: Optional[int] = None
+
+
+SOURCE = "def f():\n    return 1\n"
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / "cache")
+
+
+def test_compile(cache_dir):
+    cache = CodeCache(cache_dir)
+    code = cache.compile(SOURCE, "<test>")
+    assert cache.compile(SOURCE, "<test>") is code
+    assert len(os.listdir(cache_dir)) == 1
+    namespace = {}
+    exec(code, namespace)
+    assert namespace["f"]() == 1
+
+
+def test_loaded_from_disk(cache_dir):
+    CodeCache(cache_dir).compile(SOURCE, "<test>")
+    code = CodeCache(cache_dir).compile(SOURCE, "<test>")
+    assert code.co_filename == "<test>"
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_key_depends_on_source(cache_dir):
+    cache = CodeCache(cache_dir)
+    cache.compile(SOURCE, "<test>")
+    cache.compile(SOURCE.replace("1", "2"), "<test>")
+    cache.compile(SOURCE, "<other>")
+    assert len(os.listdir(cache_dir)) == 3
+
+
+def test_corrupted_entry_rebuilt(cache_dir):
+    CodeCache(cache_dir).compile(SOURCE, "<test>")
+    (name,) = os.listdir(cache_dir)
+    with open(os.path.join(cache_dir, name), "wb") as fp:
+        fp.write(b"garbage")
+    namespace = {}
+    exec(CodeCache(cache_dir).compile(SOURCE, "<test>"), namespace)
+    assert namespace["f"]() == 1
+    with open(os.path.join(cache_dir, name), "rb") as fp:
+        assert marshal.loads(fp.read()).co_filename == "<test>"
+
+
+def test_unwritable_directory(tmp_path):
+    path = tmp_path / "file"
+    path.write_text("")
+    namespace = {}
+    exec(CodeCache(str(path / "cache")).compile(SOURCE, "<test>"), namespace)
+    assert namespace["f"]() == 1
+
+
+def test_clear(cache_dir):
+    cache = CodeCache(cache_dir)
+    cache.compile(SOURCE, "<test>")
+    cache.clear()
+    assert os.listdir(cache_dir) == []
+
+
+def test_get_code_cache(cache_dir):
+    assert get_code_cache(cache_dir) is get_code_cache(cache_dir)
+
+
+def test_compiled_mapper(cache_dir):
+    data = {"id": 1, "items": [{"sku": "a", "created": "2020-01-01T00:00:00"}], "parent": None}
+    order = Order(1, [Item("a", datetime(2020, 1, 1))])
+    for _ in range(2):
+        get_code_cache(cache_dir)._codes.clear()
+        mapper = DataClassMapper(config=Config(compiled=True, code_cache_dir=cache_dir))
+        assert mapper.from_dict(data, Order) == order
+        assert mapper.to_dict(order) == data
+    assert len(os.listdir(cache_dir)) == 4
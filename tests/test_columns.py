@@ -0,0 +1,97 @@
+from array import array
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import List, Optional
+
+import pytest
+
+from jsondataclass.exceptions import MissingDefaultValueError
+from jsondataclass.field import jsonfield
+from jsondataclass.mapper import DataClassMapper
+
+
+@dataclass
+class Tag:
+    name: str
+
+
+@dataclass
+class Row:
+    id: int
+    score: float
+    active: bool
+    created: datetime
+    day: date
+    name: str = jsonfield("Name")
+    parent: Optional[int] = None
+    tags: List[Tag] = field(default_factory=list)
+
+
+ROWS = [
+    Row(1, 0.5, True, datetime(2020, 1, 1, 12, 30, 0, 5), date(2020, 1, 1), "a", None, [Tag("x")]),
+    Row(2, 1.5, False, datetime(1960, 6, 1), date(1960, 6, 1), "b", 1),
+]
+
+
+@pytest.fixture
+def mapper():
+    return DataClassMapper()
+
+
+def test_to_columns_arrays(mapper):
+    columns = mapper.to_columns(ROWS, Row, use_numpy=False)
+    assert list(columns) == ["id", "score", "active", "created", "day", "Name", "parent", "tags"]
+    assert columns["id"] == array("q", [1, 2])
+    assert columns["score"] == array("d", [0.5, 1.5])
+    assert columns["active"] == [True, False]
+    assert columns["created"] == array("q", [1577881800000005, -302486400000000])
+    assert columns["day"] == array("q", [18262, -3501])
+    assert columns["Name"] == ["a", "b"]
+    assert columns["parent"] == [None, 1]
+    assert columns["tags"] == [[{"name": "x"}], []]
+    assert mapper.from_columns(columns, Row) == ROWS
+
+
+def test_to_columns_numpy(mapper):
+    numpy = pytest.importorskip("numpy")
+    columns = mapper.to_columns(ROWS, Row, use_numpy=True)
+    assert columns["id"].dtype == numpy.int64
+    assert columns["score"].dtype == numpy.float64
+    assert columns["active"].dtype == numpy.bool_
+    assert columns["created"].dtype == numpy.dtype("datetime64[us]")
+    assert columns["day"].dtype == numpy.dtype("datetime64[D]")
+    assert columns["Name"] == ["a", "b"]
+    assert mapper.from_columns(columns, Row) == ROWS
+
+
+def test_to_columns_fallback_to_serialized_values(mapper):
+    rows = [Row(2 ** 70, 0.5, True, datetime(2020, 1, 1, tzinfo=timezone.utc), date(2020, 1, 1), "a")]
+    columns = mapper.to_columns(rows, Row, use_numpy=False)
+    assert columns["id"] == [2 ** 70]
+    assert columns["created"] == ["2020-01-01T00:00:00+00:00"]
+    assert mapper.from_columns(columns, Row) == rows
+
+
+def test_from_columns_lists(mapper):
+    columns = {
+        "id": [1],
+        "score": [0.5],
+        "active": [True],
+        "created": ["2020-01-01T00:00:00"],
+        "day": ["2020-01-01"],
+        "Name": ["a"],
+    }
+    assert mapper.from_columns(columns, Row) == [Row(1, 0.5, True, datetime(2020, 1, 1), date(2020, 1, 1), "a")]
+
+
+def test_from_columns_errors(mapper):
+    with pytest.raises(ValueError):
+        mapper.from_columns({"id": [1], "score": [1.0, 2.0]}, Row)
+    with pytest.raises(MissingDefaultValueError):
+        mapper.from_columns({"id": [1]}, Row)
+
+
+def test_empty_columns(mapper):
+    columns = mapper.to_columns([], Row, use_numpy=False)
+    assert columns["id"] == array("q")
+    assert mapper.from_columns(columns, Row) == []
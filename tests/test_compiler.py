@@ -0,0 +1,156 @@
+import inspect
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, List, Optional, Type
+
+import pytest
+
+from jsondataclass.compiler import compile_decoder, compile_encoder
+from jsondataclass.config import Config
+from jsondataclass.exceptions import MissingDefaultValueError, WrongTypeError
+from jsondataclass.field import jsonfield
+from jsondataclass.mapper import DataClassMapper
+from jsondataclass.serializers import Serializer, SerializerFactory
+from jsondataclass.utils import set_forward_refs
+from tests import test_mapper
+
+
+class CompiledMapping:
+    def setup(self):
+        super().setup()
+        self._mapper.compiled = True
+
+
+for _name, _test_class in inspect.getmembers(test_mapper, inspect.isclass):
+    if issubclass(_test_class, test_mapper.BaseTestMapping) and not inspect.isabstract(_test_class):
+        _compiled_name = "TestCompiled" + _name[4:]
+        globals()[_compiled_name] = type(_compiled_name, (CompiledMapping, _test_class), {})
+
+
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+@dataclass
+class Item:
+    sku: str
+    created: datetime
+    color: Color
+    tags: List[str]
+
+
+@dataclass
+class Order:
+    id: int
+    items: List[Item]
+    shipped: Optional[date] = None
+    note: str = jsonfield("Note", default="")
+
+
+def test_compile_encoder():
+    factory = SerializerFactory()
+    encode = compile_encoder(factory, Order)
+    order = Order(1, [Item("a", datetime(2010, 1, 1), Color.RED, ["x"])], date(2010, 1, 2))
+    assert encode(order) == {
+        "id": 1,
+        "items": [{"sku": "a", "created": "2010-01-01T00:00:00", "color": "red", "tags": ["x"]}],
+        "shipped": "2010-01-02",
+        "Note": "",
+    }
+
+
+def test_compile_decoder():
+    factory = SerializerFactory()
+    decode = compile_decoder(factory, Order)
+    data = {"id": 1, "items": [{"sku": "a", "created": "2010-01-01T00:00:00", "color": "red", "tags": ["x"]}]}
+    assert decode(data) == Order(1, [Item("a", datetime(2010, 1, 1), Color.RED, ["x"])])
+
+
+def test_compile_decoder_wrong_type():
+    decode = compile_decoder(SerializerFactory(), Order)
+    with pytest.raises(WrongTypeError):
+        decode([])
+    with pytest.raises(WrongTypeError):
+        decode({"id": 1, "items": {}})
+
+
+def test_compile_decoder_missing_field():
+    decode = compile_decoder(SerializerFactory(), Order)
+    with pytest.raises(MissingDefaultValueError):
+        decode({"items": []})
+
+
+def test_compiled_datetime_format():
+    factory = SerializerFactory(Config(datetime_format="%m/%d/%y %H:%M:%S"))
+    item = Item("a", datetime(2010, 1, 1), Color.BLUE, [])
+    data = compile_encoder(factory, Item)(item)
+    assert data["created"] == "01/01/10 00:00:00"
+    assert compile_decoder(factory, Item)(data) == item
+
+
+def test_compiled_recursive_dataclass():
+    @dataclass
+    class Node:
+        value: int
+        children: List["Node"]
+
+    set_forward_refs(Node, {"Node": Node})
+    mapper = DataClassMapper(config=Config(compiled=True))
+    node = Node(1, [Node(2, []), Node(3, [Node(4, [])])])
+    data = mapper.to_dict(node)
+    assert data == {
+        "value": 1,
+        "children": [{"value": 2, "children": []}, {"value": 3, "children": [{"value": 4, "children": []}]}],
+    }
+    assert mapper.from_dict(data, Node) == node
+
+
+def test_compiled_registered_serializer():
+    class UpperStringSerializer(Serializer[str]):
+        def serialize(self, data: str) -> str:
+            return data.upper()
+
+        def deserialize(self, data: str, type_: Type[str]) -> str:
+            return data.upper()
+
+    mapper = DataClassMapper(config=Config(compiled=True))
+    mapper.register_serializer(str, UpperStringSerializer)
+    item = Item("a", datetime(2010, 1, 1), Color.RED, ["x"])
+    data = mapper.to_dict(item)
+    assert data["sku"] == "A"
+    assert data["tags"] == ["X"]
+    assert mapper.from_dict(data, Item).sku == "A"
+
+
+def test_compiled_nested_subclass_instance():
+    @dataclass
+    class Base:
+        foo: int
+
+    @dataclass
+    class Child(Base):
+        bar: int
+
+    @dataclass
+    class Data:
+        nested: Base
+
+    mapper = DataClassMapper(config=Config(compiled=True))
+    assert mapper.to_dict(Data(Child(1, 2))) == {"nested": {"foo": 1, "bar": 2}}
+
+
+def test_compiled_any_items():
+    @dataclass
+    class Data:
+        items: List[Any]
+        value: Optional[Any] = None
+        objects: Optional[List[object]] = None
+
+    created = datetime(2020, 1, 1)
+    instance = Data([created, 1], created, [created])
+    expected = DataClassMapper().to_dict(instance)
+    iso = "2020-01-01T00:00:00"
+    assert expected == {"items": [iso, 1], "value": iso, "objects": [iso]}
+    assert DataClassMapper(config=Config(compiled=True)).to_dict(instance) == expected
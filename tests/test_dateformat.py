@@ -0,0 +1,86 @@
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+
+from jsondataclass.dateformat import get_formatter, get_parser, get_timezone
+
+FORMATS = [
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%m/%d/%y %H:%M:%S",
+    "%m/%d/%y",
+    "%H:%M",
+    "%y/%m/%d %H:%M:%S",
+    "%I:%M %p",
+    "%Y%m%d%H%M%S",
+    "%d.%m.%Y  %H:%M",
+    "100%% [%Y]",
+    "%Y-%m-%dT%H:%M:%SZ",
+]
+
+VALUES = [
+    datetime(2020, 1, 2, 3, 4, 5, 6),
+    datetime(1969, 12, 31, 23, 59, 59, 999999, tzinfo=timezone.utc),
+    datetime(2068, 6, 15, 12, 0, tzinfo=timezone(timedelta(hours=-5, minutes=-30))),
+    datetime(2000, 2, 29, 0, 30, tzinfo=timezone(timedelta(hours=1, seconds=1, microseconds=1))),
+    datetime(999, 1, 1),
+]
+
+
+def result(func, *args):
+    try:
+        return func(*args)
+    except ValueError:
+        return ValueError
+
+
+@pytest.mark.parametrize("format", FORMATS)
+@pytest.mark.parametrize("value", VALUES)
+def test_formatter(format, value):
+    assert get_formatter(format, datetime)(value) == value.strftime(format)
+    assert get_formatter(format, date)(value.date()) == value.date().strftime(format)
+    assert get_formatter(format, time)(value.timetz()) == value.timetz().strftime(format)
+
+
+@pytest.mark.parametrize("format", FORMATS)
+@pytest.mark.parametrize("value", VALUES)
+def test_parser(format, value):
+    text = value.strftime(format)
+    for data in (text, text.lower(), text[:-1], text + "0", " " + text, text.replace(" ", "   ")):
+        expected = result(datetime.strptime, data, format)
+        parsed = result(get_parser(format), data)
+        assert parsed == expected
+        if isinstance(expected, datetime):
+            assert parsed.tzinfo == expected.tzinfo
+
+
+@pytest.mark.parametrize("offset", ["+01:30", "+0130", "-013045", "-01:30:45.123", "+01:3045", "Z", "z", "+1"])
+def test_parser_offsets(offset):
+    assert result(get_parser("%z"), offset) == result(datetime.strptime, offset, "%z")
+
+
+def test_parser_fallback():
+    assert get_parser("%j %Y")("032 2020") == datetime(2020, 2, 1)
+    assert get_parser("%H %I")("13 01") == datetime.strptime("13 01", "%H %I")
+    with pytest.raises(ValueError):
+        get_parser("%Y %")("2020 ")
+
+
+def test_formatter_fallback():
+    value = datetime(2020, 2, 1)
+    assert get_formatter("%j %a", datetime)(value) == "032 Sat"
+
+    class SubDateTime(datetime):
+        pass
+
+    assert get_formatter("%H", date)(SubDateTime(2020, 1, 1, 5)) == "05"
+
+
+def test_parser_type_error():
+    with pytest.raises(TypeError):
+        get_parser("%Y")(2020)
+
+
+def test_get_timezone():
+    assert get_timezone("+01:00") is get_timezone("+01:00")
+    assert get_timezone("+0100") == timezone(timedelta(hours=1))
+    assert get_timezone("Z") == timezone.utc
@@ -0,0 +1,89 @@
+import io
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+import pytest
+
+from jsondataclass.encoder import FLUSH_PARTS, DataClassEncoder
+from jsondataclass.field import jsonfield
+from jsondataclass.mapper import DataClassMapper
+from jsondataclass.serializers import Serializer, SerializerFactory
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class PointSerializer(Serializer[Point]):
+    def serialize(self, data: Point) -> dict:
+        return {"x": data.x, "y": data.y}
+
+    def deserialize(self, data: dict, type_: Type[Point]) -> Point:
+        return Point(data["x"], data["y"])
+
+
+@dataclass
+class Nested:
+    name: str = jsonfield("Name")
+    point: Point = jsonfield(serializer_class=PointSerializer)
+
+
+@dataclass
+class Data:
+    id: int
+    ratio: float
+    flags: Tuple[bool, ...]
+    items: List[Nested]
+    mapping: Dict[int, Union[int, datetime]]
+    maybe: Optional[Nested]
+    anything: Any
+    text: str = 'é"\n'
+
+
+def make_data() -> Data:
+    return Data(
+        id=1,
+        ratio=0.1,
+        flags=(True, False),
+        items=[Nested("a", Point(1, 2)), Nested("b", Point(3.5, None))],
+        mapping={1: 2, 3: datetime(2010, 1, 1)},
+        maybe=None,
+        anything={"a": [1, None, float("nan")]},
+    )
+
+
+def encode(obj: Any, **kwargs) -> str:
+    fp = io.StringIO()
+    DataClassEncoder(SerializerFactory(), fp, **kwargs).encode(obj)
+    return fp.getvalue()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, {"ensure_ascii": False}, {"separators": (",", ":")}, {"ensure_ascii": False, "separators": (",", ":")}],
+)
+def test_encode_matches_to_json(kwargs):
+    data = make_data()
+    assert encode(data, **kwargs) == DataClassMapper().to_json(data, **kwargs)
+
+
+def test_encode_not_allow_nan():
+    with pytest.raises(ValueError):
+        encode(make_data(), allow_nan=False)
+
+
+def test_encode_flushes():
+    writes = []
+
+    class Writer:
+        def write(self, data):
+            writes.append(data)
+
+    data = [Nested(str(i), Point(i, i)) for i in range(FLUSH_PARTS)]
+    DataClassEncoder(SerializerFactory(), Writer()).encode(data)  # type: ignore
+    assert len(writes) > 1
+    assert json.loads("".join(writes)) == [{"Name": str(i), "point": {"x": i, "y": i}} for i in range(FLUSH_PARTS)]
@@ -0,0 +1,224 @@
+import pickle
+import threading
+from dataclasses import FrozenInstanceError, dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+import pytest
+
+from jsondataclass import materialize
+from jsondataclass.exceptions import MissingDefaultValueError, WrongTypeError
+from jsondataclass.field import jsonfield
+from jsondataclass.lazy import LazyDecoder, is_lazy
+from jsondataclass.mapper import DataClassMapper
+
+
+@dataclass
+class Item:
+    sku: str
+    created: datetime
+
+
+@dataclass
+class Customer:
+    id: int
+    name: str
+    tags: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Order:
+    id: int
+    customer_name: str = jsonfield("Customer")
+    items: List[Item] = field(default_factory=list)
+    customer: Optional[Customer] = None
+
+
+@dataclass(frozen=True)
+class FrozenOrder:
+    id: int
+    items: List[Item]
+
+
+@dataclass
+class Slotted:
+    __slots__ = ("id", "items")
+    id: int
+    items: List[Item]
+
+
+@dataclass
+class Required:
+    id: int
+    items: List[Item]
+
+
+DATA = {
+    "id": 1,
+    "Customer": "John",
+    "items": [{"sku": "a", "created": "2020-01-01T00:00:00"}],
+    "customer": {"id": 0, "name": "John", "tags": ["vip"]},
+}
+
+
+@pytest.fixture
+def mapper():
+    return DataClassMapper()
+
+
+def test_primitive_fields_are_set_eagerly(mapper):
+    order = mapper.from_dict_lazy(DATA, Order)
+    assert is_lazy(order)
+    assert order.__dict__["id"] == 1
+    assert order.__dict__["customer_name"] == "John"
+    assert "items" not in order.__dict__
+
+
+def test_field_decoded_on_access(mapper):
+    order = mapper.from_dict_lazy(DATA, Order)
+    items = order.items
+    assert items == [Item("a", datetime(2020, 1, 1))]
+    assert order.items is items
+    assert is_lazy(order)
+
+
+def test_class_restored_after_all_fields_accessed(mapper):
+    order = mapper.from_dict_lazy(DATA, Order)
+    assert isinstance(order, Order)
+    assert type(order) is not Order
+    order.items
+    order.customer
+    assert type(order) is Order
+    assert not is_lazy(order)
+
+
+def test_nested_dataclass_is_lazy(mapper):
+    order = mapper.from_dict_lazy(DATA, Order)
+    assert is_lazy(order.customer)
+    assert order.customer.name == "John"
+    assert order.customer.tags == ["vip"]
+    assert type(order.customer) is Customer
+
+
+def test_eq(mapper):
+    order = mapper.from_dict_lazy(DATA, Order)
+    assert order == mapper.from_dict(DATA, Order)
+    assert mapper.from_dict(DATA, Order) == mapper.from_dict_lazy(DATA, Order)
+    assert mapper.from_dict_lazy(DATA, Order) == mapper.from_dict_lazy(DATA, Order)
+    assert type(order) is Order
+
+
+def test_materialize(mapper):
+    order = mapper.from_dict_lazy(DATA, Order)
+    assert materialize(order) is order
+    assert type(order) is Order
+    assert type(order.customer) is Customer
+    assert order == mapper.from_dict(DATA, Order)
+
+
+def test_materialize_non_lazy():
+    order = Order(1, "John")
+    assert materialize(order) is order
+    assert materialize(1) == 1
+
+
+def test_frozen(mapper):
+    order = mapper.from_dict_lazy({"id": 1, "items": []}, FrozenOrder)
+    assert order.items == []
+    assert type(order) is FrozenOrder
+    with pytest.raises(FrozenInstanceError):
+        order.id = 2
+
+
+def test_slots_decoded_eagerly(mapper):
+    data = {"id": 1, "items": [{"sku": "a", "created": "2020-01-01T00:00:00"}]}
+    slotted = mapper.from_dict_lazy(data, Slotted)
+    assert type(slotted) is Slotted
+    assert slotted.items == [Item("a", datetime(2020, 1, 1))]
+
+
+@dataclass
+class Totaled:
+    id: int
+    items: List[Item] = field(default_factory=list)
+
+    def __post_init__(self):
+        if self.id < 0:
+            raise ValueError("negative id")
+        self.total = len(self.items)
+
+
+def test_post_init_decoded_eagerly(mapper):
+    data = {"id": 1, "items": [{"sku": "a", "created": "2020-01-01T00:00:00"}] * 2}
+    totaled = mapper.from_dict_lazy(data, Totaled)
+    assert type(totaled) is Totaled
+    assert totaled.total == 2
+    assert totaled == mapper.from_dict(data, Totaled)
+
+
+def test_post_init_error_raised(mapper):
+    with pytest.raises(ValueError):
+        mapper.from_dict_lazy({"id": -1}, Totaled)
+
+
+def test_missing_default_value(mapper):
+    with pytest.raises(MissingDefaultValueError):
+        mapper.from_dict_lazy({"id": 1}, Required)
+
+
+def test_wrong_type_raised_on_access(mapper):
+    order = mapper.from_dict_lazy({"id": 1, "Customer": "John", "items": 1}, Order)
+    with pytest.raises(WrongTypeError):
+        order.items
+
+
+def test_not_dataclass(mapper):
+    assert mapper.from_dict_lazy([1, 2], List[int]) == [1, 2]
+
+
+def test_from_json_lazy(mapper):
+    order = mapper.from_json_lazy('{"id": 1, "Customer": "John"}', Order)
+    assert order == Order(1, "John")
+
+
+def test_pickle(mapper):
+    order = mapper.from_dict_lazy(DATA, Order)
+    assert pickle.loads(pickle.dumps(order)) == mapper.from_dict(DATA, Order)
+
+
+def test_concurrent_access(mapper, monkeypatch):
+    # The nested access decodes and stores the field while the outer one is decoding it, like a second thread.
+    order = mapper.from_dict_lazy(DATA, Order)
+    decode_field = LazyDecoder.decode_field
+    inner = []
+
+    def decode_twice(self, field, data):
+        if not inner:
+            inner.append(None)
+            inner.append(order.items if field.name == "items" else materialize(order).customer)
+        return decode_field(self, field, data)
+
+    monkeypatch.setattr(LazyDecoder, "decode_field", decode_twice)
+    assert order.items is inner[1]
+    del inner[:]
+    assert order.customer is inner[1]
+    assert type(order) is Order
+    assert order == mapper.from_dict(DATA, Order)
+
+
+def test_threads(mapper):
+    orders = [mapper.from_dict_lazy(DATA, Order) for _ in range(200)]
+    barrier = threading.Barrier(4)
+    results = []
+
+    def read():
+        barrier.wait()
+        results.append([(order.items, order.customer.tags) for order in orders])
+
+    threads = [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 4 and all(type(order) is Order for order in orders)
+    assert all(result == results[0] for result in results)
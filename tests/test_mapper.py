@@ -1,7 +1,10 @@
+import copy
+import io
 import json
 import sys
+import threading
 from abc import ABCMeta, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime, time
 from decimal import Decimal
 from enum import Enum
@@ -9,8 +12,27 @@ from typing import Dict, List, Optional, Tuple, Union
 
 import pytest
 
-from jsondataclass.mapper import DataClassMapper, from_dict, from_json, to_dict, to_json
+from jsondataclass.backends import StdlibBackend
+from jsondataclass.config import Config
+from jsondataclass.exceptions import FrozenMapperError
+from jsondataclass.field import Discriminator, jsonfield
+from jsondataclass.mapper import (
+    DataClassMapper,
+    dump,
+    from_dict,
+    from_json,
+    get_default_mapper,
+    iter_json_array,
+    iter_jsonl,
+    jsondataclass,
+    set_default_mapper,
+    to_dict,
+    to_json,
+    to_json_bytes,
+    write_jsonl,
+)
 from jsondataclass.serializers import StringSerializer
+from jsondataclass.utils import set_forward_refs
 
 
 class BaseTestMapping(metaclass=ABCMeta):
@@ -46,6 +68,11 @@ class BaseTestMapping(metaclass=ABCMeta):
         data = json.loads(self.json_string)
         assert self._mapper.to_dict(self.dataclass_obj) == data
 
+    def test_dump(self):
+        fp = io.StringIO()
+        self._mapper.dump(self.dataclass_obj, fp)
+        assert fp.getvalue() == self.json_string
+
 
 class TestMappingDataClassWithInt(BaseTestMapping):
     @dataclass
@@ -527,6 +554,9 @@ class TestMappingWithDefultSerializer(BaseTestMapping):
     def test_to_dict(self):
         ...
 
+    def test_dump(self):
+        ...
+
 
 class TestMappingWithRegisterSerializer(BaseTestMapping):
     @dataclass
@@ -556,6 +586,9 @@ class TestMappingWithRegisterSerializer(BaseTestMapping):
     def test_to_dict(self):
         ...
 
+    def test_dump(self):
+        ...
+
 
 class TestMappingWithUnregisterSerializer(BaseTestMapping):
     @dataclass
@@ -585,6 +618,131 @@ class TestMappingWithUnregisterSerializer(BaseTestMapping):
     def test_to_dict(self):
         ...
 
+    def test_dump(self):
+        ...
+
+
+@dataclass
+class BatchData:
+    foo: int
+    bar: Optional[datetime] = None
+
+
+def test_from_dict_many():
+    mapper = DataClassMapper()
+    data = [{"foo": 1}, {"foo": 2, "bar": "2010-01-01T00:00:00"}]
+    assert mapper.from_dict_many(data, BatchData) == [BatchData(1), BatchData(2, datetime(2010, 1, 1))]
+    assert mapper.from_dict_many(iter(data), BatchData) == [BatchData(1), BatchData(2, datetime(2010, 1, 1))]
+    assert mapper.from_dict_many([], BatchData) == []
+
+
+def test_to_dict_many():
+    mapper = DataClassMapper()
+    data = [BatchData(1), BatchData(2, datetime(2010, 1, 1))]
+    assert mapper.to_dict_many(data) == [{"foo": 1, "bar": None}, {"foo": 2, "bar": "2010-01-01T00:00:00"}]
+    assert mapper.to_dict_many(iter(data)) == [{"foo": 1, "bar": None}, {"foo": 2, "bar": "2010-01-01T00:00:00"}]
+    assert mapper.to_dict_many([]) == []
+
+
+def test_to_dict_many_mixed_dataclasses():
+    @dataclass
+    class Other:
+        baz: str
+
+    mapper = DataClassMapper()
+    assert mapper.to_dict_many([BatchData(1), Other("a")]) == [{"foo": 1, "bar": None}, {"baz": "a"}]
+
+
+def test_from_json_many():
+    mapper = DataClassMapper()
+    data = ['{"foo": 1}', '{"foo": 2}']
+    assert mapper.from_json_many(data, BatchData) == [BatchData(1), BatchData(2)]
+
+
+def test_to_json_many():
+    mapper = DataClassMapper()
+    assert mapper.to_json_many([BatchData(1), BatchData(2)]) == ['{"foo": 1, "bar": null}', '{"foo": 2, "bar": null}']
+
+
+def test_from_dict_many_generic_type():
+    mapper = DataClassMapper()
+    assert mapper.from_dict_many([[1, 2], [3]], List[int]) == [[1, 2], [3]]
+
+
+def test_iter_jsonl():
+    mapper = DataClassMapper()
+    file = io.StringIO('{"foo": 1}\n\n{"foo": 2, "bar": "2010-01-01T00:00:00"}\n{"foo": 3}')
+    items = mapper.iter_jsonl(file, BatchData, chunk_size=2)
+    assert next(items) == BatchData(1)
+    assert list(items) == [BatchData(2, datetime(2010, 1, 1)), BatchData(3)]
+
+
+def test_write_jsonl():
+    mapper = DataClassMapper()
+    file = io.StringIO()
+    assert mapper.write_jsonl(file, (BatchData(i) for i in range(3)), chunk_size=2) == 3
+    assert file.getvalue() == '{"foo": 0, "bar": null}\n{"foo": 1, "bar": null}\n{"foo": 2, "bar": null}\n'
+
+
+def test_jsonl_path(tmp_path):
+    path = tmp_path / "data.jsonl"
+    data = [BatchData(1), BatchData(2, datetime(2010, 1, 1))]
+    assert write_jsonl(path, data) == 2
+    assert list(iter_jsonl(str(path), BatchData)) == data
+
+
+def test_iter_json_array():
+    mapper = DataClassMapper()
+    file = io.StringIO('[{"foo": 1}, {"foo": 2, "bar": "2010-01-01T00:00:00"}]')
+    items = mapper.iter_json_array(file, BatchData, chunk_size=4)
+    assert next(items) == BatchData(1)
+    assert list(items) == [BatchData(2, datetime(2010, 1, 1))]
+
+
+def test_iter_json_array_path(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text('[{"foo": 1.5}]')
+    assert list(iter_json_array(path, BatchData, parse_float=Decimal)) == [BatchData(Decimal("1.5"))]
+
+
+def test_from_json_bytes():
+    mapper = DataClassMapper()
+    assert mapper.from_json(b'{"foo": 1}', BatchData) == BatchData(1)
+    assert mapper.from_json(memoryview(b'{"foo": 1}'), BatchData) == BatchData(1)
+    assert mapper.from_json_many([b'{"foo": 1}', bytearray(b'{"foo": 2}')], BatchData) == [BatchData(1), BatchData(2)]
+
+
+def test_to_json_bytes():
+    mapper = DataClassMapper()
+    assert mapper.to_json_bytes(BatchData(1)) == b'{"foo": 1, "bar": null}'
+    assert to_json_bytes(BatchData(1), separators=(",", ":")) == b'{"foo":1,"bar":null}'
+
+
+@pytest.mark.parametrize(
+    "dumps_kwargs", [{}, {"separators": (",", ":")}, {"indent": 2}, {"sort_keys": True}, {"indent": 1, "default": str}]
+)
+def test_dump_options(dumps_kwargs):
+    fp = io.StringIO()
+    dump(BatchData(1, datetime(2020, 1, 1)), fp, **dumps_kwargs)
+    assert fp.getvalue() == to_json(BatchData(1, datetime(2020, 1, 1)), **dumps_kwargs)
+
+
+def test_mapper_backend():
+    assert isinstance(DataClassMapper().backend, StdlibBackend)
+    assert isinstance(DataClassMapper(backend="json").backend, StdlibBackend)
+    backend = StdlibBackend()
+    mapper = DataClassMapper()
+    mapper.backend = backend
+    assert mapper.backend is backend
+
+
+def test_mapper_orjson_backend():
+    pytest.importorskip("orjson")
+    mapper = DataClassMapper(backend="orjson")
+    assert mapper.from_json(b'{"foo": 1}', BatchData) == BatchData(1)
+    assert mapper.to_json(BatchData(1)) == '{"foo":1,"bar":null}'
+    assert mapper.to_json_bytes(BatchData(1)) == b'{"foo":1,"bar":null}'
+
 
 def test_set_datetime_format():
     format = "%Y-%m-%d %H:%M:%S%"
@@ -593,6 +751,18 @@ def test_set_datetime_format():
     assert mapper.datetime_format == mapper._config.datetime_format == format
 
 
+def test_set_datetime_format_after_mapping():
+    @dataclass
+    class Data:
+        foo: datetime
+
+    mapper = DataClassMapper()
+    data = Data(foo=datetime(2010, 1, 1, 0, 0, 0))
+    assert mapper.to_dict(data) == {"foo": "2010-01-01T00:00:00"}
+    mapper.datetime_format = "%m/%d/%y %H:%M:%S"
+    assert mapper.to_dict(data) == {"foo": "01/01/10 00:00:00"}
+
+
 def test_set_date_format():
     format = "%Y %m %d"
     mapper = DataClassMapper()
@@ -644,3 +814,288 @@ class TestMapping(BaseTestMapping):
     def test_to_dict(self):
         data = json.loads(self.json_string)
         assert to_dict(self.dataclass_obj) == data
+
+    def test_dump(self):
+        fp = io.StringIO()
+        dump(self.dataclass_obj, fp)
+        assert fp.getvalue() == self.json_string
+
+
+def test_default_mapper_is_shared():
+    assert get_default_mapper() is get_default_mapper()
+
+
+def test_set_default_mapper():
+    @dataclass
+    class Data:
+        foo: date
+
+    previous = get_default_mapper()
+    mapper = DataClassMapper()
+    mapper.date_format = "%m/%d/%y"
+    set_default_mapper(mapper)
+    try:
+        assert get_default_mapper() is mapper
+        assert to_dict(Data(foo=date(2010, 1, 1))) == {"foo": "01/01/10"}
+    finally:
+        set_default_mapper(previous)
+
+
+def test_reset_default_mapper():
+    previous = get_default_mapper()
+    set_default_mapper(None)
+    try:
+        assert isinstance(get_default_mapper(), DataClassMapper)
+        assert get_default_mapper() is not previous
+    finally:
+        set_default_mapper(previous)
+
+
+def test_from_json_loads_kwargs():
+    @dataclass
+    class Data:
+        foo: Decimal
+
+    assert from_json('{"foo": 1.1}', Data, parse_float=Decimal) == Data(foo=Decimal("1.1"))
+
+
+@dataclass
+class Circle:
+    radius: float
+    kind: str = "circle"
+
+
+@dataclass
+class Square:
+    side: float
+    kind: str = "square"
+
+
+@dataclass
+class Drawing:
+    shape: Union[Circle, Square] = jsonfield(discriminator=Discriminator("kind"))
+    shapes: List[Union[Circle, Square]] = field(default_factory=list)
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_discriminator(compiled):
+    config = Config(compiled=compiled, discriminators={Union[Circle, Square]: Discriminator("kind")})
+    mapper = DataClassMapper(config=config)
+    drawing = Drawing(Square(1.0), [Circle(2.0), Square(3.0)])
+    data = {
+        "shape": {"side": 1.0, "kind": "square"},
+        "shapes": [{"radius": 2.0, "kind": "circle"}, {"side": 3.0, "kind": "square"}],
+    }
+    assert mapper.from_dict(data, Drawing) == drawing
+    assert mapper.to_dict(drawing) == data
+    assert mapper.from_dict({"side": 1.0, "kind": "square"}, Union[Circle, Square]) == Square(1.0)
+    fp = io.StringIO()
+    mapper.dump(drawing, fp)
+    assert json.loads(fp.getvalue()) == data
+
+
+def test_discriminator_mapping_injects_tag():
+    @dataclass
+    class Data:
+        shape: Union[Circle, Square] = jsonfield(discriminator=Discriminator("type", {"c": Circle, "s": Square}))
+
+    data = {"shape": {"radius": 1.0, "kind": "circle", "type": "c"}}
+    assert to_dict(Data(Circle(1.0))) == data
+    assert from_dict(data, Data) == Data(Circle(1.0))
+    fp = io.StringIO()
+    dump(Data(Circle(1.0)), fp)
+    assert json.loads(fp.getvalue()) == data
+
+
+class Status(Enum):
+    NEW = "new"
+    DONE = "done"
+
+
+@dataclass
+class Node:
+    value: Status
+    children: List["Node"] = field(default_factory=list)
+    shape: Optional[Union[Circle, Square]] = jsonfield(default=None, discriminator=Discriminator("kind"))
+    created: Optional[Dict[str, datetime]] = None
+
+
+set_forward_refs(Node, {"Node": Node})
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_prepare(compiled):
+    mapper = DataClassMapper(config=Config(compiled=compiled))
+    mapper.prepare(Node)
+    factory = mapper._serializer_factory
+    assert {Node, Circle, Square, Status, datetime} <= set(factory._plans) | set(factory._type_serializers)
+    assert Node in factory._plans and Circle in factory._plans
+    assert (Node in factory._decoders) is compiled
+    assert factory.get_dataclass_plan(Node).fields[2].serializer._tables
+    data = {"value": "new", "children": [{"value": "done", "shape": {"radius": 1.0, "kind": "circle"}}]}
+    assert mapper.from_dict(data, Node) == Node(Status.NEW, [Node(Status.DONE, shape=Circle(1.0))])
+
+
+def test_prepare_freeze():
+    mapper = DataClassMapper()
+    mapper.prepare(Node, freeze=True)
+    assert mapper.frozen
+    with pytest.raises(FrozenMapperError):
+        mapper.register_serializer(Node, StringSerializer)
+    with pytest.raises(FrozenMapperError):
+        mapper.unregister_serializer(datetime)
+    with pytest.raises(FrozenMapperError):
+        mapper.datetime_format = "%Y"
+    assert mapper.datetime_format is None
+    assert mapper.from_dict({"value": "new"}, Node) == Node(Status.NEW)
+
+
+def test_freeze_during_config_change():
+    mapper = DataClassMapper()
+    errors = []
+
+    def set_format():
+        try:
+            mapper.datetime_format = "%Y"
+        except FrozenMapperError as e:
+            errors.append(e)
+
+    with mapper._serializer_factory._lock:
+        thread = threading.Thread(target=set_format)
+        thread.start()
+        thread.join(0.05)
+        mapper.prepare(freeze=True)
+    thread.join()
+    assert len(errors) == 1
+    assert mapper.datetime_format is None
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_config_changed_in_place(compiled):
+    @dataclass
+    class Event:
+        at: datetime
+
+    config = Config(compiled=compiled)
+    mapper = DataClassMapper(config=config)
+    event = Event(datetime(2020, 1, 2))
+    assert mapper.to_dict(event) == {"at": "2020-01-02T00:00:00"}
+    config.datetime_format = "%Y"
+    assert mapper.to_dict(event) == {"at": "2020"}
+    assert mapper.from_dict({"at": "2021"}, Event) == Event(datetime(2021, 1, 1))
+    assert mapper.cache_info().invalidations == {"config.datetime_format": 1}
+    assert copy.deepcopy(config) == config and not hasattr(copy.copy(config), "_factories")
+    mapper.prepare(freeze=True)
+    with pytest.raises(FrozenMapperError):
+        config.datetime_format = None
+    assert config.datetime_format == "%Y"
+
+
+def test_jsondataclass_decorator():
+    mapper = DataClassMapper()
+
+    @jsondataclass(mapper=mapper, frozen=True)
+    class Point:
+        x: int
+        y: int
+
+    @jsondataclass(mapper=mapper)
+    class Line:
+        start: Point
+        end: "LaterPoint"  # noqa: F821
+
+    assert Point in mapper._serializer_factory._plans
+    assert Line not in mapper._serializer_factory._plans
+    set_forward_refs(Line, {"LaterPoint": Point})
+    mapper.prepare()
+    assert Line in mapper._serializer_factory._plans
+    data = {"start": {"x": 1, "y": 2}, "end": {"x": 3, "y": 4}}
+    assert mapper.from_dict(data, Line) == Line(Point(1, 2), Point(3, 4))
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_cache_info(compiled):
+    mapper = DataClassMapper(config=Config(compiled=compiled))
+    data = {"value": "new", "children": [{"value": "done"}]}
+    mapper.from_dict(data, Node)
+    info = mapper.cache_info()
+    assert info.serializer_misses > 0 and info.plans_built == 1
+    assert info.decoders_compiled == (1 if compiled else 0)
+    mapper.from_dict(data, Node)
+    assert mapper.cache_info().serializer_hits > info.serializer_hits
+    assert mapper.cache_info().plans_built == 1
+    mapper.datetime_format = "%Y"
+    mapper.register_serializer(Status, StringSerializer)
+    mapper.unregister_serializer(Status)
+    mapper.from_dict(data, Node)
+    info = mapper.cache_info()
+    assert info.plans_built == 2
+    assert info.invalidations == {"config.datetime_format": 1, "register": 1, "unregister": 1}
+
+
+def test_explain():
+    mapper = DataClassMapper()
+    assert mapper.explain(List[Node]).splitlines() == [
+        "List[Node] -> ListSerializer",
+        "Node -> DataClassSerializer",
+        "  value ('value'): Status -> EnumSerializer",
+        "  children ('children'): List[Node] -> ListSerializer",
+        "  shape ('shape'): Union[Circle, Square, NoneType] -> UnionSerializer [discriminator 'kind']",
+        "  created ('created'): Optional[Dict[str, datetime]] -> OptionalSerializer",
+        "Circle -> DataClassSerializer",
+        "  radius ('radius'): float -> DefaultSerializer",
+        "  kind ('kind'): str -> StringSerializer",
+        "Square -> DataClassSerializer",
+        "  side ('side'): float -> DefaultSerializer",
+        "  kind ('kind'): str -> StringSerializer",
+    ]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="requires python3.8 or higher")
+def test_explain_literal_values():
+    from typing import Literal
+
+    @dataclass
+    class Tagged:
+        tag: Literal["a.b", 1.5]
+        sizes: Optional[Tuple[Status, ...]] = None
+
+    assert DataClassMapper().explain(Tagged).splitlines()[1:] == [
+        "  tag ('tag'): Literal['a.b', 1.5] -> LiteralSerializer",
+        "  sizes ('sizes'): Optional[Tuple[Status, ...]] -> OptionalSerializer",
+    ]
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_shared_mapper_threads(compiled):
+    mapper = DataClassMapper(config=Config(compiled=compiled))
+    expected = Node(Status.NEW, [Node(Status.DONE, [Node(Status.NEW)])])
+    data = DataClassMapper().to_dict(expected)
+    barrier = threading.Barrier(8)
+    results = []
+
+    def work():
+        barrier.wait()
+        for _ in range(20):
+            results.append(mapper.from_dict(data, Node) == expected and mapper.to_dict(expected) == data)
+            mapper.datetime_format = None
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 160 and all(results)
+
+
+def test_stale_entries_not_published():
+    mapper = DataClassMapper()
+    factory = mapper._serializer_factory
+    caches = factory._plans
+    generation = factory._generation
+    plan = factory._build_dataclass_plan(Circle)
+    mapper.datetime_format = "%Y"
+    assert factory._publish("_plans", Circle, plan, generation) is plan
+    assert Circle not in factory._plans
+    assert factory.get_dataclass_plan(Circle) is factory.get_dataclass_plan(Circle) is not plan
+    assert caches == {}
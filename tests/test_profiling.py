@@ -0,0 +1,102 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+import pytest
+
+from jsondataclass.config import Config
+from jsondataclass.mapper import DataClassMapper
+from jsondataclass.profiling import Profiler
+from jsondataclass.serializers import Serializer
+
+
+class Money:
+    def __init__(self, cents: int):
+        self.cents = cents
+
+    def __eq__(self, other):
+        return isinstance(other, Money) and other.cents == self.cents
+
+
+class MoneySerializer(Serializer[Money]):
+    def serialize(self, data: Money) -> int:
+        return data.cents
+
+    def deserialize(self, data: int, type_) -> Money:
+        return Money(data)
+
+
+@dataclass
+class Line:
+    sku: str
+    price: Money
+
+
+@dataclass
+class Order:
+    id: int
+    lines: List[Line]
+    parent: Optional[int] = None
+
+
+DATA = {"id": 1, "lines": [{"sku": "a", "price": 1}, {"sku": "b", "price": 2}], "parent": None}
+
+
+def make_mapper(compiled: bool) -> DataClassMapper:
+    mapper = DataClassMapper(config=Config(compiled=compiled))
+    mapper.register_serializer(Money, MoneySerializer)
+    return mapper
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_profiling(compiled):
+    mapper = make_mapper(compiled)
+    profiler = mapper.enable_profiling()
+    assert mapper.profiler is profiler
+    order = mapper.from_dict(DATA, Order)
+    assert order == Order(1, [Line("a", Money(1)), Line("b", Money(2))])
+    assert mapper.to_dict(order) == DATA
+
+    stats = profiler.to_dict()
+    assert stats["field"]["Line.price"]["calls"] == 4
+    assert stats["field"]["Order.lines"]["calls"] == 2
+    assert stats["field"]["Order.id"]["calls"] == 2
+    assert stats["serializer"]["MoneySerializer"]["calls"] == 4
+    for kind in stats.values():
+        for entry in kind.values():
+            assert 0 <= entry["self_time"] <= entry["total_time"] + 1e-9
+
+    entries = profiler.report(sort_by="calls", kind="field")
+    assert all(entry.kind == "field" for entry in entries)
+    assert [entry.calls for entry in entries] == sorted((entry.calls for entry in entries), reverse=True)
+    assert next(entry for entry in entries if entry.name == "Line.price").target == (Line, "price")
+    assert "Line.price" in profiler.format(limit=100)
+
+    profiler.reset()
+    assert profiler.report() == []
+
+
+def test_disable_profiling():
+    mapper = make_mapper(False)
+    profiler = mapper.enable_profiling()
+    mapper.from_dict(DATA, Order)
+    assert mapper.disable_profiling() is profiler
+    assert mapper.profiler is None
+    profiler.reset()
+    assert mapper.from_dict(DATA, Order).lines[1].price == Money(2)
+    assert profiler.report() == []
+    plan = mapper._serializer_factory.get_dataclass_plan(Line)
+    assert "deserialize" not in vars(plan.fields[1].serializer)
+
+
+def test_times():
+    ticks = iter(range(1000))
+    profiler = Profiler(timer=lambda: next(ticks))
+    serializer = profiler.instrument(MoneySerializer())
+    field_serializer = profiler.instrument_field(serializer, Line, "price")
+    assert field_serializer.deserialize(1, Money) == Money(1)
+    assert serializer.deserialize_many([1, 2], Money) == [Money(1), Money(2)]
+    stats = profiler.to_dict()
+    assert stats["field"]["Line.price"] == {"calls": 1, "total_time": 1, "self_time": 1}
+    # deserialize_many calls deserialize twice, recursion is counted once in the total time.
+    assert stats["serializer"]["MoneySerializer"]["calls"] == 4
+    assert stats["serializer"]["MoneySerializer"]["total_time"] == 6
@@ -0,0 +1,137 @@
+import pickle
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from jsondataclass import NOT_LOADED
+from jsondataclass.exceptions import WrongTypeError
+from jsondataclass.field import jsonfield
+from jsondataclass.mapper import DataClassMapper
+from jsondataclass.projection import normalize_projection
+from jsondataclass.utils import set_forward_refs
+
+
+@dataclass
+class Customer:
+    id: int
+    name: str
+    created: datetime
+
+
+@dataclass
+class Item:
+    sku: str
+    created: datetime
+    quantity: int = 1
+
+
+@dataclass
+class Order:
+    id: int
+    customer: Customer
+    items: List[Item] = field(default_factory=list)
+    note: Optional[str] = None
+    title: str = jsonfield("Title", default="")
+    parent: Optional["Order"] = None
+
+
+set_forward_refs(Order, {"Order": Order})
+
+DATA = {
+    "id": 1,
+    "customer": {"id": 2, "name": "John", "created": "2020-01-01T00:00:00"},
+    "items": [{"sku": "a", "created": "2020-01-01T00:00:00", "quantity": 2}, {"sku": "b", "created": "bad"}],
+    "note": "note",
+    "Title": "title",
+}
+
+
+@pytest.fixture
+def mapper():
+    return DataClassMapper()
+
+
+def test_normalize_projection():
+    expected = frozenset(
+        [("id", None), ("customer", frozenset([("id", None)])), ("items", frozenset([("sku", None)]))]
+    )
+    assert normalize_projection({"id", "customer.id", "items[*].sku"}) == expected
+    assert normalize_projection({"id": True, "customer": {"id": True}, "items": ["sku"]}) == expected
+    assert normalize_projection(["customer", "customer.id"]) == frozenset([("customer", None)])
+    assert normalize_projection(["customer.id", "customer"]) == frozenset([("customer", None)])
+
+
+@pytest.mark.parametrize("path", ["", "a..b", "items[0].sku", "a-b"])
+def test_invalid_path(path):
+    with pytest.raises(ValueError):
+        normalize_projection([path])
+
+
+def test_projection(mapper):
+    order = mapper.from_dict(DATA, Order, projection={"id", "customer.id", "items[*].sku"})
+    assert order.id == 1
+    assert order.customer.id == 2
+    assert order.customer.name is NOT_LOADED
+    assert order.customer.created is NOT_LOADED
+    assert [item.sku for item in order.items] == ["a", "b"]
+    assert [item.created for item in order.items] == [NOT_LOADED, NOT_LOADED]
+    assert [item.quantity for item in order.items] == [1, 1]
+    assert order.note is None
+    assert order.title == ""
+
+
+def test_whole_field(mapper):
+    order = mapper.from_dict(DATA, Order, projection={"customer": True, "title": None})
+    assert order.customer == Customer(2, "John", datetime(2020, 1, 1))
+    assert order.title == "title"
+    assert order.id is NOT_LOADED
+    assert order.items == []
+
+
+def test_recursive(mapper):
+    data = {"id": 1, "customer": DATA["customer"], "parent": {"id": 0, "customer": DATA["customer"]}}
+    order = mapper.from_dict(data, Order, projection={"parent": {"id": True, "parent.id": True}})
+    assert order.parent.id == 0
+    assert order.parent.customer is NOT_LOADED
+    assert order.parent.parent is None
+
+
+def test_collection(mapper):
+    orders = mapper.from_dict([DATA, DATA], List[Order], projection="id")
+    assert [order.id for order in orders] == [1, 1]
+    orders = mapper.from_dict({"1": DATA}, Dict[int, Order], projection="id")
+    assert orders[1].id == 1
+    orders = mapper.from_dict([DATA], Tuple[Order, ...], projection="id")
+    assert orders[0].id == 1
+
+
+def test_from_json(mapper):
+    order = mapper.from_json('{"id": 1, "customer": {"id": 2}}', Order, projection=["customer.id"])
+    assert order.customer.id == 2
+    assert order.id is NOT_LOADED
+
+
+def test_cached(mapper):
+    factory = mapper._serializer_factory
+    assert factory.get_projection_decoder(Order, frozenset(["id"])) is factory.get_projection_decoder(
+        Order, frozenset(["id"])
+    )
+    assert factory.get_projection_decoder(Order, {"id"}) is factory.get_projection_decoder(Order, ["id"])
+
+
+def test_unknown_field(mapper):
+    with pytest.raises(ValueError):
+        mapper.from_dict(DATA, Order, projection="name")
+    with pytest.raises(ValueError):
+        mapper.from_dict(DATA, Order, projection="id.value")
+
+
+def test_wrong_type(mapper):
+    with pytest.raises(WrongTypeError):
+        mapper.from_dict({"id": 1, "items": {}}, Order, projection="items.sku")
+
+
+def test_not_loaded_pickle():
+    assert pickle.loads(pickle.dumps(NOT_LOADED)) is NOT_LOADED
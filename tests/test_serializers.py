@@ -7,8 +7,14 @@ from typing import Dict, List, Optional, Tuple, Union
 
 import pytest
 
-from jsondataclass.exceptions import MissingDefaultValueError, UnionTypeMatchError, WrongTypeError
-from jsondataclass.field import jsonfield
+from jsondataclass.exceptions import (
+    DiscriminatorMatchError,
+    MissingDefaultValueError,
+    UnionTypeMatchError,
+    WrongTypeError,
+)
+from jsondataclass.field import Discriminator, jsonfield
+from jsondataclass.mapper import DataClassMapper
 from jsondataclass.serializers import (
     DataClassSerializer,
     DateSerializer,
@@ -141,6 +147,121 @@ def test_serializer_factory_get_literal_serializer():
     assert isinstance(factory.get_serializer(Literal[True]), LiteralSerializer)
 
 
+def test_serializer_factory_get_serializer_class_most_specific_base():
+    class Base:
+        ...
+
+    class Derived(Base):
+        ...
+
+    class Leaf(Derived):
+        ...
+
+    class BaseSerializer(DefaultSerializer):
+        ...
+
+    class DerivedSerializer(DefaultSerializer):
+        ...
+
+    for registrations in [(Base, Derived), (Derived, Base)]:
+        factory = SerializerFactory()
+        for type_ in registrations:
+            factory.register(type_, BaseSerializer if type_ is Base else DerivedSerializer)
+        assert factory.get_serializer_class(Leaf) is DerivedSerializer
+        assert factory.get_serializer_class(Derived) is DerivedSerializer
+        assert factory.get_serializer_class(Base) is BaseSerializer
+
+
+def test_serializer_factory_get_serializer_class_registered_base_dataclass():
+    class Base:
+        ...
+
+    @dataclass
+    class Data(Base):
+        foo: int
+
+    factory = SerializerFactory()
+    assert factory.get_serializer_class(Data) is DataClassSerializer
+    factory.register(Base, StringSerializer)
+    assert factory.get_serializer_class(Data) is StringSerializer
+
+
+def test_serializer_factory_get_serializer_class_virtual_base():
+    from collections.abc import Sized
+
+    class Foo:
+        def __len__(self):
+            return 0
+
+    factory = SerializerFactory()
+    assert factory.get_serializer_class(Foo) is DefaultSerializer
+    factory.register(Sized, StringSerializer)
+    assert factory.get_serializer_class(Foo) is StringSerializer
+
+
+def test_serializer_factory_get_serializer_cached():
+    factory = SerializerFactory()
+    assert factory.get_serializer(int) is factory.get_serializer(int)
+    assert factory.get_serializer(List[int]) is factory.get_serializer(List[str])
+    assert factory.get_serializer(str) is not factory.get_serializer(int)
+
+
+def test_serializer_factory_get_serializer_cache_invalidation():
+    factory = SerializerFactory()
+    serializer = factory.get_serializer(int)
+    factory.register(int, StringSerializer)
+    assert isinstance(factory.get_serializer(int), StringSerializer)
+    factory.unregister(int)
+    assert isinstance(factory.get_serializer(int), DefaultSerializer)
+    assert factory.get_serializer(int) is not serializer
+
+
+def test_serializer_factory_get_field_serializer_cached():
+    @dataclass
+    class Data:
+        foo: datetime = jsonfield(serializer_args=("%Y",))
+        bar: datetime = jsonfield(serializer_args=("%Y",))
+        baz: datetime = jsonfield(serializer_kwargs={"format": "%m"})
+        qux: datetime.timestamp = jsonfield(serializer_kwargs={"timezone": timezone.utc})
+
+    factory = SerializerFactory()
+    foo, bar, baz, qux = factory.get_dataclass_plan(Data).fields
+    assert foo.serializer is bar.serializer
+    assert foo.serializer is not baz.serializer
+    assert foo.serializer is not factory.get_serializer(datetime)
+    assert isinstance(qux.serializer, TimestampSerializer)
+
+
+def test_serializer_factory_get_dataclass_plan():
+    @dataclass
+    class Data:
+        foo: int = jsonfield("foo_foo")
+        bar: Optional[str] = None
+
+    factory = SerializerFactory()
+    plan = factory.get_dataclass_plan(Data)
+    assert plan is factory.get_dataclass_plan(Data)
+    assert [field.name for field in plan.fields] == ["foo", "bar"]
+    assert [field.serialized_name for field in plan.fields] == ["foo_foo", "bar"]
+    assert [field.optional for field in plan.fields] == [False, True]
+    assert isinstance(plan.fields[0].serializer, DefaultSerializer)
+    assert isinstance(plan.fields[1].serializer, OptionalSerializer)
+
+
+def test_serializer_factory_dataclass_plan_invalidation():
+    @dataclass
+    class Data:
+        foo: int
+
+    factory = SerializerFactory()
+    plan = factory.get_dataclass_plan(Data)
+    factory.register(int, StringSerializer)
+    assert factory.get_dataclass_plan(Data) is not plan
+    assert isinstance(factory.get_dataclass_plan(Data).fields[0].serializer, StringSerializer)
+    factory.unregister(int)
+    assert isinstance(factory.get_dataclass_plan(Data).fields[0].serializer, DefaultSerializer)
+
+
 def test_string_serializer():
     data = "foo"
     serializer = StringSerializer()
@@ -320,6 +441,88 @@ def test_dataclass_serializer_field_serializer():
     assert serializer.serialize(data) == data_dict
 
 
+def test_dataclass_serializer_many():
+    @dataclass
+    class Data:
+        foo: int
+        bar: str
+
+    data_dicts = [{"foo": 1, "bar": "2"}, {"foo": 3, "bar": "4"}]
+    data = [Data(foo=1, bar="2"), Data(foo=3, bar="4")]
+    serializer = DataClassSerializer()
+    assert serializer.deserialize_many(data_dicts, Data) == data
+    assert serializer.serialize_many(data) == data_dicts
+
+
+def test_serializer_many():
+    serializer = DateSerializer()
+    assert serializer.deserialize_many(["2000-01-01"], date) == [date(2000, 1, 1)]
+    assert serializer.serialize_many([date(2000, 1, 1)]) == ["2000-01-01"]
+
+
+def test_primitive_serializers_many():
+    data = [1, 2, 3]
+    assert DefaultSerializer().deserialize_many(data, int) == data
+    assert DefaultSerializer().deserialize_many(data, int) is not data
+    assert DefaultSerializer().serialize_many(iter(data)) == data
+    assert StringSerializer().deserialize_many(data, str) == ["1", "2", "3"]
+    assert StringSerializer().serialize_many(data) == ["1", "2", "3"]
+
+
+def test_primitive_serializer_subclasses_many():
+    class Upper(StringSerializer):
+        def serialize(self, data):
+            return str(data).upper()
+
+        def deserialize(self, data, type_):
+            return str(data).upper()
+
+    class Doubled(DefaultSerializer):
+        def serialize(self, data):
+            return data * 2
+
+        def deserialize(self, data, type_):
+            return data * 2
+
+    @dataclass
+    class Data:
+        names: List[str]
+        counts: List[int]
+
+    mapper = DataClassMapper()
+    mapper.register_serializer(str, Upper)
+    mapper.register_serializer(int, Doubled)
+    assert mapper.to_dict(Data(["a", "b"], [1, 2])) == {"names": ["A", "B"], "counts": [2, 4]}
+    assert mapper.from_dict({"names": ["a", "b"], "counts": [1, 2]}, Data) == Data(["A", "B"], [2, 4])
+
+
+def test_collection_serializers_homogeneous_items():
+    factory = SerializerFactory()
+    get_serializer = factory.get_serializer
+    calls = []
+
+    def counting_get_serializer(type_):
+        calls.append(type_)
+        return get_serializer(type_)
+
+    factory.get_serializer = counting_get_serializer  # type: ignore
+    assert ListSerializer(factory).serialize([date(2000, 1, 1)] * 3) == ["2000-01-01"] * 3
+    assert calls == [date]
+    calls.clear()
+    assert DictSerializer(factory).serialize({1: 1, 2: 2}) == {"1": 1, "2": 2}
+    assert calls == [int]
+    calls.clear()
+    assert ListSerializer(factory).serialize([1, 2, "a", "b", 3]) == [1, 2, "a", "b", 3]
+    assert calls == [int, str, int]
+
+
+def test_dict_serializer_generic_keys():
+    serializer = DictSerializer()
+    assert serializer.deserialize({"1": "2000-01-01"}, Dict[int, date]) == {1: date(2000, 1, 1)}
+    assert serializer.deserialize({1: 1}, Dict[str, int]) == {"1": 1}
+    assert serializer.serialize({}) == {}
+
+
 def test_optional_serializer():
     data = 1
     serializer = OptionalSerializer()
@@ -343,6 +546,116 @@ def test_union_serializer_type_missmatch():
         serializer.deserialize(data, Union[dict, list]) == data
 
 
+def test_union_serializer_generic_members():
+    serializer = UnionSerializer()
+    assert serializer.deserialize({"a": 1}, Union[List[int], Dict[str, int]]) == {"a": 1}
+    assert serializer.deserialize([1, 2], Union[Tuple[int], Tuple[int, int]]) == (1, 2)
+
+
+def test_union_serializer_prematching(monkeypatch):
+    @dataclass
+    class A:
+        a: int
+
+    @dataclass
+    class B:
+        b: int
+
+    class Color(Enum):
+        RED = "red"
+
+    def fail(*args):
+        raise AssertionError("trial deserialization")
+
+    monkeypatch.setattr(MissingDefaultValueError, "__init__", fail)
+    monkeypatch.setattr(WrongTypeError, "__init__", fail)
+    serializer = UnionSerializer()
+    assert serializer.deserialize({"b": 1}, Union[A, B]) == B(1)
+    assert serializer.deserialize({"b": 1}, Union[A, List[int], B]) == B(1)
+    assert serializer.deserialize("red", Union[date, Color]) == Color.RED
+    assert serializer.deserialize("2000-01-01", Union[Color, date]) == date(2000, 1, 1)
+    assert serializer.deserialize(1, Union[A, Decimal]) == Decimal(1)
+    with pytest.raises(UnionTypeMatchError):
+        serializer.deserialize({"c": 1}, Union[A, B])
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="requires python3.8 or higher")
+def test_union_serializer_literal_members():
+    from typing import Literal
+
+    serializer = UnionSerializer()
+    assert serializer.deserialize("b", Union[Literal["a"], Literal["b"]]) == "b"
+    with pytest.raises(UnionTypeMatchError):
+        serializer.deserialize("c", Union[Literal["a"], Literal["b"]])
+
+
+def test_union_serializer_member_order():
+    @dataclass
+    class A:
+        x: int
+
+    @dataclass
+    class B:
+        x: int
+
+    mapper = DataClassMapper()
+    assert mapper.from_dict({"x": 1}, Union[A, B]) == A(1)
+    assert mapper.from_dict({"x": 1}, Union[B, A]) == B(1)
+    assert mapper.validate({"x": 1}, Union[A, B]) == []
+    serializer = mapper._serializer_factory.get_serializer(Union[B, A])
+    assert [candidate[0] for candidate in serializer.get_candidates(Union[B, A])] == [B, A]
+    serializer = UnionSerializer(mapper._serializer_factory, discriminator=Discriminator("x", {1: A}))
+    assert serializer.deserialize({"x": 1}, Union[B, A]) == A(1)
+
+
+@dataclass
+class Cat:
+    lives: int
+    kind: str = "cat"
+
+
+@dataclass
+class Dog:
+    name: str
+    kind: str = "dog"
+
+
+@dataclass
+class Bird:
+    name: str
+
+
+def test_union_serializer_discriminator():
+    serializer = UnionSerializer(discriminator=Discriminator("kind"))
+    assert serializer.deserialize({"kind": "dog", "name": "Rex"}, Union[Cat, Dog]) == Dog("Rex")
+    assert serializer.deserialize({"kind": "cat", "lives": 9}, Union[Cat, Dog]) == Cat(9)
+    assert serializer.deserialize(None, Union[Cat, Dog, None]) is None
+    assert serializer.serialize(Dog("Rex")) == {"kind": "dog", "name": "Rex"}
+
+
+def test_union_serializer_discriminator_mapping():
+    serializer = UnionSerializer(discriminator=Discriminator("type", {"cat": Cat, "bird": Bird}))
+    assert serializer.deserialize({"type": "bird", "name": "Kesha"}, Union[Cat, Bird]) == Bird("Kesha")
+    assert serializer.serialize(Bird("Kesha")) == {"name": "Kesha", "type": "bird"}
+    assert serializer.serialize(Cat(9)) == {"lives": 9, "kind": "cat", "type": "cat"}
+
+
+@pytest.mark.parametrize("data", [{"kind": "fish"}, {"name": "Rex"}, None, [], "dog"])
+def test_union_serializer_discriminator_mismatch(data):
+    serializer = UnionSerializer(discriminator=Discriminator("kind"))
+    with pytest.raises(DiscriminatorMatchError):
+        serializer.deserialize(data, Union[Cat, Dog])
+
+
+def test_union_serializer_discriminator_missing_tag():
+    serializer = UnionSerializer(discriminator=Discriminator("kind"))
+    with pytest.raises(TypeError):
+        serializer.deserialize({"kind": "cat"}, Union[Cat, Bird])
+    serializer = UnionSerializer(discriminator=Discriminator("kind", {"dog": Dog}))
+    with pytest.raises(TypeError):
+        serializer.deserialize({"kind": "dog"}, Union[Cat, Bird])
+
+
 def test_datetime_serializer_naive_datetime():
     data = "2000-01-01T12:00:00"
     date = datetime(2000, 1, 1, 12, 0, 0)
@@ -426,6 +739,30 @@ def test_enum_serializer():
     assert serializer.serialize(Foo.A) == data
 
 
+def test_enum_serializer_lookup():
+    class Foo(Enum):
+        A = "a"
+        B = "b"
+        C = "a"
+        D = [1]
+
+        @classmethod
+        def _missing_(cls, value):
+            if value == "bb":
+                return cls.B
+            return None
+
+    serializer = EnumSerializer()
+    assert serializer.deserialize("a", Foo) is Foo.A
+    assert serializer.deserialize("a", Foo) is Foo.C
+    assert serializer.deserialize("bb", Foo) is Foo.B
+    assert serializer.deserialize([1], Foo) is Foo.D
+    with pytest.raises(ValueError):
+        serializer.deserialize("c", Foo)
+    with pytest.raises(ValueError):
+        serializer.deserialize({}, Foo)
+
+
 def test_decimal_serializer():
     data = "100.55"
     dec = Decimal("100.55")
@@ -456,3 +793,17 @@ def test_literal_serializer_fail():
     seializer = LiteralSerializer()
     with pytest.raises(LiteralTypeMatchError):
         seializer.deserialize(5, Literal[1, 2, 3])
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="requires python3.8 or higher")
+def test_literal_serializer_unhashable():
+    from typing import Literal
+
+    from jsondataclass.serializers import LiteralSerializer
+    from jsondataclass.exceptions import LiteralTypeMatchError
+
+    seializer = LiteralSerializer()
+    assert seializer.deserialize([1, 2], Literal["a", [1, 2]]) == [1, 2]
+    assert seializer.deserialize("a", Literal["a", [1, 2]]) == "a"
+    with pytest.raises(LiteralTypeMatchError):
+        seializer.deserialize({}, Literal["a", [1, 2]])
@@ -0,0 +1,70 @@
+import io
+import json
+from decimal import Decimal
+
+import pytest
+
+from jsondataclass.stream import iter_array_items
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1024])
+def test_iter_array_items(chunk_size):
+    items = [1, 123456, -1.5e10, "a,]b", True, False, None, {"a": [1, {"b": "]"}]}, [], {}, "é中"]
+    text = json.dumps(items, ensure_ascii=False)
+    assert list(iter_array_items(io.StringIO(text), chunk_size)) == items
+    assert list(iter_array_items(io.BytesIO(text.encode("utf-8")), chunk_size)) == items
+
+
+@pytest.mark.parametrize("text", ["[]", " [ ] ", "\n[\n]\n"])
+def test_iter_array_items_empty(text):
+    assert list(iter_array_items(io.StringIO(text), 1)) == []
+
+
+def test_iter_array_items_whitespace():
+    assert list(iter_array_items(io.StringIO(' [ 1 ,\n 2 ,\t"3" ] '), 2)) == [1, 2, "3"]
+
+
+def test_iter_array_items_is_lazy():
+    file = io.StringIO("[1, 2, " + "3, " * 10000 + "4]")
+    items = iter_array_items(file, 16)
+    assert next(items) == 1
+    assert file.tell() < 100
+
+
+def test_iter_array_items_decoder():
+    decoder = json.JSONDecoder(parse_float=Decimal)
+    assert list(iter_array_items(io.StringIO("[1.5]"), decoder=decoder)) == [Decimal("1.5")]
+
+
+@pytest.mark.parametrize("text", ["", "{}", "[1 2]", "[1,", "[1, tru]"])
+def test_iter_array_items_invalid(text):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_array_items(io.StringIO(text), 2))
+
+
+@pytest.mark.parametrize("element", ['{"a" 1}', "[1 2]", "tru", '"\\x"', "-Infinit"])
+def test_iter_array_items_invalid_is_lazy(element):
+    file = io.StringIO("[1, " + element + ", " + "3, " * 10000 + "4]")
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_array_items(file, 16))
+    assert file.tell() < 100
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 16])
+def test_iter_array_items_long_tokens(chunk_size):
+    items = ["\U0001f600" * 3, "x" * 100, float("-inf"), [True, False, None]]
+    text = json.dumps(items)
+    assert list(iter_array_items(io.StringIO(text), chunk_size)) == items
+
+
+@pytest.mark.parametrize("chunk_size", [2, 3, 5, 999, 1000, 4096, 65536])
+def test_iter_array_items_split_numbers(chunk_size):
+    items = [n * x for n in range(500) for x in (-1.25e-3, 0.5, -7, 1e300, 12345678901234567890)]
+    text = json.dumps(items)
+    assert list(iter_array_items(io.StringIO(text), chunk_size)) == items
+    assert list(iter_array_items(io.BytesIO(text.encode()), chunk_size)) == items
+
+
+def test_iter_array_items_split_fraction():
+    assert list(iter_array_items(io.StringIO("[-0.0015]"), 2)) == [-0.0015]
+    assert list(iter_array_items(io.StringIO("[1e-5, 2E+3, true]"), 2)) == [1e-5, 2e3, True]
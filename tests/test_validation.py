@@ -0,0 +1,138 @@
+import sys
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple, Union
+
+import pytest
+
+from jsondataclass.exceptions import (
+    DiscriminatorMatchError,
+    MissingDefaultValueError,
+    TupleTypeMatchError,
+    UnionTypeMatchError,
+    ValidationError,
+    WrongTypeError,
+)
+from jsondataclass.field import Discriminator, jsonfield
+from jsondataclass.mapper import DataClassMapper
+
+
+@dataclass
+class A:
+    a: int
+    kind: str = "a"
+
+
+@dataclass
+class B:
+    b: date
+    kind: str = "b"
+
+
+@dataclass
+class Item:
+    sku: str
+    price: Decimal
+
+
+@dataclass
+class Order:
+    id: int
+    created: datetime
+    items: List[Item] = field(default_factory=list)
+    pair: Optional[Tuple[int, date]] = None
+    counts: Dict[int, float] = field(default_factory=dict)
+    shape: Union[A, B, None] = jsonfield(default=None, discriminator=Discriminator("kind"))
+    either: Union[A, B, None] = None
+    parent: Optional[Item] = None
+    name: str = jsonfield("Name", default="n")
+
+
+BASE = {"id": 1, "created": "2020-01-01T00:00:00"}
+
+VALID = {
+    "id": 1,
+    "created": "2020-01-01T00:00:00",
+    "items": [{"sku": "a", "price": "1.5"}],
+    "pair": [1, "2020-01-02"],
+    "counts": {"1": 2.0},
+    "shape": {"kind": "b", "b": "2020-01-01"},
+    "either": {"a": 1},
+    "parent": {"sku": "b", "price": 2},
+    "Name": "x",
+}
+
+
+@pytest.fixture
+def mapper():
+    return DataClassMapper()
+
+
+def test_valid(mapper):
+    assert mapper.validate(VALID, Order) == []
+    assert mapper.validate(BASE, Order) == []
+
+
+@pytest.mark.parametrize(
+    "data, path, error_type",
+    [
+        ({"created": "2020-01-01T00:00:00"}, "$.id", MissingDefaultValueError),
+        ({"id": 1, "created": "yesterday"}, "$.created", ValueError),
+        (dict(BASE, items={}), "$.items", WrongTypeError),
+        (dict(BASE, items=[1]), "$.items[0]", WrongTypeError),
+        (dict(BASE, items=[{"sku": "a", "price": "x"}]), "$.items[0].price", Exception),
+        (dict(BASE, items=[{"price": 1}]), "$.items[0].sku", MissingDefaultValueError),
+        (dict(BASE, pair=[1]), "$.pair", TupleTypeMatchError),
+        (dict(BASE, pair=[1, "x"]), "$.pair[1]", ValueError),
+        (dict(BASE, counts={"a": 1.0}), "$.counts.a", ValueError),
+        (dict(BASE, shape={"kind": "c"}), "$.shape", DiscriminatorMatchError),
+        (dict(BASE, shape={"kind": "b", "b": "x"}), "$.shape.b", ValueError),
+        (dict(BASE, either={"b": "x"}), "$.either", UnionTypeMatchError),
+        (dict(BASE, parent={"sku": "a"}), "$.parent.price", MissingDefaultValueError),
+    ],
+)
+def test_error_path(mapper, data, path, error_type):
+    errors = mapper.validate(data, Order)
+    assert len(errors) == 1
+    assert isinstance(errors[0], ValidationError)
+    assert errors[0].path == path
+    assert isinstance(errors[0].error, error_type)
+    with pytest.raises(Exception):
+        mapper.from_dict(data, Order)
+
+
+def test_all_errors(mapper):
+    data = {"created": "x", "items": [{"sku": "a", "price": "x"}, 1], "counts": {"a b": 1.0}}
+    assert len(mapper.validate(data, Order)) == 1
+    errors = mapper.validate(data, Order, all_errors=True)
+    paths = ["$.id", "$.created", "$.items[0].price", "$.items[1]", "$.counts['a b']"]
+    assert [error.path for error in errors] == paths
+    assert str(errors[1]) == "$.created: Invalid isoformat string: 'x'"
+
+
+def test_validate_collection(mapper):
+    assert mapper.validate([{"sku": "a", "price": 1}], List[Item]) == []
+    errors = mapper.validate([{"sku": "a", "price": 1}, {"sku": "b"}], List[Item])
+    assert [error.path for error in errors] == ["$[1].price"]
+
+
+def test_validator_reused(mapper):
+    factory = mapper._serializer_factory
+    mapper.validate(VALID, Order)
+    validator = factory.get_validator()
+    assert Order in validator._fields
+    mapper.validate(VALID, Order)
+    assert factory.get_validator() is validator
+    mapper.datetime_format = "%Y"
+    assert factory.get_validator() is not validator
+    assert [error.path for error in mapper.validate(BASE, Order)] == ["$.created"]
+
+
+if sys.version_info >= (3, 8):
+    from typing import Literal
+
+    def test_literal(mapper):
+        assert mapper.validate(["x", "y"], List[Literal["x", "y"]]) == []
+        errors = mapper.validate(["x", "z"], List[Literal["x", "y"]])
+        assert [error.path for error in errors] == ["$[1]"]